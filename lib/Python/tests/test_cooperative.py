@@ -0,0 +1,130 @@
+# Transmuter front-end, front-end libraries and utilities for the
+# Transmuter language processing infrastructure
+# Copyright (C) 2024  Natan Junges <natanajunges@gmail.com>
+# Copyright (C) 2024  The Transmuter Project
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+from dataclasses import dataclass
+import unittest
+
+from transmuter.front.common import TransmuterConditions, TransmuterCondition
+from transmuter.front.cooperative import (
+    TransmuterCooperativeParser,
+    TransmuterAsyncParser,
+)
+from transmuter.front.lexical import (
+    TransmuterLexingState,
+    TransmuterTerminalTag,
+    TransmuterLexer,
+)
+from transmuter.front.syntactic import (
+    TransmuterNonterminalType,
+    TransmuterSequence,
+    TransmuterIteration,
+    TransmuterExpression,
+    TransmuterParsingState,
+    TransmuterParser,
+    TransmuterParserPool,
+)
+
+# Test grammar, written as the front-end generator would emit it:
+#
+#   Letters(start): Letter {/Letter} ;
+
+
+class _Conditions(TransmuterConditions):
+    test = TransmuterCondition()
+
+
+class _Letter(TransmuterTerminalTag):
+    @staticmethod
+    def nfa(
+        current_states: TransmuterLexingState, char: str
+    ) -> tuple[bool, TransmuterLexingState]:
+        state_accept = False
+        next_states = 0
+
+        # S0
+        if 1 & current_states and (char == "a"):
+            state_accept = True
+
+        return (state_accept, next_states)
+
+
+class _Lexer(TransmuterLexer):
+    TERMINAL_TAGS = [_Letter]
+
+
+class _Letters(TransmuterNonterminalType):
+    @staticmethod
+    def start(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence(
+            (_Letter, TransmuterIteration(_Letter, True))
+        )
+
+    @classmethod
+    def descend(
+        cls, parser: TransmuterParser, current_state: TransmuterParsingState
+    ) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+        next_states0 = parser.call(_Letter, next_states0)
+
+        while True:  # begin iteration
+            next_states1 = next_states0
+            next_states1 = parser.call(_Letter, next_states1)
+
+            if len(next_states1) == 0:
+                break
+
+            next_states0 = next_states1  # end iteration
+
+        return next_states0
+
+
+class _Parser(TransmuterParser):
+    NONTERMINAL_TYPES = [_Letters]
+
+
+# Calls back on every step
+@dataclass
+class _CooperativeParser(TransmuterCooperativeParser, _Parser):
+    slice_steps: int = 1
+    slice_time: float = 0
+
+
+class TestAsyncParser(unittest.TestCase):
+    def test_pool_reused_after_loop_closed(self) -> None:
+        pool = TransmuterParserPool(
+            _Lexer, _CooperativeParser, _Conditions.test
+        )
+        async_parser = TransmuterAsyncParser(pool)
+
+        try:
+            bsr = asyncio.run(async_parser.parse("async", "a" * 60))
+            self.assertEqual(bsr.start, (_Letters, 0, 60))
+        finally:
+            async_parser.close()
+
+        with pool.parser("sync", "a" * 60) as parser:
+            parser.parse()
+            self.assertEqual(parser.bsr.start, (_Letters, 0, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# Transmuter front-end, front-end libraries and utilities for the
+# Transmuter language processing infrastructure
+# Copyright (C) 2024  Natan Junges <natanajunges@gmail.com>
+# Copyright (C) 2024  The Transmuter Project
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+from transmuter.front.common import TransmuterConditions, TransmuterCondition
+from transmuter.front.lexical import (
+    TransmuterLexingState,
+    TransmuterTerminalTag,
+    TransmuterLexer,
+)
+from transmuter.front.syntactic import (
+    TransmuterNonterminalType,
+    TransmuterSequence,
+    TransmuterOptional,
+    TransmuterIteration,
+    TransmuterExpression,
+    TransmuterBSR,
+    TransmuterCompactBSR,
+    TransmuterParser,
+    TransmuterEarleyParser,
+)
+
+# Test grammar, written as the front-end generator would emit it, with an
+# iteration over a nonterminal type deriving the empty string:
+#
+#   Iteration(start): Letter {Empty} ;
+#   Empty: [Letter] ;
+
+
+class _Conditions(TransmuterConditions):
+    test = TransmuterCondition()
+
+
+class _Letter(TransmuterTerminalTag):
+    @staticmethod
+    def nfa(
+        current_states: TransmuterLexingState, char: str
+    ) -> tuple[bool, TransmuterLexingState]:
+        state_accept = False
+        next_states = 0
+
+        # S0
+        if 1 & current_states and (char == "a"):
+            state_accept = True
+
+        return (state_accept, next_states)
+
+
+class _Lexer(TransmuterLexer):
+    TERMINAL_TAGS = [_Letter]
+
+
+class _Iteration(TransmuterNonterminalType):
+    @staticmethod
+    def start(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((_Letter, TransmuterIteration(_Empty, True)))
+
+
+class _Empty(TransmuterNonterminalType):
+    @staticmethod
+    def nullable(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterOptional(_Letter, True)
+
+
+class _Parser(TransmuterParser):
+    NONTERMINAL_TYPES = [_Iteration, _Empty]
+
+
+class _EarleyParser(TransmuterEarleyParser, _Parser):
+    pass
+
+
+class TestEarleyParser(unittest.TestCase):
+    def test_iteration_deriving_empty_string(self) -> None:
+        for length in range(1, 5):
+            with self.subTest(length=length):
+                parser = _EarleyParser(
+                    _Lexer("test", "a" * length, _Conditions.test)
+                )
+                parser.parse()
+                self.assertEqual(parser.bsr.start, (_Iteration, 0, length))
+
+
+class TestBSR(unittest.TestCase):
+    def test_epn_count(self) -> None:
+        for bsr_type in (TransmuterBSR, TransmuterCompactBSR):
+            with self.subTest(bsr_type=bsr_type):
+                parser = _EarleyParser(
+                    _Lexer("test", "a" * 4, _Conditions.test),
+                    bsr_type=bsr_type,
+                )
+                parser.parse()
+                bsr = parser.bsr
+                epns = [epn for key in bsr.epns for epn in bsr.epns[key]]
+                self.assertGreater(len(epns), len(bsr.epns))
+                self.assertEqual(bsr.epn_count, len(epns))
+
+                for epn in epns:
+                    bsr.add(epn)
+
+                self.assertEqual(bsr.epn_count, len(epns))
+                bsr.discard(epns[0])
+                bsr.discard(epns[0])
+                self.assertEqual(bsr.epn_count, len(epns) - 1)
+                bsr.add(epns[0])
+                pruned = bsr.prune()
+                self.assertEqual(bsr.epn_count, len(epns) - pruned)
+                bsr.clear()
+                self.assertEqual(bsr.epn_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
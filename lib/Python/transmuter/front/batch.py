@@ -0,0 +1,219 @@
+# Transmuter front-end, front-end libraries and utilities for the
+# Transmuter language processing infrastructure
+# Copyright (C) 2024  Natan Junges <natanajunges@gmail.com>
+# Copyright (C) 2024  The Transmuter Project
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Any, cast
+
+from .common import (
+    TransmuterPosition,
+    TransmuterConditions,
+    TransmuterException,
+)
+from .lexical import TransmuterLexer
+from .syntactic import TransmuterBSR, TransmuterParser, TransmuterParserPool
+from .semantic.common import (
+    TransmuterBSRPruner,
+    TransmuterBSRDisambiguator,
+    TransmuterBSRToTreeConverter,
+    TransmuterTreeFold,
+    TransmuterNonterminalTreeNode,
+    TransmuterTerminalTreeNode,
+)
+
+# (type name, start index, end index, children or terminal value)
+type TransmuterSerializedTree = tuple[
+    str, int, int, tuple["TransmuterSerializedTree", ...] | str
+]
+
+
+class TransmuterTreeSerializer(TransmuterTreeFold[TransmuterSerializedTree]):
+    def fold_internal(
+        self,
+        node: TransmuterNonterminalTreeNode,
+        children: list[TransmuterSerializedTree],
+    ) -> TransmuterSerializedTree:
+        return (
+            node.type_.__name__,
+            node.start_position.index_,
+            node.end_terminal.end_position.index_,
+            tuple(children),
+        )
+
+    def fold_external(
+        self, node: TransmuterTerminalTreeNode
+    ) -> TransmuterSerializedTree:
+        return (
+            node.type_.__name__,
+            node.start_position.index_,
+            node.end_terminal.end_position.index_,
+            node.end_terminal.value,
+        )
+
+
+# Ambiguous forests raise TransmuterAmbiguousGrammarError, and inputs without
+# any terminal, which have no derivation, are serialized as None
+def transmuter_serialize_tree(
+    bsr: TransmuterBSR,
+) -> TransmuterSerializedTree | None:
+    if bsr.start is None:
+        return None
+
+    pruner = TransmuterBSRPruner(bsr)
+    pruner.visit()
+    pruner.apply()
+    disambiguator = TransmuterBSRDisambiguator(bsr)
+    disambiguator.visit()
+    disambiguator.apply()
+    converter = TransmuterBSRToTreeConverter(bsr)
+    converter.visit()
+    assert converter.tree is not None
+    serializer = TransmuterTreeSerializer(converter.tree)
+    serializer.visit()
+    assert len(serializer.fold_queue) == 1
+    tree = serializer.fold_queue[0]
+    assert tree is not None
+    return tree
+
+
+# Groups the files into chunks of up to the given total size, largest files
+# first so that the longest chunks are not left for last. Returns the indexes
+# of the files in each chunk. Files whose size cannot be read are left for
+# their workers to report.
+def transmuter_chunk_files(
+    filenames: list[str], chunk_size: int
+) -> list[list[int]]:
+    sizes = []
+
+    for filename in filenames:
+        try:
+            sizes.append(os.path.getsize(filename))
+        except OSError:
+            sizes.append(0)
+
+    chunks: list[list[int]] = []
+    chunk: list[int] = []
+    total_size = 0
+
+    for i in sorted(range(len(filenames)), key=lambda i: -sizes[i]):
+        if len(chunk) > 0 and total_size + sizes[i] > chunk_size:
+            chunks.append(chunk)
+            chunk = []
+            total_size = 0
+
+        chunk.append(i)
+        total_size += sizes[i]
+
+    if len(chunk) > 0:
+        chunks.append(chunk)
+
+    return chunks
+
+
+# State of each worker process, kept across the chunks it parses
+_transmuter_pool: TransmuterParserPool | None = None
+_transmuter_fold: Callable[[TransmuterBSR], Any] | None = None
+
+
+def _transmuter_init_worker(
+    lexer_type: type[TransmuterLexer],
+    parser_factory: Callable[[TransmuterLexer], TransmuterParser],
+    conditions: TransmuterConditions,
+    fold: Callable[[TransmuterBSR], Any],
+) -> None:
+    global _transmuter_pool, _transmuter_fold
+    _transmuter_pool = TransmuterParserPool(
+        lexer_type, parser_factory, conditions
+    )
+    _transmuter_fold = fold
+
+
+# Subclasses of TransmuterException cannot be rebuilt from their pickled
+# arguments, so errors are sent back as TransmuterException. Any other error,
+# such as one reading the file, is placed at its start.
+def _transmuter_picklable_exception(
+    filename: str, exception: Exception
+) -> TransmuterException:
+    if isinstance(exception, TransmuterException):
+        return TransmuterException(
+            exception.position, exception.type_, exception.description
+        )
+
+    return TransmuterException(
+        TransmuterPosition(filename, 0, 1, 1),
+        type(exception).__name__,
+        str(exception),
+    )
+
+
+# The BSR is folded before the parser is released, so it is not handed over
+def _transmuter_parse_chunk(filenames: list[str]) -> list[Any]:
+    assert _transmuter_pool is not None
+    assert _transmuter_fold is not None
+    results = []
+
+    for filename in filenames:
+        try:
+            with open(filename, encoding="utf-8") as file:
+                input = file.read()
+
+            with _transmuter_pool.parser(filename, input) as parser:
+                parser.parse()
+                results.append(_transmuter_fold(parser.bsr))
+        except Exception as exception:
+            results.append(
+                _transmuter_picklable_exception(filename, exception)
+            )
+
+    return results
+
+
+# Parses the files in worker processes, returning in their order what the
+# fold made of each BSR, or the error raised while reading, parsing or folding
+# it. The parser factory and the fold are sent to the workers, so they must be
+# picklable, such as generated parser types and module-level functions.
+def transmuter_parse_files[T](
+    lexer_type: type[TransmuterLexer],
+    parser_factory: Callable[[TransmuterLexer], TransmuterParser],
+    conditions: TransmuterConditions,
+    fold: Callable[[TransmuterBSR], T],
+    filenames: list[str],
+    max_workers: int | None = None,
+    chunk_size: int = 1 << 20,
+) -> list[T | TransmuterException]:
+    results: list[T | TransmuterException | None] = [None] * len(filenames)
+    chunks = transmuter_chunk_files(filenames, chunk_size)
+
+    with ProcessPoolExecutor(
+        max_workers,
+        initializer=_transmuter_init_worker,
+        initargs=(lexer_type, parser_factory, conditions, fold),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _transmuter_parse_chunk, [filenames[i] for i in chunk]
+            )
+            for chunk in chunks
+        ]
+
+        for chunk, future in zip(chunks, futures):
+            for i, result in zip(chunk, future.result()):
+                results[i] = result
+
+    return cast(list[T | TransmuterException], results)
@@ -0,0 +1,426 @@
+# Transmuter front-end, front-end libraries and utilities for the
+# Transmuter language processing infrastructure
+# Copyright (C) 2024  Natan Junges <natanajunges@gmail.com>
+# Copyright (C) 2024  The Transmuter Project
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from .common import (
+    TransmuterConditions,
+    TransmuterCondition,
+    TransmuterException,
+)
+from .lexical import (
+    TransmuterLexingState,
+    TransmuterTerminalTag,
+    TransmuterTerminalSource,
+    TransmuterLexer,
+)
+from .batch import transmuter_serialize_tree, transmuter_parse_files
+from .syntactic import (
+    transmuter_selection,
+    TransmuterNonterminalType,
+    TransmuterSequence,
+    TransmuterSelection,
+    TransmuterIteration,
+    TransmuterExpression,
+    TransmuterParsingState,
+    TransmuterParser,
+    TransmuterEarleyParser,
+    TransmuterParserPool,
+)
+
+
+def transmuter_benchmark_parser(
+    parser_factory: Callable[[], TransmuterParser], repeat: int = 5
+) -> float:
+    # The best time is the least disturbed by the rest of the system
+    best_time = float("inf")
+
+    for _ in range(repeat):
+        parser = parser_factory()
+        start_time = perf_counter()
+        parser.parse()
+        best_time = min(best_time, perf_counter() - start_time)
+
+    return best_time
+
+
+def transmuter_benchmark_parsers(
+    lexer_factory: Callable[[], TransmuterTerminalSource],
+    parser_types: list[type[TransmuterParser]],
+    repeat: int = 5,
+) -> dict[type[TransmuterParser], float]:
+    return {
+        parser_type: transmuter_benchmark_parser(
+            lambda: parser_type(lexer_factory()), repeat
+        )
+        for parser_type in parser_types
+    }
+
+
+# Returns the best times of parsing the documents one parser at a time and of
+# parsing them through the pool
+def transmuter_benchmark_parse_many(
+    pool: TransmuterParserPool,
+    documents: list[tuple[str, str]],
+    repeat: int = 5,
+) -> tuple[float, float]:
+    loop_time = float("inf")
+    many_time = float("inf")
+
+    for _ in range(repeat):
+        start_time = perf_counter()
+
+        for filename, input in documents:
+            parser = pool.parser_factory(
+                pool.lexer_type(filename, input, pool.conditions)
+            )
+
+            try:
+                parser.parse()
+            except TransmuterException:
+                pass
+
+        loop_time = min(loop_time, perf_counter() - start_time)
+        start_time = perf_counter()
+
+        for _ in pool.parse_many(documents):
+            pass
+
+        many_time = min(many_time, perf_counter() - start_time)
+
+    return (loop_time, many_time)
+
+
+# Returns the best time of parsing the files with each number of workers
+def transmuter_benchmark_parse_files(
+    lexer_type: type[TransmuterLexer],
+    parser_factory: Callable[[TransmuterLexer], TransmuterParser],
+    conditions: TransmuterConditions,
+    filenames: list[str],
+    worker_counts: list[int],
+    repeat: int = 3,
+) -> dict[int, float]:
+    times = {}
+
+    for worker_count in worker_counts:
+        best_time = float("inf")
+
+        for _ in range(repeat):
+            start_time = perf_counter()
+            transmuter_parse_files(
+                lexer_type,
+                parser_factory,
+                conditions,
+                transmuter_serialize_tree,
+                filenames,
+                worker_count,
+            )
+            best_time = min(best_time, perf_counter() - start_time)
+
+        times[worker_count] = best_time
+
+    return times
+
+
+# Returns the best time of parsing the documents through the pool with each
+# number of threads, which only run in parallel on free-threaded builds
+def transmuter_benchmark_threads(
+    pool: TransmuterParserPool,
+    documents: list[tuple[str, str]],
+    thread_counts: list[int],
+    repeat: int = 3,
+) -> dict[int, float]:
+    times = {}
+
+    for thread_count in thread_counts:
+        best_time = float("inf")
+
+        def parse_share(share: int) -> None:
+            for _ in pool.parse_many(documents[share::thread_count]):
+                pass
+
+        with ThreadPoolExecutor(thread_count) as executor:
+            for _ in range(repeat):
+                start_time = perf_counter()
+                list(executor.map(parse_share, range(thread_count)))
+                best_time = min(best_time, perf_counter() - start_time)
+
+        times[thread_count] = best_time
+
+    return times
+
+
+# Workload grammars, written as the front-end generator would emit them:
+#
+#   Ambiguous(start): Ambiguous Ambiguous / Letter ;
+#   Deterministic(start): Letter {/Letter} ;
+
+
+class _Conditions(TransmuterConditions):
+    benchmark = TransmuterCondition()
+
+
+class _Letter(TransmuterTerminalTag):
+    @staticmethod
+    def nfa(
+        current_states: TransmuterLexingState, char: str
+    ) -> tuple[bool, TransmuterLexingState]:
+        state_accept = False
+        next_states = 0
+
+        # S0
+        if 1 & current_states and (char == "a"):
+            state_accept = True
+
+        return (state_accept, next_states)
+
+
+class _Lexer(TransmuterLexer):
+    TERMINAL_TAGS = [_Letter]
+
+
+class _Ambiguous(TransmuterNonterminalType):
+    @staticmethod
+    def start(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def first(
+        conditions: TransmuterConditions,
+    ) -> set[type[TransmuterNonterminalType]]:
+        return {_Ambiguous}
+
+    @staticmethod
+    def first_terminal_tags(
+        conditions: TransmuterConditions,
+    ) -> set[type[TransmuterTerminalTag]]:
+        return {_Letter}
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSelection(
+            (TransmuterSequence((_Ambiguous, _Ambiguous)), _Letter), True
+        )
+
+    @classmethod
+    def descend(
+        cls, parser: TransmuterParser, current_state: TransmuterParsingState
+    ) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+
+        for _ in transmuter_selection:  # begin selection
+            next_states1 = next_states0  # begin option 1
+            next_states1 = parser.call(_Ambiguous, next_states1, cls)
+            next_states1 = parser.call(_Ambiguous, next_states1)
+
+            if len(next_states1) != 0:
+                next_states0 = next_states1
+                break  # end option 1
+
+            next_states1 = next_states0  # begin option 2
+            next_states1 = parser.call(_Letter, next_states1)
+
+            if len(next_states1) != 0:
+                next_states0 = next_states1
+                break  # end option 2
+
+            next_states0 = set()  # end selection
+
+        return next_states0
+
+
+class _Deterministic(TransmuterNonterminalType):
+    @staticmethod
+    def start(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def first_terminal_tags(
+        conditions: TransmuterConditions,
+    ) -> set[type[TransmuterTerminalTag]]:
+        return {_Letter}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence(
+            (_Letter, TransmuterIteration(_Letter, True))
+        )
+
+    @classmethod
+    def descend(
+        cls, parser: TransmuterParser, current_state: TransmuterParsingState
+    ) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+        next_states0 = parser.call(_Letter, next_states0)
+
+        while True:  # begin iteration
+            next_states1 = next_states0
+            next_states1 = parser.call(_Letter, next_states1)
+
+            if len(next_states1) == 0:
+                break
+
+            next_states0 = next_states1  # end iteration
+
+        return next_states0
+
+    @classmethod
+    def descend_single(
+        cls, parser: TransmuterParser, current_state: TransmuterParsingState
+    ) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(_Letter, next_state0)
+
+        while True:  # begin iteration
+            next_state1 = next_state0
+            next_state1 = parser.call_single(_Letter, next_state1)
+
+            if next_state1 is None:
+                break
+
+            next_state0 = next_state1  # end iteration
+
+        return next_state0
+
+
+class _AmbiguousParser(TransmuterParser):
+    NONTERMINAL_TYPES = [_Ambiguous]
+
+
+class _AmbiguousEarleyParser(TransmuterEarleyParser, _AmbiguousParser):
+    pass
+
+
+class _DeterministicParser(TransmuterParser):
+    NONTERMINAL_TYPES = [_Deterministic]
+
+
+class _DeterministicEarleyParser(TransmuterEarleyParser, _DeterministicParser):
+    pass
+
+
+def _main() -> None:
+    workloads: list[tuple[str, list[type[TransmuterParser]], list[int]]] = [
+        (
+            "ambiguous",
+            [_AmbiguousParser, _AmbiguousEarleyParser],
+            [4, 8, 12, 16],
+        ),
+        (
+            "deterministic",
+            [_DeterministicParser, _DeterministicEarleyParser],
+            [100, 1000, 5000],
+        ),
+    ]
+
+    for name, parser_types, lengths in workloads:
+        for length in lengths:
+            times = transmuter_benchmark_parsers(
+                lambda: _Lexer(name, "a" * length, _Conditions.benchmark),
+                parser_types,
+            )
+            descent_time = times[parser_types[0]]
+            earley_time = times[parser_types[1]]
+            winner = "descent" if descent_time <= earley_time else "earley"
+            print(
+                f"{name} {length}: descent {descent_time:.4f}s, "
+                f"earley {earley_time:.4f}s, {winner} wins"
+            )
+
+    for parser_type in [_AmbiguousParser, _DeterministicParser]:
+        pool = TransmuterParserPool(_Lexer, parser_type, _Conditions.benchmark)
+
+        for count in [100, 1000]:
+            documents = [
+                (f"document{i}", "a" * (i % 4 + 1)) for i in range(count)
+            ]
+            loop_time, many_time = transmuter_benchmark_parse_many(
+                pool, documents
+            )
+            print(
+                f"{parser_type.__name__} {count} documents: "
+                f"loop {loop_time:.4f}s, parse_many {many_time:.4f}s"
+            )
+
+    worker_counts = [1]
+
+    while worker_counts[-1] * 2 <= (os.cpu_count() or 1):
+        worker_counts.append(worker_counts[-1] * 2)
+
+    # Each set has an empty file, and the ambiguous one is left for the fold
+    # to disambiguate, so that per-file errors are part of the run.
+    file_workloads: list[tuple[str, type[TransmuterParser], list[int]]] = [
+        ("deterministic", _DeterministicParser, [0, 250, 500, 750, 1000]),
+        ("ambiguous", _AmbiguousParser, [0, 2, 4, 6, 8]),
+    ]
+
+    for name, parser_type, lengths in file_workloads:
+        with TemporaryDirectory() as directory:
+            filenames = []
+
+            for i in range(16):
+                filename = os.path.join(directory, f"document{i}")
+
+                with open(filename, "w", encoding="utf-8") as file:
+                    file.write("a" * lengths[i % len(lengths)])
+
+                filenames.append(filename)
+
+            times = transmuter_benchmark_parse_files(
+                _Lexer,
+                parser_type,
+                _Conditions.benchmark,
+                filenames,
+                worker_counts,
+            )
+
+        for worker_count, time in times.items():
+            print(
+                f"{name} {len(filenames)} files, {worker_count} workers: "
+                f"{time:.4f}s, {times[1] / time:.2f}x speedup"
+            )
+
+    pool = TransmuterParserPool(
+        _Lexer, _DeterministicParser, _Conditions.benchmark
+    )
+    documents = [(f"document{i}", "a" * 500) for i in range(64)]
+    times = transmuter_benchmark_threads(pool, documents, worker_counts)
+    gil = (
+        "enabled"
+        if getattr(sys, "_is_gil_enabled", lambda: True)()
+        else "disabled"
+    )
+
+    for thread_count, time in times.items():
+        print(
+            f"{len(documents)} documents, {thread_count} threads, "
+            f"GIL {gil}: {time:.4f}s, {times[1] / time:.2f}x speedup"
+        )
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,169 @@
+# Transmuter front-end, front-end libraries and utilities for the
+# Transmuter language processing infrastructure
+# Copyright (C) 2024  Natan Junges <natanajunges@gmail.com>
+# Copyright (C) 2024  The Transmuter Project
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from .common import TransmuterPosition
+from .lexical import TransmuterTerminal
+from .syntactic import (
+    TransmuterNonterminalType,
+    TransmuterParsingState,
+    TransmuterParser,
+    TransmuterSyntacticError,
+    _TransmuterAscent,
+)
+
+
+@dataclass
+class TransmuterParserUsage:
+    # Includes calls skipped by prediction in the deterministic engine
+    descents: int = 0
+    memo: int = 0
+    # Number of EPNs
+    bsr: int = 0
+    # Number of (label, start, end) keys holding them, which is not budgeted
+    bsr_keys: int = 0
+    # In seconds
+    time: float = 0
+
+
+# Parser raising TransmuterBudgetExceededError once it exceeds any of the
+# given limits, of which the ones left as None are not checked. Descents are
+# checked as they happen, and the rest every given number of terminal reads
+# and derivations, so that both engines are checked. The memo and BSR sizes
+# are the ones left after commits. Mixed into a generated parser type like
+# TransmuterStatsParser:
+#
+#   @dataclass
+#   class BudgetParser(TransmuterBudgetParser, Parser):
+#       pass
+@dataclass
+class TransmuterBudgetParser(TransmuterParser):
+    max_descents: int | None = None
+    max_memo: int | None = None
+    max_bsr: int | None = None
+    # In seconds
+    max_time: float | None = None
+    budget_check_steps: int = 16
+    _budget_descents: int = field(default=0, init=False, repr=False)
+    _budget_steps_left: int = field(default=0, init=False, repr=False)
+    _budget_start_time: float | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def reset(self, filename: str, input: str) -> None:
+        super().reset(filename, input)
+        self._budget_descents = 0
+        self._budget_steps_left = 0
+        self._budget_start_time = None
+
+    def usage(self) -> TransmuterParserUsage:
+        return TransmuterParserUsage(
+            self._budget_descents,
+            len(self._memo) + len(self._memo_deterministic),
+            self.bsr.epn_count,
+            len(self.bsr.epns),
+            (
+                perf_counter() - self._budget_start_time
+                if self._budget_start_time is not None
+                else 0
+            ),
+        )
+
+    def _descend(
+        self,
+        cls: type[TransmuterNonterminalType],
+        key: tuple[type[TransmuterNonterminalType], int],
+        position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+        ascent: _TransmuterAscent | None,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> None:
+        self._budget_descend()
+        super()._descend(cls, key, position, end_terminal, ascent, ascend)
+
+    def _call_deterministic_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+    ) -> TransmuterParsingState | None:
+        if (
+            cls,
+            (
+                current_state.end_terminal.end_position.index_
+                if current_state.end_terminal is not None
+                else current_state.split_position.index_
+            ),
+        ) not in self._memo_deterministic:
+            self._budget_descend()
+
+        return super()._call_deterministic_nonterminal_type(cls, current_state)
+
+    def _budget_descend(self) -> None:
+        self._budget_descents += 1
+
+        if (
+            self.max_descents is not None
+            and self._budget_descents > self.max_descents
+        ):
+            self._budget_exceeded("descents")
+
+    def _step(self) -> None:
+        super()._step()
+        self._budget_steps_left -= 1
+
+        if self._budget_steps_left > 0:
+            return
+
+        self._budget_steps_left = self.budget_check_steps
+
+        if self._budget_start_time is None:
+            self._budget_start_time = perf_counter()
+
+        if (
+            self.max_memo is not None
+            and len(self._memo) + len(self._memo_deterministic) > self.max_memo
+        ):
+            self._budget_exceeded("memo")
+
+        if self.max_bsr is not None and self.bsr.epn_count > self.max_bsr:
+            self._budget_exceeded("BSR")
+
+        if (
+            self.max_time is not None
+            and perf_counter() - self._budget_start_time > self.max_time
+        ):
+            self._budget_exceeded("time")
+
+    def _budget_exceeded(self, budget: str) -> None:
+        raise TransmuterBudgetExceededError(
+            self._farthest_position(), budget, self.usage()
+        )
+
+
+class TransmuterBudgetExceededError(TransmuterSyntacticError):
+    def __init__(
+        self,
+        position: TransmuterPosition,
+        budget: str,
+        usage: TransmuterParserUsage,
+    ) -> None:
+        super().__init__(position, f"Exceeded the {budget} budget.")
+        self.budget = budget
+        self.usage = usage
@@ -19,6 +19,7 @@
 from dataclasses import dataclass
 from enum import auto, IntFlag
 import sys
+from threading import Lock
 import warnings
 
 TransmuterConditions = IntFlag
@@ -101,7 +102,14 @@ class TransmuterException(Exception):
     def __init__(
         self, position: TransmuterPosition, type_: str, description: str
     ) -> None:
-        super().__init__(f"{position}: {type_}: {description}")
+        super().__init__(position, type_, description)
+        self.position = position
+        self.type_ = type_
+        self.description = description
+
+    # The message is only formatted when the exception is displayed
+    def __str__(self) -> str:
+        return f"{self.position}: {self.type_}: {self.description}"
 
 
 class TransmuterExceptionHandler:
@@ -125,7 +133,23 @@ class TransmuterWarning(TransmuterException, Warning):
     pass
 
 
+_transmuter_warnings_lock = Lock()
+_transmuter_warnings_initialized = False
+
+
+# The warnings module is shared by every thread, so it is only patched once
 def transmuter_init_warnings() -> None:
+    global _transmuter_warnings_initialized
+
+    with _transmuter_warnings_lock:
+        if _transmuter_warnings_initialized:
+            return
+
+        _transmuter_init_warnings()
+        _transmuter_warnings_initialized = True
+
+
+def _transmuter_init_warnings() -> None:
     original_formatwarning = warnings.formatwarning
 
     def formatwarning(
@@ -0,0 +1,189 @@
+# Transmuter front-end, front-end libraries and utilities for the
+# Transmuter language processing infrastructure
+# Copyright (C) 2024  Natan Junges <natanajunges@gmail.com>
+# Copyright (C) 2024  The Transmuter Project
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Event
+from time import perf_counter
+
+from .common import TransmuterPosition
+from .syntactic import (
+    TransmuterBSR,
+    TransmuterParser,
+    TransmuterParserPool,
+    TransmuterSyntacticError,
+)
+
+
+# Parser checked for cancellation every given number of steps, which calls
+# back once the given time has passed since it last did, so that the callback
+# can block to hand the GIL over. Steps are terminal reads and derivations, so
+# both engines take them. Mixed into a generated parser type like
+# TransmuterStatsParser:
+#
+#   @dataclass
+#   class CooperativeParser(TransmuterCooperativeParser, Parser):
+#       pass
+@dataclass
+class TransmuterCooperativeParser(TransmuterParser):
+    slice_steps: int = 16
+    # In seconds
+    slice_time: float = 0.001
+    # Called from the parsing thread with the farthest input index read
+    slice_callback: Callable[[int], None] | None = None
+    _slice_steps_left: int = field(default=0, init=False, repr=False)
+    _slice_start_time: float = field(default=0, init=False, repr=False)
+    _cancelled: bool = field(default=False, init=False, repr=False)
+    _resumed: Event = field(default_factory=Event, init=False, repr=False)
+
+    def reset(self, filename: str, input: str) -> None:
+        super().reset(filename, input)
+        self._slice_steps_left = 0
+        self._cancelled = False
+        self._resumed.clear()
+
+    # May be called from any thread, making parse raise at its next check or
+    # from the slice it is waiting to be resumed from
+    def cancel(self) -> None:
+        self._cancelled = True
+        self._resumed.set()
+
+    # May be called from any thread, resuming the slice being waited for
+    def resume(self) -> None:
+        self._resumed.set()
+
+    # Called from the slice callback, after it has arranged for resume to be
+    # called, blocking until it is or the parse is cancelled. Whatever must
+    # call resume is checked to still be able to every given number of
+    # seconds, cancelling the parse otherwise.
+    def wait_resumed(
+        self, resumable: Callable[[], bool], check_time: float = 0.1
+    ) -> None:
+        while not self._resumed.wait(check_time):
+            if not resumable():
+                self.cancel()
+
+        self._resumed.clear()
+
+        if self._cancelled:
+            raise TransmuterCancelledError(self._farthest_position())
+
+    def parse(self, prune: bool = False) -> int | None:
+        self._slice_steps_left = self.slice_steps
+        self._slice_start_time = perf_counter()
+        return super().parse(prune)
+
+    def _step(self) -> None:
+        super()._step()
+        self._slice_steps_left -= 1
+
+        if self._slice_steps_left > 0:
+            return
+
+        self._slice_steps_left = self.slice_steps
+
+        if self._cancelled:
+            raise TransmuterCancelledError(self._farthest_position())
+
+        if (
+            self.slice_callback is None
+            or perf_counter() - self._slice_start_time < self.slice_time
+        ):
+            return
+
+        self.slice_callback(self._farthest_position().index_)
+        self._slice_start_time = perf_counter()
+
+
+# Parses on worker threads for an event loop, through a pool of cooperative
+# parsers. Each slice waits for the loop to run its pending callbacks, as
+# merely releasing the GIL does not hand it over. Parses beyond the given
+# number wait for a thread to be free. Cancelling a parse stops its parser at
+# its next check.
+@dataclass
+class TransmuterAsyncParser:
+    pool: TransmuterParserPool
+    max_parses: int = 1
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _executor: ThreadPoolExecutor = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_parses)
+        self._executor = ThreadPoolExecutor(self.max_parses)
+
+    async def parse(
+        self,
+        filename: str,
+        input: str,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> TransmuterBSR:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            parser = self.pool.acquire(filename, input)
+            assert isinstance(parser, TransmuterCooperativeParser)
+
+            def slice_(index_: int) -> None:
+                try:
+                    if progress_callback is not None:
+                        progress_callback(index_)
+                finally:
+                    parser.resume()
+
+            # A stopped or closed loop would never resume the parse
+            def slice_callback(index_: int) -> None:
+                try:
+                    loop.call_soon_threadsafe(slice_, index_)
+                except RuntimeError:
+                    parser.cancel()
+
+                parser.wait_resumed(
+                    lambda: loop.is_running() and not loop.is_closed()
+                )
+
+            parser.slice_callback = slice_callback
+            future = self._executor.submit(self._parse, parser)
+
+            # The callback is bound to this loop, which may be gone by the
+            # time the parser is next acquired
+            def release(_: Future[TransmuterBSR]) -> None:
+                parser.slice_callback = None
+                self.pool.release(parser)
+
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                parser.cancel()
+                raise
+            finally:
+                # Only once its thread is done, which it may still not be
+                future.add_done_callback(release)
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    @staticmethod
+    def _parse(parser: TransmuterParser) -> TransmuterBSR:
+        parser.parse()
+        return parser.take_bsr()
+
+
+class TransmuterCancelledError(TransmuterSyntacticError):
+    def __init__(self, position: TransmuterPosition) -> None:
+        super().__init__(position, "Parsing was cancelled.")
@@ -0,0 +1,431 @@
+# Transmuter front-end, front-end libraries and utilities for the
+# Transmuter language processing infrastructure
+# Copyright (C) 2024  Natan Junges <natanajunges@gmail.com>
+# Copyright (C) 2024  The Transmuter Project
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass, field, asdict
+import json
+from time import perf_counter_ns
+from typing import Any
+
+from .common import TransmuterPosition
+from .lexical import TransmuterTerminalTag, TransmuterTerminal
+from .syntactic import (
+    TransmuterNonterminalType,
+    TransmuterParsingState,
+    TransmuterParser,
+    _TransmuterAscent,
+)
+
+
+def _transmuter_index(current_state: TransmuterParsingState) -> int:
+    return (
+        current_state.end_terminal.end_position.index_
+        if current_state.end_terminal is not None
+        else current_state.split_position.index_
+    )
+
+
+@dataclass
+class TransmuterNonterminalTypeStats:
+    calls: int = 0
+    failures: int = 0
+    # Misses include calls skipped by prediction, which do not descend
+    memo_hits: int = 0
+    memo_misses: int = 0
+    descents: int = 0
+    # Descents driven by the left-recursion worklist
+    ascents: int = 0
+    epns: int = 0
+
+
+@dataclass
+class TransmuterParserStats:
+    nonterminal_types: dict[
+        type[TransmuterNonterminalType], TransmuterNonterminalTypeStats
+    ] = field(default_factory=dict)
+    peak_memo: int = 0
+    # Number of (label, start, end) keys, as each one may hold many EPNs
+    peak_bsr: int = 0
+    # EPNs discarded by pruning at the end of parse
+    pruned_epns: int = 0
+
+    def nonterminal_type(
+        self, nonterminal_type: type[TransmuterNonterminalType]
+    ) -> TransmuterNonterminalTypeStats:
+        if nonterminal_type not in self.nonterminal_types:
+            self.nonterminal_types[nonterminal_type] = (
+                TransmuterNonterminalTypeStats()
+            )
+
+        return self.nonterminal_types[nonterminal_type]
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "nonterminal_types": {
+                nonterminal_type.__name__: asdict(stats)
+                for nonterminal_type, stats in self.nonterminal_types.items()
+            },
+            "peak_memo": self.peak_memo,
+            "peak_bsr": self.peak_bsr,
+            "pruned_epns": self.pruned_epns,
+        }
+
+    def report_json(self) -> str:
+        return json.dumps(self.report(), indent=4)
+
+
+# Mixed into a generated parser type, so that parsers without it pay nothing:
+#
+#   class StatsParser(TransmuterStatsParser, Parser):
+#       pass
+@dataclass
+class TransmuterStatsParser(TransmuterParser):
+    stats: TransmuterParserStats = field(
+        default_factory=TransmuterParserStats, init=False, repr=False
+    )
+    _stats_ascending: bool = field(default=False, init=False, repr=False)
+
+    # The stats of the previous input are kept by whoever holds them
+    def reset(self, filename: str, input: str) -> None:
+        super().reset(filename, input)
+        self.stats = TransmuterParserStats()
+        self._stats_ascending = False
+
+    def call(
+        self,
+        cls: type[TransmuterTerminalTag | TransmuterNonterminalType],
+        current_states: set[TransmuterParsingState],
+        ascend: type[TransmuterNonterminalType] | None = None,
+    ) -> set[TransmuterParsingState]:
+        next_states = super().call(cls, current_states, ascend)
+
+        # Calls after an earlier failure in a sequence do nothing
+        if len(current_states) != 0 and issubclass(
+            cls, TransmuterNonterminalType
+        ):
+            stats = self.stats.nonterminal_type(cls)
+            stats.calls += 1
+
+            if len(next_states) == 0:
+                stats.failures += 1
+
+        return next_states
+
+    def call_single(
+        self,
+        cls: type[TransmuterTerminalTag | TransmuterNonterminalType],
+        current_state: TransmuterParsingState | None,
+    ) -> TransmuterParsingState | None:
+        next_state = super().call_single(cls, current_state)
+
+        if current_state is not None and issubclass(
+            cls, TransmuterNonterminalType
+        ):
+            stats = self.stats.nonterminal_type(cls)
+            stats.calls += 1
+
+            if next_state is None:
+                stats.failures += 1
+
+        return next_state
+
+    def _call_single_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> set[TransmuterParsingState]:
+        if cls not in self._nonterminal_types_deterministic:
+            stats = self.stats.nonterminal_type(cls)
+
+            if (cls, _transmuter_index(current_state)) in self._memo:
+                stats.memo_hits += 1
+            else:
+                stats.memo_misses += 1
+
+        return super()._call_single_nonterminal_type(
+            cls, current_state, ascend
+        )
+
+    def _descend(
+        self,
+        cls: type[TransmuterNonterminalType],
+        key: tuple[type[TransmuterNonterminalType], int],
+        position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+        ascent: _TransmuterAscent | None,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> None:
+        stats = self.stats.nonterminal_type(cls)
+
+        if self._stats_ascending:
+            stats.ascents += 1
+        else:
+            stats.descents += 1
+
+        ascending = self._stats_ascending
+        self._stats_ascending = False
+        super()._descend(cls, key, position, end_terminal, ascent, ascend)
+        self._stats_ascending = ascending
+        self._stats_peaks()
+
+    def _ascend(
+        self,
+        ascent: _TransmuterAscent,
+        position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+    ) -> None:
+        ascending = self._stats_ascending
+        self._stats_ascending = True
+        super()._ascend(ascent, position, end_terminal)
+        self._stats_ascending = ascending
+
+    def _call_deterministic_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+    ) -> TransmuterParsingState | None:
+        stats = self.stats.nonterminal_type(cls)
+        key = (cls, _transmuter_index(current_state))
+        memo_hit = key in self._memo_deterministic
+
+        if memo_hit:
+            stats.memo_hits += 1
+        else:
+            stats.memo_misses += 1
+
+        next_state = super()._call_deterministic_nonterminal_type(
+            cls, current_state
+        )
+
+        if not memo_hit and key in self._memo_deterministic:
+            stats.descents += 1
+
+            if next_state is not None:
+                stats.epns += 1
+
+            self._stats_peaks()
+
+        return next_state
+
+    def _add_derivation(
+        self,
+        cls: type[TransmuterNonterminalType],
+        state: TransmuterParsingState,
+    ) -> None:
+        self.stats.nonterminal_type(cls).epns += 1
+        super()._add_derivation(cls, state)
+
+    def _prune(self) -> int:
+        self.stats.pruned_epns = super()._prune()
+        return self.stats.pruned_epns
+
+    def _stats_peaks(self) -> None:
+        self.stats.peak_memo = max(
+            self.stats.peak_memo,
+            len(self._memo) + len(self._memo_deterministic),
+        )
+        self.stats.peak_bsr = max(self.stats.peak_bsr, len(self.bsr.epns))
+
+
+# Times are in nanoseconds
+@dataclass
+class TransmuterNonterminalTypeTimes:
+    # Recursive descents are only charged once, at the outermost one
+    inclusive: int = 0
+    exclusive: int = 0
+
+
+@dataclass
+class TransmuterParserProfile:
+    region_size: int
+    # Keyed by nonterminal type and by the start index of its region
+    nonterminal_types: dict[
+        tuple[type[TransmuterNonterminalType], int],
+        TransmuterNonterminalTypeTimes,
+    ] = field(default_factory=dict)
+    # Exclusive times keyed by region start index and stack of active
+    # nonterminal types, outermost first
+    stacks: dict[
+        tuple[int, tuple[type[TransmuterNonterminalType], ...]], int
+    ] = field(default_factory=dict)
+
+    def nonterminal_type(
+        self, nonterminal_type: type[TransmuterNonterminalType], region: int
+    ) -> TransmuterNonterminalTypeTimes:
+        key = (nonterminal_type, region)
+
+        if key not in self.nonterminal_types:
+            self.nonterminal_types[key] = TransmuterNonterminalTypeTimes()
+
+        return self.nonterminal_types[key]
+
+    def report(self) -> dict[str, dict[int, dict[str, int]]]:
+        report: dict[str, dict[int, dict[str, int]]] = {}
+
+        for (nonterminal_type, region), times in sorted(
+            self.nonterminal_types.items(),
+            key=lambda item: (item[0][0].__name__, item[0][1]),
+        ):
+            if nonterminal_type.__name__ not in report:
+                report[nonterminal_type.__name__] = {}
+
+            report[nonterminal_type.__name__][region] = asdict(times)
+
+        return report
+
+    def report_json(self) -> str:
+        return json.dumps(self.report(), indent=4)
+
+    # Collapsed stacks, as consumed by flame graph tools, rooted at the
+    # region of the innermost nonterminal type
+    def collapsed_stacks(self) -> str:
+        lines = []
+
+        for (region, stack), time in sorted(
+            self.stacks.items(),
+            key=lambda item: (
+                item[0][0],
+                tuple(
+                    nonterminal_type.__name__
+                    for nonterminal_type in item[0][1]
+                ),
+            ),
+        ):
+            frames = [f"{region}-{region + self.region_size - 1}"]
+            frames.extend(
+                nonterminal_type.__name__ for nonterminal_type in stack
+            )
+            lines.append(f"{';'.join(frames)} {time}")
+
+        return "\n".join(lines)
+
+
+@dataclass
+class _TransmuterProfileFrame:
+    nonterminal_type: type[TransmuterNonterminalType]
+    region: int
+    start_time: int
+    children_time: int = 0
+
+
+# Deterministic profiler charging wall time to the nonterminal type being
+# descended, mixed in like TransmuterStatsParser. The Earley engine does not
+# descend, so nothing is charged under it. Both mixins can be combined:
+#
+#   @dataclass
+#   class InstrumentedParser(
+#       TransmuterStatsParser, TransmuterProfilingParser, Parser
+#   ):
+#       pass
+@dataclass
+class TransmuterProfilingParser(TransmuterParser):
+    profile_region_size: int = 4096
+    profile: TransmuterParserProfile = field(init=False, repr=False)
+    _profile_frames: list[_TransmuterProfileFrame] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _profile_active: dict[type[TransmuterNonterminalType], int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.profile = TransmuterParserProfile(self.profile_region_size)
+
+    def reset(self, filename: str, input: str) -> None:
+        super().reset(filename, input)
+        self.profile = TransmuterParserProfile(self.profile_region_size)
+        self._profile_frames.clear()
+        self._profile_active.clear()
+
+    def _descend(
+        self,
+        cls: type[TransmuterNonterminalType],
+        key: tuple[type[TransmuterNonterminalType], int],
+        position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+        ascent: _TransmuterAscent | None,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> None:
+        self._profile_enter(cls, key[1])
+
+        try:
+            super()._descend(cls, key, position, end_terminal, ascent, ascend)
+        finally:
+            self._profile_exit()
+
+    def _call_deterministic_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+    ) -> TransmuterParsingState | None:
+        index_ = _transmuter_index(current_state)
+
+        # Memoized calls do not descend
+        if (cls, index_) in self._memo_deterministic:
+            return super()._call_deterministic_nonterminal_type(
+                cls, current_state
+            )
+
+        self._profile_enter(cls, index_)
+
+        try:
+            return super()._call_deterministic_nonterminal_type(
+                cls, current_state
+            )
+        finally:
+            self._profile_exit()
+
+    def _profile_enter(
+        self, cls: type[TransmuterNonterminalType], index_: int
+    ) -> None:
+        self._profile_active[cls] = self._profile_active.get(cls, 0) + 1
+        self._profile_frames.append(
+            _TransmuterProfileFrame(
+                cls,
+                index_ // self.profile_region_size * self.profile_region_size,
+                perf_counter_ns(),
+            )
+        )
+
+    def _profile_exit(self) -> None:
+        end_time = perf_counter_ns()
+        frame = self._profile_frames[-1]
+        stack = tuple(
+            active_frame.nonterminal_type
+            for active_frame in self._profile_frames
+        )
+        self._profile_frames.pop()
+        time = end_time - frame.start_time
+        exclusive_time = time - frame.children_time
+        times = self.profile.nonterminal_type(
+            frame.nonterminal_type, frame.region
+        )
+        times.exclusive += exclusive_time
+        self._profile_active[frame.nonterminal_type] -= 1
+
+        if self._profile_active[frame.nonterminal_type] == 0:
+            times.inclusive += time
+
+        if len(self._profile_frames) > 0:
+            self._profile_frames[-1].children_time += time
+
+        key = (frame.region, stack)
+        self.profile.stacks[key] = (
+            self.profile.stacks.get(key, 0) + exclusive_time
+        )
@@ -17,7 +17,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from dataclasses import dataclass, field
-from typing import ClassVar
+from typing import ClassVar, Protocol
 
 from .common import (
     TransmuterConditions,
@@ -67,6 +67,9 @@ class TransmuterTerminal:
     start_position: TransmuterPosition
     end_position: TransmuterPosition
     next: "TransmuterTerminal | None" = field(default=None, init=False)
+    # Index past the last character examined while lexing the terminal, or
+    # past the end of the input if it was reached with live states
+    lookahead: int = field(default=0, init=False, repr=False)
 
     def __repr__(self) -> str:
         return repr(
@@ -74,6 +77,18 @@ class TransmuterTerminal:
         )
 
 
+# What the parser reads terminals from, so that they can be lexed once and
+# reused, or come from elsewhere
+class TransmuterTerminalSource(Protocol):
+    conditions: TransmuterConditions
+    # Start position of the first terminal, once it was read
+    start_position: TransmuterPosition
+
+    def next_terminal(
+        self, current_terminal: TransmuterTerminal | None
+    ) -> TransmuterTerminal | None: ...
+
+
 @dataclass
 class TransmuterLexer:
     TERMINAL_TAGS: ClassVar[list[type[TransmuterTerminalTag]]]
@@ -97,6 +112,8 @@ class TransmuterLexer:
     _start: TransmuterTerminal | None = field(
         default=None, init=False, repr=False
     )
+    # Kept per lexer, like the rest of its state, so that lexers on different
+    # threads do not share anything mutable
     _accepted_terminal_tags: dict[
         frozenset[type[TransmuterTerminalTag]],
         set[type[TransmuterTerminalTag]],
@@ -149,6 +166,120 @@ class TransmuterLexer:
 
         return current_terminal.next
 
+    def terminals(self) -> list[TransmuterTerminal]:
+        terminals = []
+        terminal = self.next_terminal(None)
+
+        while terminal is not None:
+            terminals.append(terminal)
+            terminal = self.next_terminal(terminal)
+
+        return terminals
+
+    # Lexes another input, keeping the tables and caches for the conditions.
+    # Terminals lexed before are left untouched, so their positions are not
+    # shared with the new ones.
+    def reset(self, filename: str, input: str) -> None:
+        self.filename = filename
+        self.input = input
+        self.start_position = TransmuterPosition(filename, 0, 1, 1)
+        self._start = None
+
+    # Replaces the input between the given indexes with the given text, keeping
+    # the terminals lexed before it that did not examine it and relexing until
+    # the terminals after it can be reused with their positions shifted.
+    # Returns the index in the old input after which terminals were reused.
+    def edit(self, start_index: int, end_index: int, text: str) -> int | None:
+        delta = len(text) - (end_index - start_index)
+        input_ = self.input[:start_index] + text + self.input[end_index:]
+        new_end_index = start_index + len(text)
+        line_delta = text.count("\n") - self.input.count(
+            "\n", start_index, end_index
+        )
+        column_delta = (
+            new_end_index - input_.rfind("\n", 0, new_end_index)
+        ) - (end_index - self.input.rfind("\n", 0, end_index))
+        end_line = self.input.count("\n", 0, end_index) + 1
+        kept_terminal = None
+        terminal = self._start
+
+        while terminal is not None and terminal.lookahead <= start_index:
+            kept_terminal = terminal
+            terminal = terminal.next
+
+        reusable_terminals = {}
+        shifted_positions = set()
+
+        # Only terminals ending after the edit can have their successors reused
+        while terminal is not None:
+            if terminal.end_position.index_ >= end_index:
+                reusable_terminals[terminal.end_position.index_] = terminal
+                terminal.lookahead += delta
+
+            for position in (terminal.start_position, terminal.end_position):
+                if (
+                    position.index_ >= end_index
+                    and id(position) not in shifted_positions
+                ):
+                    shifted_positions.add(id(position))
+
+                    if position.line == end_line:
+                        position.column += column_delta
+
+                    position.line += line_delta
+                    position.index_ += delta
+
+            terminal = terminal.next
+
+        self.input = input_
+
+        if kept_terminal is None:
+            self.start_position.update(
+                TransmuterPosition(self.filename, 0, 1, 1)
+            )
+            self._start = None
+        else:
+            kept_terminal.next = None
+
+        current_terminal = kept_terminal
+        last_index = max(reusable_terminals, default=-1)
+
+        try:
+            while True:
+                next_terminal = self.next_terminal(current_terminal)
+
+                if (
+                    next_terminal is None
+                    or next_terminal.end_position.index_ - delta > last_index
+                ):
+                    return None
+
+                index_ = next_terminal.end_position.index_ - delta
+
+                # Lexing only depends on the input after the start position.
+                # The reusable terminal takes the place of the new one, as
+                # its end position is still referenced after the edit.
+                if index_ in reusable_terminals:
+                    reusable_terminal = reusable_terminals[index_]
+                    reusable_terminal.tags = next_terminal.tags
+                    reusable_terminal.value = next_terminal.value
+                    reusable_terminal.start_position = (
+                        next_terminal.start_position
+                    )
+                    reusable_terminal.lookahead = next_terminal.lookahead
+
+                    if current_terminal is None:
+                        self._start = reusable_terminal
+                    else:
+                        current_terminal.next = reusable_terminal
+
+                    return index_
+
+                current_terminal = next_terminal
+        except TransmuterNoTerminalError:
+            # The error is raised again once the parser reaches it
+            return None
+
     def _get_terminal(
         self, start_position: TransmuterPosition
     ) -> TransmuterTerminal | None:
@@ -162,6 +293,7 @@ class TransmuterLexer:
         accepted_terminal_tags: set[type[TransmuterTerminalTag]] = set()
         accepted_position = start_position.copy()
         next_states = {}
+        lookahead = 0
 
         while True:
             while len(current_states) > 0 and current_position.index_ < len(
@@ -197,6 +329,10 @@ class TransmuterLexer:
                 current_states, next_states = next_states, current_states
                 next_states.clear()
 
+            lookahead = max(
+                lookahead, current_position.index_ + (len(current_states) > 0)
+            )
+
             if len(accepted_terminal_tags) == 0:
                 raise TransmuterNoTerminalError(start_position)
 
@@ -220,7 +356,7 @@ class TransmuterLexer:
                 )
 
             if len(accepted_terminal_tags) > 0:
-                return TransmuterTerminal(
+                terminal = TransmuterTerminal(
                     accepted_terminal_tags,
                     self.input[
                         start_position.index_ : accepted_position.index_
@@ -228,6 +364,8 @@ class TransmuterLexer:
                     start_position,
                     accepted_position,
                 )
+                terminal.lookahead = lookahead
+                return terminal
 
             if current_position.index_ == len(self.input):
                 return None
@@ -297,6 +435,37 @@ class TransmuterLexer:
         positive_terminal_tags -= negative_terminal_tags
 
 
+# Terminal source over terminals already lexed, such as the ones returned by
+# TransmuterLexer.terminals or read back from a cache
+@dataclass
+class TransmuterTerminalArray:
+    filename: str
+    conditions: TransmuterConditions
+    terminals: list[TransmuterTerminal]
+    start_position: TransmuterPosition = field(init=False, repr=False)
+    _indexes: dict[TransmuterTerminal, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.start_position = (
+            self.terminals[0].start_position
+            if len(self.terminals) > 0
+            else TransmuterPosition(self.filename, 0, 1, 1)
+        )
+        self._indexes = {
+            terminal: i for i, terminal in enumerate(self.terminals)
+        }
+
+    def next_terminal(
+        self, current_terminal: TransmuterTerminal | None
+    ) -> TransmuterTerminal | None:
+        i = (
+            self._indexes[current_terminal] + 1
+            if current_terminal is not None
+            else 0
+        )
+        return self.terminals[i] if i < len(self.terminals) else None
+
+
 class TransmuterLexicalError(TransmuterException):
     def __init__(self, position: TransmuterPosition, description: str) -> None:
         super().__init__(position, "Lexical Error", description)
@@ -16,16 +16,25 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import TypeGuard
 
-from ..common import TransmuterPosition, TransmuterException, TransmuterWarning
+from ..common import (
+    TransmuterConditions,
+    TransmuterPosition,
+    TransmuterException,
+    TransmuterWarning,
+)
 from ..lexical import TransmuterTerminalTag, TransmuterTerminal
 from ..syntactic import (
     TransmuterNonterminalType,
     TransmuterParsingState,
     TransmuterEPN,
+    transmuter_compute_precedence_levels,
+    transmuter_dominates,
     TransmuterBSR,
+    TransmuterParser,
 )
 
 
@@ -127,11 +136,12 @@ class TransmuterBSRTransformer(TransmuterBSRVisitor):
         self.new_bsr = self.bsr
 
     def top_before(self) -> None:
-        self.new_bsr = TransmuterBSR()
+        self.new_bsr = type(self.bsr)()
         self.new_bsr.start = self.bsr.start
 
     def apply(self) -> None:
         self.bsr.epns = self.new_bsr.epns
+        self.bsr.epn_count = self.new_bsr.epn_count
         self.bsr.start = self.new_bsr.start
         self.new_bsr = self.bsr
 
@@ -156,6 +166,39 @@ class TransmuterBSRDisambiguator(TransmuterBSRTransformer):
         raise TransmuterAmbiguousGrammarError(epns[0].state.start_position)
 
 
+@dataclass
+class TransmuterBSRPrecedenceDisambiguator(TransmuterBSRDisambiguator):
+    conditions: TransmuterConditions
+    _nonterminal_types_levels: dict[
+        type[TransmuterNonterminalType],
+        dict[type[TransmuterTerminalTag], tuple[int, bool]],
+    ] = field(default_factory=dict, init=False, repr=False)
+
+    def disambiguate(self, epns: list[TransmuterEPN]) -> TransmuterEPN:
+        assert len(epns) > 0
+        type_ = epns[0].type_
+
+        if type_ is not None:
+            if type_ not in self._nonterminal_types_levels:
+                self._nonterminal_types_levels[type_] = (
+                    transmuter_compute_precedence_levels(
+                        type_.precedences(self.conditions)
+                    )
+                )
+
+            levels = self._nonterminal_types_levels[type_]
+            epns = [
+                epn
+                for epn in epns
+                if not any(transmuter_dominates(levels, e, epn) for e in epns)
+            ]
+
+        if len(epns) == 1:
+            return epns[0]
+
+        return super().disambiguate(epns)
+
+
 @dataclass
 class TransmuterBSRFold[T](TransmuterBSRVisitor):
     fold_queue: deque[list[T | None]] = field(
@@ -259,8 +302,8 @@ class TransmuterBSRToTreeConverter(TransmuterBSRVisitor):
         if len(self.bsr.right_children(epns[0])) > 0:
             self._parents.append(parent)
         elif (
-            epns[0].state.split_position
-            != epns[0].state.end_terminal.end_position
+            epns[0].state.split_position.index_
+            != epns[0].state.end_terminal.end_position.index_
         ):
             assert len(epns[0].state.string) > 0
             assert issubclass(epns[0].state.string[-1], TransmuterTerminalTag)
@@ -287,6 +330,20 @@ class TransmuterBSRToTreeConverter(TransmuterBSRVisitor):
         return False
 
 
+def transmuter_parse_stream_trees(
+    parser: TransmuterParser,
+    nonterminal_type: type[TransmuterNonterminalType],
+) -> Iterator["TransmuterNonterminalTreeNode"]:
+    for forest in parser.parse_stream(nonterminal_type):
+        pruner = TransmuterBSRPruner(forest)
+        pruner.visit()
+        pruner.apply()
+        converter = TransmuterBSRToTreeConverter(forest)
+        converter.visit()
+        assert converter.tree is not None
+        yield converter.tree
+
+
 @dataclass
 class TransmuterTreeNode:
     type_: type[TransmuterTerminalTag | TransmuterNonterminalType]
@@ -500,8 +557,8 @@ class TransmuterTreeToBSRConverter(TransmuterTreeVisitor):
 
         self.bsr.start = (
             self.tree.type_,
-            self.tree.start_position,
-            self.tree.end_terminal.end_position,
+            self.tree.start_position.index_,
+            self.tree.end_terminal.end_position.index_,
         )
 
         self._tree_fixer.tree = self.tree
@@ -16,7 +16,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+import sys
+from threading import Lock
+from types import MappingProxyType
 from typing import ClassVar, NamedTuple
 
 from .common import (
@@ -26,7 +32,12 @@ from .common import (
     TransmuterPosition,
     TransmuterException,
 )
-from .lexical import TransmuterTerminalTag, TransmuterTerminal, TransmuterLexer
+from .lexical import (
+    TransmuterTerminalTag,
+    TransmuterTerminal,
+    TransmuterTerminalSource,
+    TransmuterLexer,
+)
 
 transmuter_selection: range = range(1)
 
@@ -42,30 +53,136 @@ class TransmuterNonterminalType(metaclass=TransmuterMeta):
     ) -> set[type["TransmuterNonterminalType"]]:
         return set()
 
+    # None disables the prediction of calls to the nonterminal type
+    @staticmethod
+    def first_terminal_tags(
+        conditions: TransmuterConditions,
+    ) -> set[type[TransmuterTerminalTag]] | None:
+        return None
+
+    @staticmethod
+    def nullable(conditions: TransmuterConditions) -> bool:
+        return False
+
+    # Deterministic nonterminal types are parsed through descend_single
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return False
+
+    # Derivations of commit nonterminal types called by the start nonterminal
+    # type are never backtracked over, so everything before them is discarded
+    @staticmethod
+    def commit(conditions: TransmuterConditions) -> bool:
+        return False
+
+    # Levels of increasing precedence of the terminal tags of the options
+    @staticmethod
+    def precedences(
+        conditions: TransmuterConditions,
+    ) -> list["TransmuterPrecedence"]:
+        return []
+
     @classmethod
-    def ascend(
+    def descend(
         cls,
         parser: "TransmuterParser",
         current_state: "TransmuterParsingState",
-    ) -> None:
-        current_states = {current_state}
-        assert cls in parser.nonterminal_types_ascend_parents
-
-        for ascend_parent in parser.nonterminal_types_ascend_parents[cls]:
-            try:
-                parser.call(ascend_parent, current_states, True)
-            except TransmuterInternalError:
-                pass
+    ) -> set["TransmuterParsingState"]:
+        raise NotImplementedError()
 
     @classmethod
-    def descend(
+    def descend_single(
         cls,
         parser: "TransmuterParser",
         current_state: "TransmuterParsingState",
-    ) -> set["TransmuterParsingState"]:
+    ) -> "TransmuterParsingState | None":
+        raise NotImplementedError()
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> "TransmuterExpression":
         raise NotImplementedError()
 
 
+class TransmuterPrecedence(NamedTuple):
+    left: bool
+    terminal_tags: set[type[TransmuterTerminalTag]]
+
+
+def transmuter_compute_precedence_levels(
+    precedences: list[TransmuterPrecedence],
+) -> dict[type[TransmuterTerminalTag], tuple[int, bool]]:
+    levels = {}
+
+    for level, precedence in enumerate(precedences):
+        for terminal_tag in precedence.terminal_tags:
+            levels[terminal_tag] = (level, precedence.left)
+
+    return levels
+
+
+# A derivation is at the level of its rightmost terminal tag with one. Lower
+# levels dominate, and within a level the derivation splitting last (left
+# associativity) or first (right associativity) dominates.
+def transmuter_dominates(
+    levels: Mapping[type[TransmuterTerminalTag], tuple[int, bool]],
+    epn: "TransmuterEPN",
+    other: "TransmuterEPN",
+) -> bool:
+    level = _transmuter_level(levels, epn)
+    other_level = _transmuter_level(levels, other)
+
+    if level is None or other_level is None:
+        return False
+
+    if level[0] != other_level[0]:
+        return level[0] < other_level[0]
+
+    split = epn.state.split_position.index_
+    other_split = other.state.split_position.index_
+    return split > other_split if level[1] else split < other_split
+
+
+def _transmuter_level(
+    levels: dict[type[TransmuterTerminalTag], tuple[int, bool]],
+    epn: "TransmuterEPN",
+) -> tuple[int, bool] | None:
+    for type_ in reversed(epn.state.string):
+        if type_ in levels:
+            return levels[type_]
+
+    return None
+
+
+# None stands for a conditional expression missing from the given conditions
+class TransmuterSequence(NamedTuple):
+    items: tuple["TransmuterExpression | None", ...]
+
+
+class TransmuterSelection(NamedTuple):
+    options: tuple["TransmuterExpression | None", ...]
+    ordered: bool
+
+
+class TransmuterOptional(NamedTuple):
+    expression: "TransmuterExpression | None"
+    ordered: bool
+
+
+class TransmuterIteration(NamedTuple):
+    expression: "TransmuterExpression | None"
+    ordered: bool
+
+
+TransmuterExpression = (
+    type[TransmuterTerminalTag]
+    | type[TransmuterNonterminalType]
+    | TransmuterSequence
+    | TransmuterSelection
+    | TransmuterOptional
+    | TransmuterIteration
+)
+
+
 class TransmuterParsingState(NamedTuple):
     string: tuple[type[TransmuterTerminalTag | TransmuterNonterminalType], ...]
     start_position: TransmuterPosition
@@ -93,53 +210,50 @@ class TransmuterEPN(NamedTuple):
 
 @dataclass
 class TransmuterBSR:
-    start: (
-        tuple[
-            type[TransmuterNonterminalType],
-            TransmuterPosition,
-            TransmuterPosition,
-        ]
-        | None
-    ) = field(default=None, init=False, repr=False)
+    start: tuple[type[TransmuterNonterminalType], int, int] | None = field(
+        default=None, init=False, repr=False
+    )
     epns: dict[
         tuple[
             type[TransmuterNonterminalType]
             | tuple[
                 type[TransmuterTerminalTag | TransmuterNonterminalType], ...
             ],
-            TransmuterPosition,
-            TransmuterPosition,
+            int,
+            int,
         ],
         set[TransmuterEPN],
     ] = field(default_factory=dict, init=False, repr=False)
+    # Number of EPNs, as each key may hold many, kept as they are added and
+    # discarded
+    epn_count: int = field(default=0, init=False, repr=False)
 
     def add(self, epn: TransmuterEPN) -> None:
         key = (
             epn.type_ if epn.type_ is not None else epn.state.string,
-            epn.state.start_position,
+            epn.state.start_position.index_,
             (
-                epn.state.end_terminal.end_position
+                epn.state.end_terminal.end_position.index_
                 if epn.state.end_terminal is not None
-                else epn.state.split_position
+                else epn.state.split_position.index_
             ),
         )
 
         if key not in self.epns:
             self.epns[key] = set()
 
-        self.epns[key].add(epn)
+        if epn not in self.epns[key]:
+            self.epns[key].add(epn)
+            self.epn_count += 1
 
     def left_children(self, parent: TransmuterEPN) -> set[TransmuterEPN]:
         key = (
             parent.state.string[:-1],
-            parent.state.start_position,
-            parent.state.split_position,
+            parent.state.start_position.index_,
+            parent.state.split_position.index_,
         )
 
-        if (
-            parent.state.start_position == parent.state.split_position
-            or key not in self.epns
-        ):
+        if key[1] == key[2] or key not in self.epns:
             return set()
 
         return self.epns[key]
@@ -151,13 +265,12 @@ class TransmuterBSR:
         assert len(parent.state.string) > 0
         key = (
             parent.state.string[-1],
-            parent.state.split_position,
-            parent.state.end_terminal.end_position,
+            parent.state.split_position.index_,
+            parent.state.end_terminal.end_position.index_,
         )
 
         if (
-            parent.state.split_position
-            == parent.state.end_terminal.end_position
+            key[1] == key[2]
             or issubclass(parent.state.string[-1], TransmuterTerminalTag)
             or key not in self.epns
         ):
@@ -165,255 +278,2322 @@ class TransmuterBSR:
 
         return self.epns[key]
 
+    def discard(self, epn: TransmuterEPN) -> None:
+        key = (
+            epn.type_ if epn.type_ is not None else epn.state.string,
+            epn.state.start_position.index_,
+            (
+                epn.state.end_terminal.end_position.index_
+                if epn.state.end_terminal is not None
+                else epn.state.split_position.index_
+            ),
+        )
 
-@dataclass
-class TransmuterParser:
-    NONTERMINAL_TYPES: ClassVar[list[type[TransmuterNonterminalType]]]
+        if key not in self.epns or epn not in self.epns[key]:
+            return
 
-    lexer: TransmuterLexer
-    nonterminal_types_ascend_parents: dict[
-        type[TransmuterNonterminalType], list[type[TransmuterNonterminalType]]
-    ] = field(init=False, repr=False)
-    bsr: TransmuterBSR = field(init=False, repr=False)
-    _nonterminal_type_start: type[TransmuterNonterminalType] = field(
-        init=False, repr=False
-    )
-    _nonterminal_types_first: dict[
-        type[TransmuterNonterminalType], set[type[TransmuterNonterminalType]]
-    ] = field(init=False, repr=False)
-    _eoi: TransmuterTerminal | None = field(
-        default=None, init=False, repr=False
-    )
-    _memo: dict[
-        tuple[type[TransmuterNonterminalType], TransmuterPosition],
-        set[TransmuterTerminal],
-    ] = field(default_factory=dict, init=False, repr=False)
+        self.epns[key].remove(epn)
+        self.epn_count -= 1
 
-    def __post_init__(self) -> None:
-        self.nonterminal_types_ascend_parents = {}
-        self.bsr = TransmuterBSR()
-        self._nonterminal_types_first = {}
-        nonterminal_type_start = None
-        nonterminal_types_first = {}
+        if len(self.epns[key]) == 0:
+            del self.epns[key]
 
-        for nonterminal_type in self.NONTERMINAL_TYPES:
-            if (
-                nonterminal_type.start(self.lexer.conditions)
-                and nonterminal_type_start != nonterminal_type
-            ):
-                if nonterminal_type_start is not None:
-                    raise TransmuterMultipleStartsError()
+    def clear(self) -> None:
+        self.start = None
+        self.epns.clear()
+        self.epn_count = 0
 
-                nonterminal_type_start = nonterminal_type
+    # Discards in place the EPNs not reachable from the start, as
+    # TransmuterBSRPruner does, returning how many were discarded
+    def prune(self) -> int:
+        if self.start is None or self.start not in self.epns:
+            return 0
 
-            nonterminal_types_first[nonterminal_type] = nonterminal_type.first(
-                self.lexer.conditions
-            )
+        marked = {self.start}
+        worklist = [self.start]
 
-        if nonterminal_type_start is None:
-            raise TransmuterNoStartError()
+        while len(worklist) > 0:
+            for epn in self.epns[worklist.pop()]:
+                string = epn.state.string
+                start = epn.state.start_position.index_
+                split = epn.state.split_position.index_
+                keys = []
 
-        self._nonterminal_type_start = nonterminal_type_start
-        sccs = transmuter_compute_sccs(nonterminal_types_first)
+                if start != split:
+                    keys.append((string[:-1], start, split))
 
-        for scc in sccs:
-            assert scc <= nonterminal_types_first.keys()
+                if epn.state.end_terminal is not None:
+                    end = epn.state.end_terminal.end_position.index_
 
-            if len(scc) == 1:
-                v = scc.pop()
-                scc.add(v)
+                    if split != end and not issubclass(
+                        string[-1], TransmuterTerminalTag
+                    ):
+                        keys.append((string[-1], split, end))
 
-                if v not in nonterminal_types_first[v]:
-                    continue
+                for key in keys:
+                    if key not in marked and key in self.epns:
+                        marked.add(key)
+                        worklist.append(key)
 
-            for v in scc:
-                self._nonterminal_types_first[v] = (
-                    scc & nonterminal_types_first[v]
-                )
-                self.nonterminal_types_ascend_parents[v] = [
-                    w for w in scc if v in nonterminal_types_first[w]
-                ]
+        pruned = 0
 
-    def parse(self) -> None:
-        try:
-            self.call(
-                self._nonterminal_type_start,
-                {
-                    TransmuterParsingState(
-                        (),
-                        self.lexer.start_position,
-                        self.lexer.start_position,
-                        None,
-                    )
-                },
-            )
-        except TransmuterInternalError:
-            pass
+        for key in [key for key in self.epns if key not in marked]:
+            pruned += len(self.epns[key])
+            del self.epns[key]
 
-        if self._eoi is None:
-            return
+        self.epn_count -= pruned
+        return pruned
 
-        key = (
-            self._nonterminal_type_start,
-            self.lexer.start_position,
-            self._eoi.end_position,
-        )
+    def discard_before(self, index_: int) -> None:
+        self.epns = {
+            key: epns for key, epns in self.epns.items() if key[1] >= index_
+        }
+        self.epn_count = sum(len(epns) for epns in self.epns.values())
 
-        if key not in self.bsr.epns:
-            raise TransmuterNoDerivationError(self._eoi.start_position)
+    # Keeps the EPNs starting at the kept indexes, shifting the ones starting
+    # at or after the given index, whose positions were already shifted
+    def edit(
+        self, kept: Callable[[int], bool], index_: int | None, delta: int
+    ) -> None:
+        self.epns = {
+            (
+                (key[0], key[1] + delta, key[2] + delta)
+                if index_ is not None and key[1] >= index_
+                else key
+            ): epns
+            for key, epns in self.epns.items()
+            if kept(key[1])
+        }
+        self.epn_count = sum(len(epns) for epns in self.epns.values())
 
-        if self.lexer.next_terminal(self._eoi) is not None:
-            assert self._eoi.next is not None
-            raise TransmuterNoDerivationError(self._eoi.next.start_position)
 
-        self.bsr.start = key
+@dataclass
+class TransmuterCompactBSR(TransmuterBSR):
+    # Each EPN is packed as (slot, split index, has end terminal) inside an
+    # array keyed by the packed (label, start index, end index) of the EPN.
+    # Arrays longer than the given length also get a set of their values, so
+    # that adding to them does not scan them.
+    INDEX_BITS: ClassVar[int] = 32
+    MEMBERS_LENGTH: ClassVar[int] = 8
+
+    _labels: dict[
+        type[TransmuterNonterminalType]
+        | tuple[type[TransmuterTerminalTag | TransmuterNonterminalType], ...],
+        int,
+    ] = field(init=False, repr=False)
+    _labels_list: list[
+        type[TransmuterNonterminalType]
+        | tuple[type[TransmuterTerminalTag | TransmuterNonterminalType], ...]
+    ] = field(init=False, repr=False)
+    _slots: dict[
+        tuple[
+            type[TransmuterNonterminalType] | None,
+            tuple[
+                type[TransmuterTerminalTag | TransmuterNonterminalType], ...
+            ],
+        ],
+        int,
+    ] = field(init=False, repr=False)
+    _slots_list: list[
+        tuple[
+            type[TransmuterNonterminalType] | None,
+            tuple[
+                type[TransmuterTerminalTag | TransmuterNonterminalType], ...
+            ],
+            int,
+        ]
+    ] = field(init=False, repr=False)
+    _positions: dict[int, TransmuterPosition] = field(init=False, repr=False)
+    _terminals: dict[int, TransmuterTerminal] = field(init=False, repr=False)
+    _epns: dict[int, array[int]] = field(init=False, repr=False)
+    _members: dict[int, set[int]] = field(init=False, repr=False)
 
-    def call(
+    @property
+    def epns(self) -> "_TransmuterCompactBSREPNs":
+        return _TransmuterCompactBSREPNs(self)
+
+    @epns.setter
+    def epns(
         self,
-        cls: type[TransmuterTerminalTag | TransmuterNonterminalType],
-        current_states: set[TransmuterParsingState],
-        ascend: type[TransmuterNonterminalType] | bool | None = None,
-    ) -> set[TransmuterParsingState]:
-        next_states = set()
+        epns: Mapping[
+            tuple[
+                type[TransmuterNonterminalType]
+                | tuple[
+                    type[TransmuterTerminalTag | TransmuterNonterminalType],
+                    ...,
+                ],
+                int,
+                int,
+            ],
+            set[TransmuterEPN],
+        ],
+    ) -> None:
+        if isinstance(epns, _TransmuterCompactBSREPNs):
+            self._labels = epns.bsr._labels
+            self._labels_list = epns.bsr._labels_list
+            self._slots = epns.bsr._slots
+            self._slots_list = epns.bsr._slots_list
+            self._positions = epns.bsr._positions
+            self._terminals = epns.bsr._terminals
+            self._epns = epns.bsr._epns
+            self._members = epns.bsr._members
+            self.epn_count = epns.bsr.epn_count
+            return
 
-        if issubclass(cls, TransmuterTerminalTag):
-            for current_state in current_states:
-                next_state = self._call_single_terminal_tag(cls, current_state)
+        self._labels = {}
+        self._labels_list = []
+        self._slots = {}
+        self._slots_list = []
+        self._positions = {}
+        self._terminals = {}
+        self._epns = {}
+        self._members = {}
+        self.epn_count = 0
 
-                if next_state is not None:
-                    next_states.add(next_state)
-        else:
-            assert issubclass(cls, TransmuterNonterminalType)
+        for key in epns:
+            for epn in epns[key]:
+                self.add(epn)
 
-            if not isinstance(ascend, bool):
-                ascend = (
-                    ascend is None
-                    or ascend not in self._nonterminal_types_first
-                    or cls not in self._nonterminal_types_first[ascend]
-                ) and cls in self._nonterminal_types_first
+    def add(self, epn: TransmuterEPN) -> None:
+        slot = self._slots.get((epn.type_, epn.state.string))
 
-            for current_state in current_states:
-                next_states |= self._call_single_nonterminal_type(
-                    cls, current_state, ascend
-                )
+        if slot is None:
+            slot = self._add_slot(epn.type_, epn.state.string)
 
-        if len(next_states) == 0:
-            raise TransmuterInternalError()
+        self._positions[epn.state.start_position.index_] = (
+            epn.state.start_position
+        )
+        self._positions[epn.state.split_position.index_] = (
+            epn.state.split_position
+        )
 
-        return next_states
+        if epn.state.end_terminal is not None:
+            self._terminals[epn.state.end_terminal.end_position.index_] = (
+                epn.state.end_terminal
+            )
 
-    def _call_single_terminal_tag(
-        self,
-        cls: type[TransmuterTerminalTag],
-        current_state: TransmuterParsingState,
-    ) -> TransmuterParsingState | None:
-        self.bsr.add(TransmuterEPN(None, current_state))
-        next_terminal = self.lexer.next_terminal(current_state.end_terminal)
+        key, value = self._pack_epn(slot, epn)
+        epns = self._epns.get(key)
 
-        if next_terminal is not None and (
-            self._eoi is None
-            or self._eoi.start_position.index_
-            < next_terminal.start_position.index_
-        ):
-            self._eoi = next_terminal
+        if epns is None:
+            self._epns[key] = array("Q", (value,))
+            self.epn_count += 1
+            return
 
-        if next_terminal is None or cls not in next_terminal.tags:
-            return None
+        members = self._members.get(key)
 
-        return TransmuterParsingState(
-            current_state.string + (cls,),
-            current_state.start_position,
-            (
-                current_state.end_terminal.end_position
-                if current_state.end_terminal is not None
-                else current_state.split_position
-            ),
-            next_terminal,
-        )
+        if members is None:
+            if value in epns:
+                return
 
-    def _call_single_nonterminal_type(
-        self,
-        cls: type[TransmuterNonterminalType],
-        current_state: TransmuterParsingState,
-        ascend: bool,
-    ) -> set[TransmuterParsingState]:
-        self.bsr.add(TransmuterEPN(None, current_state))
-        current_state_end_position = (
-            current_state.end_terminal.end_position
-            if current_state.end_terminal is not None
-            else current_state.split_position
-        )
+            epns.append(value)
 
-        if ascend or (cls, current_state_end_position) not in self._memo:
-            if (cls, current_state_end_position) not in self._memo:
-                self._memo[cls, current_state_end_position] = set()
+            if len(epns) > self.MEMBERS_LENGTH:
+                self._members[key] = set(epns)
+        elif value not in members:
+            members.add(value)
+            epns.append(value)
+        else:
+            return
 
-            initial_memo_len = len(self._memo[cls, current_state_end_position])
+        self.epn_count += 1
 
-            try:
-                next_states = cls.descend(
-                    self,
-                    TransmuterParsingState(
-                        (),
-                        current_state_end_position,
-                        current_state_end_position,
-                        current_state.end_terminal,
-                    ),
-                )
-            except TransmuterInternalError:
-                pass
-            else:
-                for next_state in next_states:
-                    self.bsr.add(TransmuterEPN(cls, next_state))
-                    assert next_state.end_terminal is not None
-                    self._memo[cls, current_state_end_position].add(
-                        next_state.end_terminal
-                    )
+    def discard(self, epn: TransmuterEPN) -> None:
+        slot = self._slots.get((epn.type_, epn.state.string))
 
-                if ascend and initial_memo_len != len(
-                    self._memo[cls, current_state_end_position]
-                ):
-                    cls.ascend(self, current_state)
+        if slot is None:
+            return
 
-        return {
-            TransmuterParsingState(
-                current_state.string + (cls,),
-                current_state.start_position,
-                current_state_end_position,
-                next_terminal,
-            )
-            for next_terminal in self._memo[cls, current_state_end_position]
-        }
+        key, value = self._pack_epn(slot, epn)
+        epns = self._epns.get(key)
 
+        if epns is None:
+            return
 
-class TransmuterSyntacticError(TransmuterException):
-    def __init__(self, position: TransmuterPosition, description: str) -> None:
-        super().__init__(position, "Syntactic Error", description)
+        members = self._members.get(key)
 
+        if members is None:
+            if value not in epns:
+                return
+        elif value not in members:
+            return
+        else:
+            members.remove(value)
 
-class TransmuterNoStartError(TransmuterSyntacticError):
-    def __init__(self) -> None:
-        super().__init__(
-            TransmuterPosition("<conditions>", 0, 0, 0),
-            "Could not match any starting symbol from given conditions.",
-        )
+        epns.remove(value)
+        self.epn_count -= 1
 
+        if len(epns) == 0:
+            del self._epns[key]
+            self._members.pop(key, None)
 
-class TransmuterMultipleStartsError(TransmuterSyntacticError):
-    def __init__(self) -> None:
-        super().__init__(
-            TransmuterPosition("<conditions>", 0, 0, 0),
-            "Matched multiple starting symbols from given conditions.",
-        )
+    def left_children(self, parent: TransmuterEPN) -> set[TransmuterEPN]:
+        start = parent.state.start_position.index_
+        split = parent.state.split_position.index_
 
+        if start == split:
+            return set()
 
-class TransmuterNoDerivationError(TransmuterSyntacticError):
-    def __init__(self, position: TransmuterPosition) -> None:
-        super().__init__(
-            position, "Could not derive input from any production rule."
-        )
+        label = self._labels.get(parent.state.string[:-1])
 
+        if label is None:
+            return set()
 
-class TransmuterInternalError(TransmuterNoDerivationError):
-    def __init__(self) -> None:
-        super().__init__(TransmuterPosition("<internal>", 0, 0, 0))
+        return self._unpack_epns(self._pack_key(label, start, split))
+
+    def right_children(self, parent: TransmuterEPN) -> set[TransmuterEPN]:
+        if parent.state.end_terminal is None:
+            return set()
+
+        assert len(parent.state.string) > 0
+        split = parent.state.split_position.index_
+        end = parent.state.end_terminal.end_position.index_
+
+        if split == end or issubclass(
+            parent.state.string[-1], TransmuterTerminalTag
+        ):
+            return set()
+
+        label = self._labels.get(parent.state.string[-1])
+
+        if label is None:
+            return set()
+
+        return self._unpack_epns(self._pack_key(label, split, end))
+
+    # Labels and slots only depend on the grammar, so they are kept
+    def clear(self) -> None:
+        self.start = None
+        self._positions.clear()
+        self._terminals.clear()
+        self._epns.clear()
+        self._members.clear()
+        self.epn_count = 0
+
+    # Marks packed keys, without unpacking any EPN, and also discards the
+    # positions and terminals only the discarded EPNs referenced
+    def prune(self) -> int:
+        if self.start is None:
+            return 0
+
+        label = self._labels.get(self.start[0])
+
+        if label is None:
+            return 0
+
+        start_key = self._pack_key(label, self.start[1], self.start[2])
+
+        if start_key not in self._epns:
+            return 0
+
+        mask = (1 << self.INDEX_BITS) - 1
+        # Labels of the left and right children of each slot
+        children_labels: dict[int, tuple[int | None, int | None]] = {}
+        marked = {start_key}
+        worklist = [start_key]
+        positions = set()
+        terminals = set()
+
+        while len(worklist) > 0:
+            key = worklist.pop()
+            start = key >> self.INDEX_BITS & mask
+            end = key & mask
+            positions.add(start)
+
+            for value in self._epns[key]:
+                slot = value >> self.INDEX_BITS + 1
+                split = value >> 1 & mask
+                positions.add(split)
+
+                if slot not in children_labels:
+                    string = self._slots_list[slot][1]
+                    children_labels[slot] = (
+                        self._labels.get(string[:-1]),
+                        (
+                            self._labels.get(string[-1])
+                            if len(string) > 0
+                            and not issubclass(
+                                string[-1], TransmuterTerminalTag
+                            )
+                            else None
+                        ),
+                    )
+
+                left_label, right_label = children_labels[slot]
+                keys = []
+
+                if start != split and left_label is not None:
+                    keys.append(self._pack_key(left_label, start, split))
+
+                if value & 1:
+                    terminals.add(end)
+
+                    if split != end and right_label is not None:
+                        keys.append(self._pack_key(right_label, split, end))
+
+                for child_key in keys:
+                    if child_key not in marked and child_key in self._epns:
+                        marked.add(child_key)
+                        worklist.append(child_key)
+
+        pruned = 0
+
+        for key in [key for key in self._epns if key not in marked]:
+            pruned += len(self._epns[key])
+            del self._epns[key]
+            self._members.pop(key, None)
+
+        self.epn_count -= pruned
+
+        for i in [i for i in self._positions if i not in positions]:
+            del self._positions[i]
+
+        for i in [i for i in self._terminals if i not in terminals]:
+            del self._terminals[i]
+
+        return pruned
+
+    def discard_before(self, index_: int) -> None:
+        mask = (1 << self.INDEX_BITS) - 1
+        self._epns = {
+            key: epns
+            for key, epns in self._epns.items()
+            if key >> self.INDEX_BITS & mask >= index_
+        }
+        self.epn_count = sum(len(epns) for epns in self._epns.values())
+        self._members = {
+            key: members
+            for key, members in self._members.items()
+            if key in self._epns
+        }
+        self._positions = {
+            i: position
+            for i, position in self._positions.items()
+            if i >= index_
+        }
+        self._terminals = {
+            i: terminal
+            for i, terminal in self._terminals.items()
+            if i >= index_
+        }
+
+    def edit(
+        self, kept: Callable[[int], bool], index_: int | None, delta: int
+    ) -> None:
+        mask = (1 << self.INDEX_BITS) - 1
+        epns = {}
+        members = {}
+
+        for key, values in self._epns.items():
+            start = key >> self.INDEX_BITS & mask
+
+            if not kept(start):
+                continue
+
+            if index_ is not None and start >= index_:
+                key = self._pack_key(
+                    key >> 2 * self.INDEX_BITS,
+                    start + delta,
+                    (key & mask) + delta,
+                )
+                # The split index is packed right above the lowest bit
+                values = array("Q", (value + (delta << 1) for value in values))
+
+            epns[key] = values
+
+            if len(values) > self.MEMBERS_LENGTH:
+                members[key] = set(values)
+
+        self._epns = epns
+        self._members = members
+        self.epn_count = sum(len(values) for values in epns.values())
+
+        if index_ is None:
+            return
+
+        # Shifted indexes take precedence over stale ones
+        self._positions = {
+            i: position
+            for i, position in self._positions.items()
+            if i < index_
+        } | {
+            i + delta: position
+            for i, position in self._positions.items()
+            if i >= index_
+        }
+        self._terminals = {
+            i: terminal
+            for i, terminal in self._terminals.items()
+            if i < index_
+        } | {
+            i + delta: terminal
+            for i, terminal in self._terminals.items()
+            if i >= index_
+        }
+
+    def _add_slot(
+        self,
+        type_: type[TransmuterNonterminalType] | None,
+        string: tuple[
+            type[TransmuterTerminalTag | TransmuterNonterminalType], ...
+        ],
+    ) -> int:
+        label_value = type_ if type_ is not None else string
+        label = self._labels.get(label_value)
+
+        if label is None:
+            label = len(self._labels_list)
+            self._labels[label_value] = label
+            self._labels_list.append(label_value)
+
+        slot = len(self._slots_list)
+        self._slots[type_, string] = slot
+        self._slots_list.append((type_, string, label))
+        return slot
+
+    def _pack_key(self, label: int, start: int, end: int) -> int:
+        return (label << self.INDEX_BITS | start) << self.INDEX_BITS | end
+
+    def _pack_epn(self, slot: int, epn: TransmuterEPN) -> tuple[int, int]:
+        start = epn.state.start_position.index_
+        split = epn.state.split_position.index_
+
+        if epn.state.end_terminal is not None:
+            end = epn.state.end_terminal.end_position.index_
+            value = (slot << self.INDEX_BITS | split) << 1 | 1
+        else:
+            end = split
+            value = (slot << self.INDEX_BITS | split) << 1
+
+        return (self._pack_key(self._slots_list[slot][2], start, end), value)
+
+    def _unpack_epns(self, key: int) -> set[TransmuterEPN]:
+        epns = self._epns.get(key)
+
+        if epns is None:
+            return set()
+
+        mask = (1 << self.INDEX_BITS) - 1
+        start_position = self._positions[key >> self.INDEX_BITS & mask]
+        end = key & mask
+        end_terminal = self._terminals.get(end)
+        unpacked_epns = set()
+
+        for value in epns:
+            type_, string, _ = self._slots_list[value >> self.INDEX_BITS + 1]
+            unpacked_epns.add(
+                TransmuterEPN(
+                    type_,
+                    TransmuterParsingState(
+                        string,
+                        start_position,
+                        self._positions[value >> 1 & mask],
+                        end_terminal if value & 1 else None,
+                    ),
+                )
+            )
+
+        return unpacked_epns
+
+
+@dataclass(eq=False)
+class _TransmuterCompactBSREPNs(
+    Mapping[
+        tuple[
+            type[TransmuterNonterminalType]
+            | tuple[
+                type[TransmuterTerminalTag | TransmuterNonterminalType], ...
+            ],
+            int,
+            int,
+        ],
+        set[TransmuterEPN],
+    ]
+):
+    bsr: TransmuterCompactBSR
+
+    def __contains__(self, key: object) -> bool:
+        packed_key = self._pack_key(key)
+        return packed_key is not None and packed_key in self.bsr._epns
+
+    def __getitem__(
+        self,
+        key: tuple[
+            type[TransmuterNonterminalType]
+            | tuple[
+                type[TransmuterTerminalTag | TransmuterNonterminalType], ...
+            ],
+            int,
+            int,
+        ],
+    ) -> set[TransmuterEPN]:
+        packed_key = self._pack_key(key)
+
+        if packed_key is None or packed_key not in self.bsr._epns:
+            raise KeyError(key)
+
+        return self.bsr._unpack_epns(packed_key)
+
+    def __iter__(
+        self,
+    ) -> Iterator[
+        tuple[
+            type[TransmuterNonterminalType]
+            | tuple[
+                type[TransmuterTerminalTag | TransmuterNonterminalType], ...
+            ],
+            int,
+            int,
+        ]
+    ]:
+        mask = (1 << self.bsr.INDEX_BITS) - 1
+
+        for key in self.bsr._epns:
+            yield (
+                self.bsr._labels_list[key >> 2 * self.bsr.INDEX_BITS],
+                key >> self.bsr.INDEX_BITS & mask,
+                key & mask,
+            )
+
+    def __len__(self) -> int:
+        return len(self.bsr._epns)
+
+    def _pack_key(self, key: object) -> int | None:
+        if not isinstance(key, tuple) or len(key) != 3:
+            return None
+
+        label = self.bsr._labels.get(key[0])
+
+        if label is None:
+            return None
+
+        return self.bsr._pack_key(label, key[1], key[2])
+
+
+# Fixpoint of a left-recursive SCC at a given position, where only newly
+# added end terminals of a nonterminal type are ascended to its parents,
+# except to the parent that already consumed them when calling it
+@dataclass
+class _TransmuterAscent:
+    worklist: list[
+        tuple[
+            type[TransmuterNonterminalType],
+            set[TransmuterTerminal],
+            type[TransmuterNonterminalType] | None,
+        ]
+    ] = field(default_factory=list)
+    nonterminal_type: type[TransmuterNonterminalType] | None = None
+    next_terminals: set[TransmuterTerminal] = field(default_factory=set)
+
+
+# Tables of a parser which only depend on its nonterminal types and
+# conditions, shared by the parsers for them across threads. Every field is
+# immutable, mappings being read-only views of dicts no one else holds.
+@dataclass(frozen=True)
+class TransmuterParserTables:
+    nonterminal_type_start: type[TransmuterNonterminalType]
+    nonterminal_types_first: Mapping[
+        type[TransmuterNonterminalType],
+        frozenset[type[TransmuterNonterminalType]],
+    ]
+    nonterminal_types_first_terminal_tags: Mapping[
+        type[TransmuterNonterminalType], frozenset[type[TransmuterTerminalTag]]
+    ]
+    nonterminal_types_deterministic: frozenset[type[TransmuterNonterminalType]]
+    nonterminal_types_scc: Mapping[
+        type[TransmuterNonterminalType],
+        frozenset[type[TransmuterNonterminalType]],
+    ]
+    nonterminal_types_ascend_parents: Mapping[
+        type[TransmuterNonterminalType],
+        tuple[type[TransmuterNonterminalType], ...],
+    ]
+    nonterminal_types_commit: frozenset[type[TransmuterNonterminalType]]
+    nonterminal_types_levels: Mapping[
+        type[TransmuterNonterminalType],
+        Mapping[type[TransmuterTerminalTag], tuple[int, bool]],
+    ]
+
+
+@dataclass
+class TransmuterParser:
+    NONTERMINAL_TYPES: ClassVar[list[type[TransmuterNonterminalType]]]
+    # Implementations of nonterminal types specialized for a fixed set of
+    # conditions, which are called in their place while the nonterminal types
+    # themselves are still the ones in the BSR
+    SPECIALIZED_NONTERMINAL_TYPES: ClassVar[
+        dict[type[TransmuterNonterminalType], type[TransmuterNonterminalType]]
+    ] = {}
+    # Tables precomputed for each conditions value, so that parsers for
+    # them do not compute their own
+    TABLES: ClassVar[dict[TransmuterConditions, TransmuterParserTables]] = {}
+
+    lexer: TransmuterTerminalSource
+    bsr_type: type[TransmuterBSR] = TransmuterBSR
+    # Receives the forest of each committed derivation, which is then
+    # discarded from the BSR along with everything before it
+    commit_callback: Callable[[TransmuterBSR], None] | None = None
+    # Discards derivations dominated by declared precedences while parsing,
+    # instead of leaving them to TransmuterBSRPrecedenceDisambiguator
+    early_disambiguation: bool = True
+    nonterminal_types_ascend_parents: Mapping[
+        type[TransmuterNonterminalType],
+        tuple[type[TransmuterNonterminalType], ...],
+    ] = field(init=False, repr=False)
+    bsr: TransmuterBSR = field(init=False, repr=False)
+    _nonterminal_type_start: type[TransmuterNonterminalType] = field(
+        init=False, repr=False
+    )
+    _nonterminal_types_first: Mapping[
+        type[TransmuterNonterminalType],
+        frozenset[type[TransmuterNonterminalType]],
+    ] = field(init=False, repr=False)
+    _nonterminal_types_first_terminal_tags: Mapping[
+        type[TransmuterNonterminalType], frozenset[type[TransmuterTerminalTag]]
+    ] = field(init=False, repr=False)
+    _nonterminal_types_deterministic: frozenset[
+        type[TransmuterNonterminalType]
+    ] = field(init=False, repr=False)
+    _nonterminal_types_scc: Mapping[
+        type[TransmuterNonterminalType],
+        frozenset[type[TransmuterNonterminalType]],
+    ] = field(init=False, repr=False)
+    _nonterminal_types_commit: frozenset[type[TransmuterNonterminalType]] = (
+        field(init=False, repr=False)
+    )
+    _nonterminal_types_levels: Mapping[
+        type[TransmuterNonterminalType],
+        Mapping[type[TransmuterTerminalTag], tuple[int, bool]],
+    ] = field(init=False, repr=False)
+    _depth: int = field(default=0, init=False, repr=False)
+    _eoi: TransmuterTerminal | None = field(
+        default=None, init=False, repr=False
+    )
+    _memo: dict[
+        tuple[type[TransmuterNonterminalType], int], set[TransmuterTerminal]
+    ] = field(default_factory=dict, init=False, repr=False)
+    _memo_deterministic: dict[
+        tuple[type[TransmuterNonterminalType], int], TransmuterTerminal | None
+    ] = field(default_factory=dict, init=False, repr=False)
+    _ascents: dict[
+        tuple[frozenset[type[TransmuterNonterminalType]], int],
+        _TransmuterAscent,
+    ] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.bsr = self.bsr_type()
+        tables = self.TABLES.get(self.lexer.conditions)
+
+        if tables is None:
+            tables = self.compute_tables(self.lexer.conditions)
+
+        self.nonterminal_types_ascend_parents = (
+            tables.nonterminal_types_ascend_parents
+        )
+        self._nonterminal_type_start = tables.nonterminal_type_start
+        self._nonterminal_types_first = tables.nonterminal_types_first
+        self._nonterminal_types_first_terminal_tags = (
+            tables.nonterminal_types_first_terminal_tags
+        )
+        self._nonterminal_types_deterministic = (
+            tables.nonterminal_types_deterministic
+        )
+        self._nonterminal_types_scc = tables.nonterminal_types_scc
+        self._nonterminal_types_commit = (
+            tables.nonterminal_types_commit
+            if self.commit_callback is not None
+            else frozenset()
+        )
+        self._nonterminal_types_levels = (
+            tables.nonterminal_types_levels
+            if self.early_disambiguation
+            else MappingProxyType({})
+        )
+
+    @classmethod
+    def compute_tables(
+        cls, conditions: TransmuterConditions
+    ) -> TransmuterParserTables:
+        nonterminal_type_start = None
+        nonterminal_types_first = {}
+        scc_nonterminal_types_first = {}
+        nonterminal_types_first_terminal_tags = {}
+        nonterminal_types_deterministic = set()
+        nonterminal_types_scc = {}
+        nonterminal_types_ascend_parents = {}
+        nonterminal_types_commit = set()
+        nonterminal_types_levels = {}
+
+        for nonterminal_type in cls.NONTERMINAL_TYPES:
+            specialized = cls.SPECIALIZED_NONTERMINAL_TYPES.get(
+                nonterminal_type, nonterminal_type
+            )
+
+            if (
+                specialized.start(conditions)
+                and nonterminal_type_start != nonterminal_type
+            ):
+                if nonterminal_type_start is not None:
+                    raise TransmuterMultipleStartsError()
+
+                nonterminal_type_start = nonterminal_type
+
+            nonterminal_types_first[nonterminal_type] = specialized.first(
+                conditions
+            )
+            first_terminal_tags = specialized.first_terminal_tags(conditions)
+
+            if first_terminal_tags is not None and not specialized.nullable(
+                conditions
+            ):
+                nonterminal_types_first_terminal_tags[nonterminal_type] = (
+                    frozenset(first_terminal_tags)
+                )
+
+            if specialized.deterministic(conditions):
+                nonterminal_types_deterministic.add(nonterminal_type)
+
+            if specialized.commit(conditions):
+                nonterminal_types_commit.add(nonterminal_type)
+
+            precedences = specialized.precedences(conditions)
+
+            if len(precedences) > 0:
+                nonterminal_types_levels[nonterminal_type] = (
+                    transmuter_compute_precedence_levels(precedences)
+                )
+
+        if nonterminal_type_start is None:
+            raise TransmuterNoStartError()
+
+        sccs = transmuter_compute_sccs(nonterminal_types_first)
+
+        for scc in sccs:
+            assert scc <= nonterminal_types_first.keys()
+
+            if len(scc) == 1:
+                v = scc.pop()
+                scc.add(v)
+
+                if v not in nonterminal_types_first[v]:
+                    continue
+
+            frozen_scc = frozenset(scc)
+
+            for v in scc:
+                scc_nonterminal_types_first[v] = (
+                    scc & nonterminal_types_first[v]
+                )
+                nonterminal_types_scc[v] = frozen_scc
+                nonterminal_types_ascend_parents[v] = [
+                    w for w in scc if v in nonterminal_types_first[w]
+                ]
+
+        # Left-recursive nonterminal types need the generalized engine
+        nonterminal_types_deterministic -= scc_nonterminal_types_first.keys()
+
+        # A left-recursive start nonterminal type may ascend over any commit
+        if nonterminal_type_start in scc_nonterminal_types_first:
+            nonterminal_types_commit.clear()
+
+        return TransmuterParserTables(
+            nonterminal_type_start,
+            MappingProxyType(
+                {
+                    v: frozenset(first)
+                    for v, first in scc_nonterminal_types_first.items()
+                }
+            ),
+            MappingProxyType(nonterminal_types_first_terminal_tags),
+            frozenset(nonterminal_types_deterministic),
+            MappingProxyType(nonterminal_types_scc),
+            MappingProxyType(
+                {
+                    v: tuple(parents)
+                    for v, parents in nonterminal_types_ascend_parents.items()
+                }
+            ),
+            frozenset(nonterminal_types_commit),
+            MappingProxyType(
+                {
+                    v: MappingProxyType(levels)
+                    for v, levels in nonterminal_types_levels.items()
+                }
+            ),
+        )
+
+    # Parses another input with the same lexer, BSR and tables, clearing them
+    # in place, so the forest of the previous input must be consumed before
+    def reset(self, filename: str, input: str) -> None:
+        assert isinstance(self.lexer, TransmuterLexer)
+        self.lexer.reset(filename, input)
+        self.bsr.clear()
+        self._depth = 0
+        self._eoi = None
+        self._memo.clear()
+        self._memo_deterministic.clear()
+        self._ascents.clear()
+
+    # Hands the forest over, so that it outlives the next parse
+    def take_bsr(self) -> TransmuterBSR:
+        bsr = self.bsr
+        self.bsr = self.bsr_type()
+        return bsr
+
+    # Pruning discards in place the EPNs not reachable from the start, which
+    # TransmuterBSRPruner would otherwise copy into a new BSR, returning how
+    # many were discarded
+    def parse(self, prune: bool = False) -> int | None:
+        # Memo and BSR keys use input indexes, so the start position must be
+        # moved past any leading ignored terminals before it is first used.
+        self.lexer.next_terminal(None)
+        self._derive()
+
+        if self._eoi is None:
+            return 0 if prune else None
+
+        key = (
+            self._nonterminal_type_start,
+            self.lexer.start_position.index_,
+            self._eoi.end_position.index_,
+        )
+
+        if key not in self.bsr.epns:
+            raise TransmuterNoDerivationError(self._eoi.start_position)
+
+        if self.lexer.next_terminal(self._eoi) is not None:
+            assert self._eoi.next is not None
+            raise TransmuterNoDerivationError(self._eoi.next.start_position)
+
+        self.bsr.start = key
+        return self._prune() if prune else None
+
+    def _prune(self) -> int:
+        return self.bsr.prune()
+
+    # Parses the input as a sequence of derivations of the given nonterminal
+    # type through the descent engine, yielding the forest of each one as
+    # soon as every derivation of the input read so far agrees on it.
+    # Derivations spanning a top-level ambiguity are yielded together, in
+    # input order, once it is resolved.
+    def parse_stream(
+        self, nonterminal_type: type[TransmuterNonterminalType]
+    ) -> Iterator[TransmuterBSR]:
+        self.lexer.next_terminal(None)
+        current_terminals: set[TransmuterTerminal | None] = {None}
+        steps: list[
+            list[
+                tuple[
+                    TransmuterTerminal | None,
+                    tuple[type[TransmuterNonterminalType], int, int],
+                    TransmuterTerminal,
+                ]
+            ]
+        ] = []
+
+        while True:
+            step = []
+
+            for current_terminal in current_terminals:
+                position = (
+                    current_terminal.end_position
+                    if current_terminal is not None
+                    else self.lexer.start_position
+                )
+                next_states = self.call(
+                    nonterminal_type,
+                    {
+                        TransmuterParsingState(
+                            (), position, position, current_terminal
+                        )
+                    },
+                )
+
+                for next_state in next_states:
+                    assert next_state.end_terminal is not None
+                    end = next_state.end_terminal.end_position.index_
+
+                    # Empty derivations would be iterated forever
+                    if end != position.index_:
+                        step.append(
+                            (
+                                current_terminal,
+                                (nonterminal_type, position.index_, end),
+                                next_state.end_terminal,
+                            )
+                        )
+
+            if len(step) == 0:
+                break
+
+            steps.append(step)
+            current_terminals = {e[2] for e in step}
+
+            if len(current_terminals) == 1:
+                yield from self._flush_stream(steps, current_terminals)
+
+        if self._eoi is None:
+            return
+
+        if self._eoi not in current_terminals:
+            raise TransmuterNoDerivationError(self._eoi.start_position)
+
+        if self.lexer.next_terminal(self._eoi) is not None:
+            assert self._eoi.next is not None
+            raise TransmuterNoDerivationError(self._eoi.next.start_position)
+
+        yield from self._flush_stream(steps, {self._eoi})
+
+    def _flush_stream(
+        self,
+        steps: list[
+            list[
+                tuple[
+                    TransmuterTerminal | None,
+                    tuple[type[TransmuterNonterminalType], int, int],
+                    TransmuterTerminal,
+                ]
+            ]
+        ],
+        end_terminals: set[TransmuterTerminal | None],
+    ) -> list[TransmuterBSR]:
+        keys = set()
+        next_terminals = end_terminals
+
+        # Only derivations leading to the given end terminals are kept
+        for step in reversed(steps):
+            current_terminals = set()
+
+            for current_terminal, key, next_terminal in step:
+                if next_terminal in next_terminals:
+                    keys.add(key)
+                    current_terminals.add(current_terminal)
+
+            next_terminals = current_terminals
+
+        forests = [
+            self._forest(key)
+            for key in sorted(keys, key=lambda key: (key[1], key[2]))
+        ]
+        steps.clear()
+
+        if len(keys) > 0:
+            self._discard_before(max(key[2] for key in keys))
+
+        return forests
+
+    # Parses a derivation of the given nonterminal type through the descent
+    # engine, from the given index instead of the start of the input and up to
+    # the given index instead of the longest derivation. Indexes must not be
+    # inside terminals, and repeated calls share the memos and BSR.
+    def parse_at(
+        self,
+        nonterminal_type: type[TransmuterNonterminalType],
+        start_index: int | None = None,
+        end_index: int | None = None,
+    ) -> None:
+        self.lexer.next_terminal(None)
+        current_terminal = (
+            self._terminal_before(None, start_index)
+            if start_index is not None
+            else None
+        )
+        position = (
+            current_terminal.end_position
+            if current_terminal is not None
+            else self.lexer.start_position
+        )
+        next_states = self.call(
+            nonterminal_type,
+            {TransmuterParsingState((), position, position, current_terminal)},
+        )
+        end_terminals = {next_state.end_terminal for next_state in next_states}
+
+        if end_index is not None:
+            end_terminal = self._terminal_before(current_terminal, end_index)
+        elif len(end_terminals) > 0:
+            end_terminal = max(
+                end_terminals,
+                key=lambda terminal: (
+                    terminal.end_position.index_
+                    if terminal is not None
+                    else position.index_
+                ),
+            )
+        elif self._eoi is None:
+            return
+        else:
+            raise TransmuterNoDerivationError(self._eoi.start_position)
+
+        if end_terminal not in end_terminals:
+            raise TransmuterNoDerivationError(
+                self._eoi.start_position if self._eoi is not None else position
+            )
+
+        self.bsr.start = (
+            nonterminal_type,
+            position.index_,
+            (
+                end_terminal.end_position.index_
+                if end_terminal is not None
+                else position.index_
+            ),
+        )
+
+    # Last terminal after the given one not ending after the given index
+    def _terminal_before(
+        self, current_terminal: TransmuterTerminal | None, index_: int
+    ) -> TransmuterTerminal | None:
+        while True:
+            next_terminal = self.lexer.next_terminal(current_terminal)
+
+            if (
+                next_terminal is None
+                or next_terminal.start_position.index_ >= index_
+            ):
+                break
+
+            current_terminal = next_terminal
+
+        if (
+            current_terminal is not None
+            and current_terminal.end_position.index_ > index_
+        ):
+            raise TransmuterNoBoundaryError(current_terminal.start_position)
+
+        return current_terminal
+
+    def _derive(self) -> None:
+        self.call(
+            self._nonterminal_type_start,
+            {
+                TransmuterParsingState(
+                    (),
+                    self.lexer.start_position,
+                    self.lexer.start_position,
+                    None,
+                )
+            },
+        )
+
+    def call(
+        self,
+        cls: type[TransmuterTerminalTag | TransmuterNonterminalType],
+        current_states: set[TransmuterParsingState],
+        ascend: type[TransmuterNonterminalType] | None = None,
+    ) -> set[TransmuterParsingState]:
+        # An empty set of next states signals a failed call
+        next_states = set()
+
+        if issubclass(cls, TransmuterTerminalTag):
+            for current_state in current_states:
+                next_state = self._call_single_terminal_tag(cls, current_state)
+
+                if next_state is not None:
+                    next_states.add(next_state)
+        else:
+            assert issubclass(cls, TransmuterNonterminalType)
+
+            # Only left-recursive calls ascend to their caller
+            if ascend is not None and (
+                ascend not in self._nonterminal_types_first
+                or cls not in self._nonterminal_types_first[ascend]
+            ):
+                ascend = None
+
+            for current_state in current_states:
+                next_states |= self._call_single_nonterminal_type(
+                    cls, current_state, ascend
+                )
+
+            if (
+                cls in self._nonterminal_types_commit
+                and self._depth == 1
+                and len(current_states) == 1
+                and len(next_states) == 1
+            ):
+                self._commit(cls, next(iter(next_states)))
+
+        return next_states
+
+    def call_single(
+        self,
+        cls: type[TransmuterTerminalTag | TransmuterNonterminalType],
+        current_state: TransmuterParsingState | None,
+    ) -> TransmuterParsingState | None:
+        if current_state is None:
+            return None
+
+        if cls in self._nonterminal_types_deterministic:
+            assert issubclass(cls, TransmuterNonterminalType)
+            next_state = self._call_deterministic_nonterminal_type(
+                cls, current_state
+            )
+
+            if (
+                next_state is not None
+                and cls in self._nonterminal_types_commit
+                and self._depth == 1
+            ):
+                self._commit(cls, next_state)
+
+            return next_state
+
+        assert issubclass(cls, TransmuterTerminalTag)
+        return self._call_single_terminal_tag(cls, current_state)
+
+    # Calls to terminal tags emitted without the checks of the generic calls
+    def call_terminal_tag(
+        self,
+        cls: type[TransmuterTerminalTag],
+        current_states: set[TransmuterParsingState],
+    ) -> set[TransmuterParsingState]:
+        if len(current_states) == 1:
+            for current_state in current_states:
+                next_state = self._call_single_terminal_tag(cls, current_state)
+                return {next_state} if next_state is not None else set()
+
+        next_states = set()
+
+        for current_state in current_states:
+            next_state = self._call_single_terminal_tag(cls, current_state)
+
+            if next_state is not None:
+                next_states.add(next_state)
+
+        return next_states
+
+    def call_single_terminal_tag(
+        self,
+        cls: type[TransmuterTerminalTag],
+        current_state: TransmuterParsingState | None,
+    ) -> TransmuterParsingState | None:
+        if current_state is None:
+            return None
+
+        return self._call_single_terminal_tag(cls, current_state)
+
+    # Keeps the states whose next terminal can start an expression with the
+    # given first terminal tags, so that the expression is skipped otherwise
+    def predict(
+        self,
+        terminal_tags: frozenset[type[TransmuterTerminalTag]],
+        current_states: set[TransmuterParsingState],
+    ) -> set[TransmuterParsingState]:
+        return {
+            current_state
+            for current_state in current_states
+            if self.predict_single(terminal_tags, current_state) is not None
+        }
+
+    def predict_single(
+        self,
+        terminal_tags: frozenset[type[TransmuterTerminalTag]],
+        current_state: TransmuterParsingState | None,
+    ) -> TransmuterParsingState | None:
+        if current_state is None:
+            return None
+
+        next_terminal = self._next_terminal(current_state.end_terminal)
+
+        if next_terminal is None or terminal_tags.isdisjoint(
+            next_terminal.tags
+        ):
+            return None
+
+        return current_state
+
+    def _call_single_terminal_tag(
+        self,
+        cls: type[TransmuterTerminalTag],
+        current_state: TransmuterParsingState,
+    ) -> TransmuterParsingState | None:
+        self.bsr.add(TransmuterEPN(None, current_state))
+        next_terminal = self._next_terminal(current_state.end_terminal)
+
+        if next_terminal is None or cls not in next_terminal.tags:
+            return None
+
+        return TransmuterParsingState(
+            current_state.string + (cls,),
+            current_state.start_position,
+            (
+                current_state.end_terminal.end_position
+                if current_state.end_terminal is not None
+                else current_state.split_position
+            ),
+            next_terminal,
+        )
+
+    def _call_single_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> set[TransmuterParsingState]:
+        if cls in self._nonterminal_types_deterministic:
+            next_state = self._call_deterministic_nonterminal_type(
+                cls, current_state
+            )
+            return {next_state} if next_state is not None else set()
+
+        current_state_end_position = (
+            current_state.end_terminal.end_position
+            if current_state.end_terminal is not None
+            else current_state.split_position
+        )
+
+        key = (cls, current_state_end_position.index_)
+
+        if key not in self._memo and not self._predict(
+            cls, current_state.end_terminal
+        ):
+            return set()
+
+        self.bsr.add(TransmuterEPN(None, current_state))
+        scc = self._nonterminal_types_scc.get(cls)
+        ascent = self._ascents.get((scc, key[1])) if scc is not None else None
+
+        if key not in self._memo:
+            self._memo[key] = set()
+
+            if scc is not None and ascent is None:
+                ascent = _TransmuterAscent()
+                self._ascents[(scc, key[1])] = ascent
+                self._descend(
+                    cls,
+                    key,
+                    current_state_end_position,
+                    current_state.end_terminal,
+                    ascent,
+                    None,
+                )
+                self._ascend(
+                    ascent,
+                    current_state_end_position,
+                    current_state.end_terminal,
+                )
+                del self._ascents[(scc, key[1])]
+                ascent = None
+            else:
+                self._descend(
+                    cls,
+                    key,
+                    current_state_end_position,
+                    current_state.end_terminal,
+                    ascent,
+                    ascend,
+                )
+
+        # Left-recursive calls to the nonterminal type being ascended only see
+        # its new end terminals, as the others were already ascended
+        if (
+            ascent is not None
+            and ascend is not None
+            and ascent.nonterminal_type is cls
+        ):
+            next_terminals = ascent.next_terminals
+        else:
+            next_terminals = self._memo[key]
+
+        return {
+            TransmuterParsingState(
+                current_state.string + (cls,),
+                current_state.start_position,
+                current_state_end_position,
+                next_terminal,
+            )
+            for next_terminal in next_terminals
+        }
+
+    def _descend(
+        self,
+        cls: type[TransmuterNonterminalType],
+        key: tuple[type[TransmuterNonterminalType], int],
+        position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+        ascent: _TransmuterAscent | None,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> None:
+        self._depth += 1
+        next_states = self.SPECIALIZED_NONTERMINAL_TYPES.get(cls, cls).descend(
+            self, TransmuterParsingState((), position, position, end_terminal)
+        )
+        self._depth -= 1
+        next_terminals = set()
+
+        for next_state in next_states:
+            self._add_derivation(cls, next_state)
+            assert next_state.end_terminal is not None
+
+            if next_state.end_terminal not in self._memo[key]:
+                self._memo[key].add(next_state.end_terminal)
+                next_terminals.add(next_state.end_terminal)
+
+        if ascent is not None and len(next_terminals) > 0:
+            ascent.worklist.append((cls, next_terminals, ascend))
+
+    def _ascend(
+        self,
+        ascent: _TransmuterAscent,
+        position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+    ) -> None:
+        while len(ascent.worklist) > 0:
+            ascent.nonterminal_type, ascent.next_terminals, ascended = (
+                ascent.worklist.pop()
+            )
+            assert (
+                ascent.nonterminal_type
+                in self.nonterminal_types_ascend_parents
+            )
+
+            for ascend_parent in self.nonterminal_types_ascend_parents[
+                ascent.nonterminal_type
+            ]:
+                if ascend_parent is ascended:
+                    continue
+
+                key = (ascend_parent, position.index_)
+
+                if key not in self._memo:
+                    if not self._predict(ascend_parent, end_terminal):
+                        continue
+
+                    self._memo[key] = set()
+
+                self._descend(
+                    ascend_parent, key, position, end_terminal, ascent, None
+                )
+
+            ascent.nonterminal_type = None
+            ascent.next_terminals = set()
+
+    def _call_deterministic_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+    ) -> TransmuterParsingState | None:
+        current_state_end_position = (
+            current_state.end_terminal.end_position
+            if current_state.end_terminal is not None
+            else current_state.split_position
+        )
+
+        key = (cls, current_state_end_position.index_)
+
+        if key not in self._memo_deterministic:
+            if not self._predict(cls, current_state.end_terminal):
+                return None
+
+            self.bsr.add(TransmuterEPN(None, current_state))
+            self._memo_deterministic[key] = None
+            self._depth += 1
+            next_state = self.SPECIALIZED_NONTERMINAL_TYPES.get(
+                cls, cls
+            ).descend_single(
+                self,
+                TransmuterParsingState(
+                    (),
+                    current_state_end_position,
+                    current_state_end_position,
+                    current_state.end_terminal,
+                ),
+            )
+            self._depth -= 1
+
+            if next_state is not None:
+                self.bsr.add(TransmuterEPN(cls, next_state))
+                assert next_state.end_terminal is not None
+                self._memo_deterministic[key] = next_state.end_terminal
+        else:
+            self.bsr.add(TransmuterEPN(None, current_state))
+
+        next_terminal = self._memo_deterministic[key]
+
+        if next_terminal is None:
+            return None
+
+        return TransmuterParsingState(
+            current_state.string + (cls,),
+            current_state.start_position,
+            current_state_end_position,
+            next_terminal,
+        )
+
+    # The start nonterminal type is the only one being descended, so nothing
+    # before the end of the committed derivation will be needed again
+    def _commit(
+        self,
+        cls: type[TransmuterNonterminalType],
+        state: TransmuterParsingState,
+    ) -> None:
+        assert self.commit_callback is not None
+        assert state.end_terminal is not None
+        end = state.end_terminal.end_position.index_
+        forest = self._forest((cls, state.split_position.index_, end))
+        self._discard_before(end)
+        self.commit_callback(forest)
+
+    def _forest(
+        self, key: tuple[type[TransmuterNonterminalType], int, int]
+    ) -> TransmuterBSR:
+        forest = self.bsr_type()
+        forest.start = key
+        epns = set(self.bsr.epns.get(key, set()))
+        visited = set()
+
+        while len(epns) > 0:
+            epn = epns.pop()
+
+            if epn in visited:
+                continue
+
+            visited.add(epn)
+            forest.add(epn)
+            epns |= self.bsr.left_children(epn)
+            epns |= self.bsr.right_children(epn)
+
+        return forest
+
+    def _discard_before(self, index_: int) -> None:
+        key_start = (
+            self._nonterminal_type_start,
+            self.lexer.start_position.index_,
+        )
+
+        for memo in (self._memo, self._memo_deterministic):
+            for key in [k for k in memo if k[1] < index_ and k != key_start]:
+                del memo[key]
+
+        self.bsr.discard_before(index_)
+
+    def _add_derivation(
+        self,
+        cls: type[TransmuterNonterminalType],
+        state: TransmuterParsingState,
+    ) -> None:
+        self._step()
+        epn = TransmuterEPN(cls, state)
+
+        if cls in self._nonterminal_types_levels:
+            levels = self._nonterminal_types_levels[cls]
+            assert state.end_terminal is not None
+            key = (
+                cls,
+                state.start_position.index_,
+                state.end_terminal.end_position.index_,
+            )
+            epns = list(self.bsr.epns.get(key, ()))
+
+            if any(transmuter_dominates(levels, e, epn) for e in epns):
+                return
+
+            for e in epns:
+                if transmuter_dominates(levels, epn, e):
+                    self.bsr.discard(e)
+
+        self.bsr.add(epn)
+
+    # Skip the descent if the next terminal cannot start a derivation
+    def _predict(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_terminal: TransmuterTerminal | None,
+    ) -> bool:
+        if cls not in self._nonterminal_types_first_terminal_tags:
+            return True
+
+        next_terminal = self._next_terminal(current_terminal)
+        return next_terminal is not None and not (
+            self._nonterminal_types_first_terminal_tags[cls].isdisjoint(
+                next_terminal.tags
+            )
+        )
+
+    def _next_terminal(
+        self, current_terminal: TransmuterTerminal | None
+    ) -> TransmuterTerminal | None:
+        self._step()
+        next_terminal = self.lexer.next_terminal(current_terminal)
+
+        if next_terminal is not None and (
+            self._eoi is None
+            or self._eoi.start_position.index_
+            < next_terminal.start_position.index_
+        ):
+            self._eoi = next_terminal
+
+        return next_terminal
+
+    # Called on every terminal read and derivation, so that mixins checking on
+    # the parse from it are called by both engines
+    def _step(self) -> None:
+        pass
+
+    # Where a parse aborted by a mixin is reported
+    def _farthest_position(self) -> TransmuterPosition:
+        return (
+            self._eoi.end_position
+            if self._eoi is not None
+            else self.lexer.start_position
+        )
+
+
+@dataclass
+class _TransmuterEarleyAutomaton:
+    terminal_transitions: list[dict[type[TransmuterTerminalTag], int]]
+    nonterminal_transitions: list[dict[type[TransmuterNonterminalType], int]]
+    accepts: list[bool]
+
+    @staticmethod
+    def build(
+        expression: TransmuterExpression,
+    ) -> "_TransmuterEarleyAutomaton":
+        # Thompson's construction followed by the subset construction
+        transitions: list[
+            dict[
+                type[TransmuterTerminalTag | TransmuterNonterminalType],
+                set[int],
+            ]
+        ] = []
+        epsilons: list[set[int]] = []
+
+        def add_state() -> int:
+            transitions.append({})
+            epsilons.append(set())
+            return len(transitions) - 1
+
+        def add_expression(
+            expression: TransmuterExpression | None, start: int
+        ) -> int:
+            if expression is None:
+                return start
+
+            if isinstance(expression, TransmuterSequence):
+                for item in expression.items:
+                    start = add_expression(item, start)
+
+                return start
+
+            if isinstance(expression, TransmuterSelection):
+                end = add_state()
+
+                for option in expression.options:
+                    if option is not None:
+                        epsilons[add_expression(option, start)].add(end)
+
+                return end
+
+            if isinstance(expression, TransmuterOptional):
+                end = add_state()
+                epsilons[start].add(end)
+                epsilons[add_expression(expression.expression, start)].add(end)
+                return end
+
+            if isinstance(expression, TransmuterIteration):
+                loop = add_state()
+                epsilons[start].add(loop)
+                epsilons[add_expression(expression.expression, loop)].add(loop)
+                return loop
+
+            end = add_state()
+
+            if expression not in transitions[start]:
+                transitions[start][expression] = set()
+
+            transitions[start][expression].add(end)
+            return end
+
+        end = add_expression(expression, add_state())
+
+        def closure(states: set[int]) -> frozenset[int]:
+            stack = list(states)
+
+            while len(stack) > 0:
+                for state in epsilons[stack.pop()]:
+                    if state not in states:
+                        states.add(state)
+                        stack.append(state)
+
+            return frozenset(states)
+
+        automaton = _TransmuterEarleyAutomaton([], [], [])
+        subsets = {closure({0}): 0}
+        # Subsets are visited in index order, so each one's transitions are
+        # appended at its index
+        queue = list(subsets)
+
+        for subset in queue:
+            automaton.terminal_transitions.append({})
+            automaton.nonterminal_transitions.append({})
+            automaton.accepts.append(end in subset)
+            next_subsets: dict[
+                type[TransmuterTerminalTag | TransmuterNonterminalType],
+                set[int],
+            ] = {}
+
+            for state in subset:
+                for symbol, next_states in transitions[state].items():
+                    if symbol not in next_subsets:
+                        next_subsets[symbol] = set()
+
+                    next_subsets[symbol] |= next_states
+
+            for symbol, next_states in next_subsets.items():
+                next_subset = closure(next_states)
+
+                if next_subset not in subsets:
+                    subsets[next_subset] = len(subsets)
+                    queue.append(next_subset)
+
+                if issubclass(symbol, TransmuterTerminalTag):
+                    automaton.terminal_transitions[subsets[subset]][symbol] = (
+                        subsets[next_subset]
+                    )
+                else:
+                    assert issubclass(symbol, TransmuterNonterminalType)
+                    automaton.nonterminal_transitions[subsets[subset]][
+                        symbol
+                    ] = subsets[next_subset]
+
+        return automaton
+
+
+_TransmuterEarleyItem = tuple[
+    type[TransmuterNonterminalType], int, TransmuterParsingState
+]
+_TransmuterEarleyString = tuple[
+    type[TransmuterTerminalTag | TransmuterNonterminalType], ...
+]
+# Nonterminal type, automaton state, string before advancing over empty
+# derivations, start index and last nonterminal type advanced over
+_TransmuterEarleyEmptyAdvance = tuple[
+    type[TransmuterNonterminalType],
+    int,
+    _TransmuterEarleyString,
+    int,
+    type[TransmuterNonterminalType],
+]
+
+
+# Earley-style engine over automata built from the nonterminal types'
+# expressions. Ordered choices are treated as unordered, so the BSR may hold
+# derivations the descent engine would have discarded. Cyclic derivations,
+# of a nonterminal type from itself over the same span or of the same
+# nonterminal types over and over over an empty span, are left out, so the
+# BSR may lack derivations the descent engine would have kept.
+@dataclass
+class TransmuterEarleyParser(TransmuterParser):
+    _automata: dict[
+        type[TransmuterNonterminalType], _TransmuterEarleyAutomaton
+    ] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._automata = {
+            nonterminal_type: _TransmuterEarleyAutomaton.build(
+                self.SPECIALIZED_NONTERMINAL_TYPES.get(
+                    nonterminal_type, nonterminal_type
+                ).expression(self.lexer.conditions)
+            )
+            for nonterminal_type in self.NONTERMINAL_TYPES
+        }
+
+    # Commit points are ignored, as every item set is kept until the end
+    def _derive(self) -> None:
+        current_terminal = None
+        current_position = self.lexer.start_position
+        items: set[_TransmuterEarleyItem] = {
+            (
+                self._nonterminal_type_start,
+                0,
+                TransmuterParsingState(
+                    (), current_position, current_position, None
+                ),
+            )
+        }
+        waiting: dict[
+            tuple[type[TransmuterNonterminalType], int],
+            list[_TransmuterEarleyItem],
+        ] = {}
+        completed: dict[
+            tuple[type[TransmuterNonterminalType], int],
+            set[TransmuterTerminal | None],
+        ] = {}
+
+        while len(items) > 0:
+            next_terminal = self._next_terminal(current_terminal)
+            next_items: set[_TransmuterEarleyItem] = set()
+            worklist = list(items)
+            # Strings of the items before advancing over empty derivations at
+            # the current position
+            empty_bases: dict[
+                _TransmuterEarleyItem, _TransmuterEarleyString
+            ] = {}
+            empty_advances: set[_TransmuterEarleyEmptyAdvance] = set()
+            units: dict[
+                tuple[type[TransmuterNonterminalType], int],
+                set[type[TransmuterNonterminalType]],
+            ] = {}
+
+            while len(worklist) > 0:
+                cls, automaton_state, state = worklist.pop()
+                automaton = self._automata[cls]
+
+                # Completer
+                if automaton.accepts[automaton_state] and not (
+                    self._closes_cycle(cls, state, units)
+                ):
+                    self._add_derivation(cls, state)
+                    key = (cls, state.start_position.index_)
+
+                    if key not in completed:
+                        completed[key] = set()
+
+                    if current_terminal not in completed[key]:
+                        completed[key].add(current_terminal)
+
+                        for parent in waiting.get(key, ()):
+                            self._advance(
+                                parent,
+                                cls,
+                                state.start_position,
+                                current_position,
+                                current_terminal,
+                                items,
+                                worklist,
+                                empty_bases,
+                                empty_advances,
+                            )
+
+                # Scanner
+                if next_terminal is not None:
+                    for (
+                        terminal_tag,
+                        next_automaton_state,
+                    ) in automaton.terminal_transitions[
+                        automaton_state
+                    ].items():
+                        if terminal_tag in next_terminal.tags:
+                            self.bsr.add(TransmuterEPN(None, state))
+                            next_items.add(
+                                (
+                                    cls,
+                                    next_automaton_state,
+                                    TransmuterParsingState(
+                                        state.string + (terminal_tag,),
+                                        state.start_position,
+                                        current_position,
+                                        next_terminal,
+                                    ),
+                                )
+                            )
+
+                # Predictor
+                for nonterminal_type in automaton.nonterminal_transitions[
+                    automaton_state
+                ]:
+                    key = (nonterminal_type, current_position.index_)
+
+                    if key not in waiting:
+                        waiting[key] = []
+
+                        if self._predict(nonterminal_type, current_terminal):
+                            item = (
+                                nonterminal_type,
+                                0,
+                                TransmuterParsingState(
+                                    (),
+                                    current_position,
+                                    current_position,
+                                    current_terminal,
+                                ),
+                            )
+                            items.add(item)
+                            worklist.append(item)
+
+                    waiting[key].append((cls, automaton_state, state))
+
+                    # The nonterminal type may have already derived the empty
+                    # string at the current position
+                    if current_terminal in completed.get(key, ()):
+                        self._advance(
+                            (cls, automaton_state, state),
+                            nonterminal_type,
+                            current_position,
+                            current_position,
+                            current_terminal,
+                            items,
+                            worklist,
+                            empty_bases,
+                            empty_advances,
+                        )
+
+            if next_terminal is None:
+                break
+
+            items = next_items
+            current_terminal = next_terminal
+            current_position = next_terminal.end_position
+
+    # Cyclic grammars may derive a nonterminal type from itself over the same
+    # span, which would make the BSR cyclic
+    def _closes_cycle(
+        self,
+        cls: type[TransmuterNonterminalType],
+        state: TransmuterParsingState,
+        units: dict[
+            tuple[type[TransmuterNonterminalType], int],
+            set[type[TransmuterNonterminalType]],
+        ],
+    ) -> bool:
+        if (
+            len(state.string) == 0
+            or state.split_position.index_ != state.start_position.index_
+            or state.end_terminal is None
+            or issubclass(state.string[-1], TransmuterTerminalTag)
+        ):
+            return False
+
+        start_index = state.start_position.index_
+        child = state.string[-1]
+        visited = {child}
+        stack = [child]
+
+        while len(stack) > 0:
+            nonterminal_type = stack.pop()
+
+            if nonterminal_type is cls:
+                return True
+
+            for next_nonterminal_type in units.get(
+                (nonterminal_type, start_index), ()
+            ):
+                if next_nonterminal_type not in visited:
+                    visited.add(next_nonterminal_type)
+                    stack.append(next_nonterminal_type)
+
+        key = (cls, start_index)
+
+        if key not in units:
+            units[key] = set()
+
+        units[key].add(child)
+        return False
+
+    # Advancing over empty derivations keeps the span of the item, so the
+    # items it leads to are told apart only by the string before the first of
+    # them, their automaton state and the last nonterminal type. Otherwise,
+    # iterations over nonterminal types deriving the empty string would keep
+    # advancing with ever longer strings.
+    def _advance(
+        self,
+        item: _TransmuterEarleyItem,
+        nonterminal_type: type[TransmuterNonterminalType],
+        split_position: TransmuterPosition,
+        current_position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+        items: set[_TransmuterEarleyItem],
+        worklist: list[_TransmuterEarleyItem],
+        empty_bases: dict[_TransmuterEarleyItem, _TransmuterEarleyString],
+        empty_advances: set[_TransmuterEarleyEmptyAdvance],
+    ) -> None:
+        cls, automaton_state, state = item
+        next_automaton_state = self._automata[cls].nonterminal_transitions[
+            automaton_state
+        ][nonterminal_type]
+        base = None
+
+        if split_position.index_ == current_position.index_:
+            base = empty_bases.get(item, state.string)
+            empty_advance = (
+                cls,
+                next_automaton_state,
+                base,
+                state.start_position.index_,
+                nonterminal_type,
+            )
+
+            if empty_advance in empty_advances:
+                return
+
+            empty_advances.add(empty_advance)
+
+        self.bsr.add(TransmuterEPN(None, state))
+        next_item = (
+            cls,
+            next_automaton_state,
+            TransmuterParsingState(
+                state.string + (nonterminal_type,),
+                state.start_position,
+                split_position,
+                end_terminal,
+            ),
+        )
+
+        if next_item not in items:
+            items.add(next_item)
+            worklist.append(next_item)
+
+            if base is not None:
+                empty_bases[next_item] = base
+
+
+# Keeps track of how far into the input each memoized call examined, so that
+# after an edit only the calls that examined it are parsed again. Commit
+# points and streaming discard memos, so they are not supported alongside it.
+# The BSR is kept across edits, so transformers must be applied to a copy of
+# it, and it may hold derivations no longer reachable from its start.
+@dataclass
+class TransmuterIncrementalParser(TransmuterParser):
+    # Index past the last character examined by each memoized call, and the
+    # farthest terminal read by it
+    _reads: dict[
+        tuple[type[TransmuterNonterminalType], int],
+        tuple[int, TransmuterTerminal | None],
+    ] = field(default_factory=dict, init=False, repr=False)
+    _extent: int = field(default=0, init=False, repr=False)
+    _farthest: TransmuterTerminal | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def reset(self, filename: str, input: str) -> None:
+        super().reset(filename, input)
+        self._reads.clear()
+        self._extent = 0
+        self._farthest = None
+
+    # Later parses reuse the derivations pruning would discard
+    def parse(self, prune: bool = False) -> int | None:
+        if prune:
+            raise ValueError("Incremental parsers cannot prune their BSR.")
+
+        return super().parse()
+
+    # Replaces the input between the given indexes with the given text. Memo
+    # and BSR entries after the edit are shifted, the ones before it are kept
+    # if they did not examine it, and the rest is parsed again by parse.
+    def edit(self, start_index: int, end_index: int, text: str) -> None:
+        assert isinstance(self.lexer, TransmuterLexer)
+        delta = len(text) - (end_index - start_index)
+        reused_index = self.lexer.edit(start_index, end_index, text)
+
+        def reused(index_: int) -> bool:
+            return reused_index is not None and index_ >= reused_index
+
+        # Calls at the same index share their BSR entries, and calls without
+        # reads were interrupted by an error
+        invalid_indexes = {
+            key[1]
+            for memo in (self._memo, self._memo_deterministic)
+            for key in memo
+            if key not in self._reads
+            or (not reused(key[1]) and self._reads[key][0] > start_index)
+        }
+
+        # A failed parse may have left fixpoints unfinished
+        invalid_indexes |= {index_ for _, index_ in self._ascents}
+        self._ascents.clear()
+        self._depth = 0
+        self._extent, self._farthest = 0, None
+
+        def kept(index_: int) -> bool:
+            return index_ not in invalid_indexes and (
+                index_ < start_index or reused(index_)
+            )
+
+        def shifted(
+            key: tuple[type[TransmuterNonterminalType], int],
+        ) -> tuple[type[TransmuterNonterminalType], int]:
+            return (key[0], key[1] + delta) if reused(key[1]) else key
+
+        self._memo = {
+            shifted(key): next_terminals
+            for key, next_terminals in self._memo.items()
+            if kept(key[1])
+        }
+        self._memo_deterministic = {
+            shifted(key): next_terminal
+            for key, next_terminal in self._memo_deterministic.items()
+            if kept(key[1])
+        }
+        reads = {}
+
+        for key, (extent, farthest) in self._reads.items():
+            if kept(key[1]):
+                reads[shifted(key)] = (
+                    (extent + delta, farthest)
+                    if reused(key[1])
+                    else (extent, farthest)
+                )
+
+        self._reads = reads
+        self.bsr.edit(kept, reused_index, delta)
+        self.bsr.start = None
+        self._eoi = None
+
+    def _call_single_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> set[TransmuterParsingState]:
+        if cls in self._nonterminal_types_deterministic:
+            return super()._call_single_nonterminal_type(
+                cls, current_state, ascend
+            )
+
+        key = (
+            cls,
+            (
+                current_state.end_terminal.end_position.index_
+                if current_state.end_terminal is not None
+                else current_state.split_position.index_
+            ),
+        )
+        scc = self._nonterminal_types_scc.get(cls)
+        fixpoint = (
+            scc is not None
+            and key not in self._memo
+            and (scc, key[1]) not in self._ascents
+        )
+        next_states = super()._call_single_nonterminal_type(
+            cls, current_state, ascend
+        )
+
+        # Derivations of a left-recursive SCC depend on each other's reads
+        if fixpoint:
+            assert scc is not None
+            keys = [
+                (nonterminal_type, key[1])
+                for nonterminal_type in scc
+                if (nonterminal_type, key[1]) in self._reads
+            ]
+            extent, farthest = self._extent, self._farthest
+            self._extent, self._farthest = 0, None
+
+            for scc_key in keys:
+                self._merge_reads(scc_key)
+
+            for scc_key in keys:
+                self._reads[scc_key] = (self._extent, self._farthest)
+
+            self._merge_reads(None, extent, farthest)
+
+        if key in self._reads:
+            self._merge_reads(key)
+
+        return next_states
+
+    def _descend(
+        self,
+        cls: type[TransmuterNonterminalType],
+        key: tuple[type[TransmuterNonterminalType], int],
+        position: TransmuterPosition,
+        end_terminal: TransmuterTerminal | None,
+        ascent: _TransmuterAscent | None,
+        ascend: type[TransmuterNonterminalType] | None,
+    ) -> None:
+        extent, farthest = self._extent, self._farthest
+        self._extent, self._farthest = 0, None
+        super()._descend(cls, key, position, end_terminal, ascent, ascend)
+        self._record_reads(key, extent, farthest)
+
+    def _call_deterministic_nonterminal_type(
+        self,
+        cls: type[TransmuterNonterminalType],
+        current_state: TransmuterParsingState,
+    ) -> TransmuterParsingState | None:
+        key = (
+            cls,
+            (
+                current_state.end_terminal.end_position.index_
+                if current_state.end_terminal is not None
+                else current_state.split_position.index_
+            ),
+        )
+
+        if key in self._memo_deterministic:
+            self._merge_reads(key)
+            return super()._call_deterministic_nonterminal_type(
+                cls, current_state
+            )
+
+        extent, farthest = self._extent, self._farthest
+        self._extent, self._farthest = 0, None
+        next_state = super()._call_deterministic_nonterminal_type(
+            cls, current_state
+        )
+
+        # Failed predictions are not memoized, but are still read by the caller
+        if key in self._memo_deterministic:
+            self._record_reads(key, extent, farthest)
+        else:
+            self._merge_reads(None, extent, farthest)
+
+        return next_state
+
+    def _next_terminal(
+        self, current_terminal: TransmuterTerminal | None
+    ) -> TransmuterTerminal | None:
+        next_terminal = super()._next_terminal(current_terminal)
+
+        # Examining the end of the input is affected by any edit
+        if next_terminal is None:
+            self._extent = sys.maxsize
+        else:
+            self._merge_reads(None, next_terminal.lookahead, next_terminal)
+
+        return next_terminal
+
+    def _record_reads(
+        self,
+        key: tuple[type[TransmuterNonterminalType], int],
+        extent: int,
+        farthest: TransmuterTerminal | None,
+    ) -> None:
+        # Left-recursive calls are descended again by their ascent
+        if key in self._reads:
+            self._merge_reads(key)
+
+        self._reads[key] = (self._extent, self._farthest)
+        self._merge_reads(None, extent, farthest)
+
+    # Memoized reads are not repeated, so they are merged into the caller's
+    def _merge_reads(
+        self,
+        key: tuple[type[TransmuterNonterminalType], int] | None,
+        extent: int = 0,
+        farthest: TransmuterTerminal | None = None,
+    ) -> None:
+        if key is not None:
+            extent, farthest = self._reads[key]
+
+        self._extent = max(self._extent, extent)
+
+        if farthest is None:
+            return
+
+        if (
+            self._farthest is None
+            or self._farthest.start_position.index_
+            < farthest.start_position.index_
+        ):
+            self._farthest = farthest
+
+        if (
+            self._eoi is None
+            or self._eoi.start_position.index_ < farthest.start_position.index_
+        ):
+            self._eoi = farthest
+
+
+# Thread-safe pool of parsers for the given conditions, each one with its own
+# lexer, which are reset for each input instead of being built again. Parsers
+# are made by the given factory, which may be a parser type:
+#
+#   pool = TransmuterParserPool(Lexer, Parser, Conditions.default)
+#
+#   with pool.parser(filename, input) as parser:
+#       parser.parse()
+@dataclass
+class TransmuterParserPool:
+    lexer_type: type[TransmuterLexer]
+    parser_factory: Callable[[TransmuterLexer], TransmuterParser]
+    conditions: TransmuterConditions
+    # Idle parsers beyond it are dropped when released
+    max_size: int | None = None
+    _parsers: list[TransmuterParser] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def acquire(self, filename: str, input: str) -> TransmuterParser:
+        with self._lock:
+            parser = self._parsers.pop() if len(self._parsers) > 0 else None
+
+        if parser is None:
+            return self.parser_factory(
+                self.lexer_type(filename, input, self.conditions)
+            )
+
+        parser.reset(filename, input)
+        return parser
+
+    def release(self, parser: TransmuterParser) -> None:
+        with self._lock:
+            if self.max_size is None or len(self._parsers) < self.max_size:
+                self._parsers.append(parser)
+
+    @contextmanager
+    def parser(self, filename: str, input: str) -> Iterator[TransmuterParser]:
+        parser = self.acquire(filename, input)
+
+        try:
+            yield parser
+        finally:
+            self.release(parser)
+
+    # Parses each document with the same parser, yielding its BSR or the
+    # error raised while parsing it, so one bad document does not stop the
+    # rest. The BSR of each document is handed over, so it outlives the next.
+    def parse_many(
+        self, documents: Iterable[tuple[str, str]]
+    ) -> Iterator[TransmuterBSR | TransmuterException]:
+        parser = None
+
+        try:
+            for filename, input in documents:
+                result: TransmuterBSR | TransmuterException
+
+                try:
+                    if parser is None:
+                        parser = self.acquire(filename, input)
+                    else:
+                        parser.reset(filename, input)
+
+                    parser.parse()
+                    result = parser.take_bsr()
+                except TransmuterException as exception:
+                    result = exception
+
+                yield result
+        finally:
+            if parser is not None:
+                self.release(parser)
+
+
+class TransmuterSyntacticError(TransmuterException):
+    def __init__(self, position: TransmuterPosition, description: str) -> None:
+        super().__init__(position, "Syntactic Error", description)
+
+
+class TransmuterNoStartError(TransmuterSyntacticError):
+    def __init__(self) -> None:
+        super().__init__(
+            TransmuterPosition("<conditions>", 0, 0, 0),
+            "Could not match any starting symbol from given conditions.",
+        )
+
+
+class TransmuterMultipleStartsError(TransmuterSyntacticError):
+    def __init__(self) -> None:
+        super().__init__(
+            TransmuterPosition("<conditions>", 0, 0, 0),
+            "Matched multiple starting symbols from given conditions.",
+        )
+
+
+class TransmuterNoDerivationError(TransmuterSyntacticError):
+    def __init__(self, position: TransmuterPosition) -> None:
+        super().__init__(
+            position, "Could not derive input from any production rule."
+        )
+
+
+class TransmuterNoBoundaryError(TransmuterSyntacticError):
+    def __init__(self, position: TransmuterPosition) -> None:
+        super().__init__(
+            position, "Could not start or end a derivation inside a terminal."
+        )
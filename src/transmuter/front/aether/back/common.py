@@ -15,29 +15,42 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
+from ...common import transmuter_compute_sccs
 from ...semantic.common import (
+    TransmuterTreeNode,
     TransmuterTerminalTreeNode,
     TransmuterNonterminalTreeNode,
     TransmuterTreeFold,
 )
 from ...semantic.symbol_table import TransmuterSymbolTable
 from ..lexical import (
+    Identifier,
     CommercialAt,
     LeftParenthesis,
     RightParenthesis,
+    VerticalLine,
     DoubleVerticalLine,
     DoubleAmpersand,
+    LeftCurlyBracketSolidus,
     ExclamationMark,
+    LeftSquareBracketSolidus,
 )
 from ..syntactic import (
+    Condition,
+    SelectionExpression,
     DisjunctionCondition,
+    SequenceExpression,
     ConjunctionCondition,
+    IterationExpression,
+    PrimaryExpression,
     NegationCondition,
+    OptionalExpression,
     PrimitiveCondition,
 )
-from ..semantic import LexicalState, LexicalSymbol
+from ..semantic import LexicalState, LexicalSymbol, SyntacticSymbol
 
 
 @dataclass
@@ -126,12 +139,76 @@ class AetherConditionFold(TransmuterTreeFold[str]):
         raise NotImplementedError()
 
 
+# Evaluates a condition for a given set of conditions
 @dataclass
-class AetherLexicalFileFold(AetherFileFold):
+class _AetherConditionValueFold(TransmuterTreeFold[bool]):
+    conditions: set[str] = field(default_factory=set, init=False, repr=False)
+
+    def fold_internal(
+        self, node: TransmuterNonterminalTreeNode, children: list[bool]
+    ) -> bool | None:
+        if len(children) == 0:
+            return None
+
+        if len(children) == 1:
+            if node.type_ == NegationCondition and len(node.children) % 2 == 0:
+                return not children[0]
+
+            return children[0]
+
+        if node.type_ == DisjunctionCondition:
+            return any(children)
+
+        assert node.type_ == ConjunctionCondition
+        return all(children)
+
+    def fold_external(self, node: TransmuterTerminalTreeNode) -> bool | None:
+        if node.type_ == Identifier:
+            return node.end_terminal.value in self.conditions
+
+        return None
+
+
+@dataclass
+class AetherConditionalFileFold(AetherFileFold):
     condition_fold_type: type[AetherConditionFold]
     _condition_fold: AetherConditionFold | None = field(
         default=None, init=False, repr=False
     )
+    _condition_value_fold: _AetherConditionValueFold | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def fold_condition(self, value: TransmuterNonterminalTreeNode) -> str:
+        if self._condition_fold is None:
+            self._condition_fold = self.condition_fold_type(value)
+        else:
+            self._condition_fold.tree = value
+
+        self._condition_fold.visit()
+        assert len(self._condition_fold.fold_queue) > 0
+        assert self._condition_fold.fold_queue[0] is not None
+        return self._condition_fold.fold_queue[0]
+
+    def _condition_value(
+        self, value: TransmuterNonterminalTreeNode, conditions: set[str]
+    ) -> bool:
+        if self._condition_value_fold is None:
+            self._condition_value_fold = _AetherConditionValueFold(value)
+        else:
+            self._condition_value_fold.tree = value
+
+        self._condition_value_fold.conditions = conditions
+        self._condition_value_fold.visit()
+        assert len(self._condition_value_fold.fold_queue) > 0
+        assert self._condition_value_fold.fold_queue[0] is not None
+        return self._condition_value_fold.fold_queue[0]
+
+
+@dataclass
+class AetherLexicalFileFold(AetherConditionalFileFold):
+    # Sets of conditions to also fold lexers specialized for
+    specializations: list[list[str]] = field(default_factory=list)
 
     def fold(self) -> str:
         terminal_tag_names = []
@@ -215,24 +292,48 @@ class AetherLexicalFileFold(AetherFileFold):
                 )
             )
 
-        return self.fold_file(terminal_tag_names, terminal_tags)
-
-    def fold_condition(self, value: TransmuterNonterminalTreeNode) -> str:
-        if self._condition_fold is None:
-            self._condition_fold = self.condition_fold_type(value)
-        else:
-            self._condition_fold.tree = value
-
-        self._condition_fold.visit()
-        assert len(self._condition_fold.fold_queue) > 0
-        assert self._condition_fold.fold_queue[0] is not None
-        return self._condition_fold.fold_queue[0]
+        # Only the terminal tags started for the conditions are kept
+        specializations = [
+            self.fold_specialization(
+                i,
+                [
+                    name
+                    for name, symbol in self.symbol_table
+                    if isinstance(symbol, LexicalSymbol)
+                    and (
+                        symbol.start is None
+                        or self._condition_value(symbol.start, set(conditions))
+                    )
+                ],
+            )
+            for i, conditions in enumerate(self.specializations, 1)
+        ]
+        dispatcher = (
+            self.fold_dispatcher(self.specializations)
+            if len(self.specializations) > 0
+            else None
+        )
+        return self.fold_file(
+            terminal_tag_names, terminal_tags, specializations, dispatcher
+        )
 
     def fold_file(
-        self, terminal_tag_names: list[str], terminal_tags: list[str]
+        self,
+        terminal_tag_names: list[str],
+        terminal_tags: list[str],
+        specializations: list[str],
+        dispatcher: str | None,
     ) -> str:
         raise NotImplementedError()
 
+    def fold_specialization(
+        self, index: int, terminal_tag_names: list[str]
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_dispatcher(self, specializations: list[list[str]]) -> str:
+        raise NotImplementedError()
+
     def fold_terminal_tag(
         self,
         name: str,
@@ -281,3 +382,1028 @@ class AetherLexicalFileFold(AetherFileFold):
 
     def fold_state(self, index: int, value: LexicalState) -> str:
         raise NotImplementedError()
+
+
+# Minimal cover of a guard by cubes, conjunctions of conditions each mapped to
+# whether it must be present
+def _aether_guard_cubes(guard: int, length: int) -> list[dict[int, bool]]:
+    values = 1 << length
+    all_ = (1 << values) - 1
+    cubes = []
+
+    for care in range(values):
+        value = care
+
+        while True:
+            cover = 0
+
+            for v in range(values):
+                if v & care == value:
+                    cover |= 1 << v
+
+            if cover & ~guard & all_ == 0:
+                cubes.append((care, value, cover))
+
+            if value == 0:
+                break
+
+            value = (value - 1) & care
+
+    primes = [
+        c
+        for c in cubes
+        if not any(d[2] != c[2] and c[2] & ~d[2] == 0 for d in cubes)
+    ]
+    chosen = []
+
+    while guard != 0:
+        best = max(
+            primes,
+            key=lambda c: (
+                (c[2] & guard).bit_count(),
+                -c[0].bit_count(),
+            ),
+        )
+        chosen.append(best)
+        guard &= ~best[2]
+
+    return [
+        {i: value >> i & 1 == 1 for i in range(length) if care >> i & 1}
+        for care, value, _ in chosen
+    ]
+
+
+@dataclass
+class AetherSyntacticFileFold(AetherConditionalFileFold):
+    condition_table: TransmuterSymbolTable[TransmuterNonterminalTreeNode]
+    # Skips the options, optionals and iterations the next terminal cannot
+    # start instead of trying them
+    predict: bool = False
+    # Calls terminal tags without the checks of the generic calls
+    direct_terminal_tag_calls: bool = False
+    # Calls the terminal tags leading a descent with a single state
+    single_state: bool = False
+    # Sets of conditions to also fold nonterminal types and parsers
+    # specialized for
+    specializations: list[list[str]] = field(default_factory=list)
+    # Precomputes the tables of the parser for each conditions value
+    tables: bool = True
+    _symbol: SyntacticSymbol | None = field(
+        default=None, init=False, repr=False
+    )
+    _symbol_name: str = field(default="", init=False, repr=False)
+    # Keyed by the identity of the predicted expression
+    _predictions: dict[int, int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _predictions_terminal_tags: list[list[str]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    # Conditions value being specialized for, whose conditions are evaluated
+    # while folding instead of being tested by the folded code
+    _specialization: int | None = field(default=None, init=False, repr=False)
+    _specialization_conditions: set[str] = field(
+        default_factory=set, init=False, repr=False
+    )
+    # Nonterminal types called by the descents being specialized
+    _references: set[str] = field(default_factory=set, init=False, repr=False)
+    # Whether any folded nonterminal type declares precedences
+    _precedences: bool = field(default=False, init=False, repr=False)
+
+    def fold(self) -> str:
+        assert self.symbol_table.parent is not None
+        self._precedences = False
+        terminal_tag_names = [name for name, _ in self.symbol_table.parent]
+        nonterminal_type_names = []
+        nonterminal_types = []
+
+        for name, symbol in self.symbol_table:
+            assert isinstance(symbol, SyntacticSymbol)
+            nonterminal_type_names.append(name)
+            nonterminal_types.append(self._fold_nonterminal_type(name, symbol))
+
+        condition_names = [name for name, _ in self.condition_table]
+        specializations = []
+
+        # Only the nonterminal types reachable from the start one are
+        # specialized, the others being left to their generic descents
+        for i, conditions in enumerate(self.specializations, 1):
+            self._specialization = sum(
+                1 << condition_names.index(c) for c in conditions
+            )
+            self._specialization_conditions = set(conditions)
+            reachable = [
+                name
+                for name, symbol in self.symbol_table
+                if isinstance(symbol, SyntacticSymbol)
+                and self._holds(symbol.start)
+            ]
+            specialized_nonterminal_types = {}
+
+            for name in reachable:
+                symbol = self.symbol_table.symbols[name]
+                assert isinstance(symbol, SyntacticSymbol)
+                self._references.clear()
+                specialized_nonterminal_types[name] = (
+                    self._fold_nonterminal_type(name, symbol, i)
+                )
+                reachable += sorted(self._references - set(reachable))
+
+            specialized_nonterminal_type_names = [
+                name
+                for name in nonterminal_type_names
+                if name in specialized_nonterminal_types
+            ]
+            specializations.append(
+                self.fold_specialization(
+                    i,
+                    specialized_nonterminal_type_names,
+                    [
+                        specialized_nonterminal_types[name]
+                        for name in specialized_nonterminal_type_names
+                    ],
+                )
+            )
+
+        self._specialization = None
+        tables = self._fold_tables() if self.tables else []
+        dispatcher = (
+            self.fold_dispatcher(self.specializations)
+            if len(self.specializations) > 0
+            else None
+        )
+        return self.fold_file(
+            terminal_tag_names,
+            nonterminal_type_names,
+            nonterminal_types,
+            tables,
+            specializations,
+            dispatcher,
+            self._precedences,
+        )
+
+    # Mirrors the computation of the tables by the parser, for each conditions
+    # value with a single start nonterminal type
+    def _fold_tables(self) -> list[str]:
+        condition_names = [name for name, _ in self.condition_table]
+        names = [name for name, _ in self.symbol_table]
+        tables = []
+
+        for v in range(1 << len(condition_names)):
+            self._specialization = v
+            self._specialization_conditions = {
+                name for i, name in enumerate(condition_names) if v >> i & 1
+            }
+            start = []
+            first: dict[str, set[str]] = {}
+            first_terminal_tags = {}
+            deterministic = []
+            commit = []
+            levels = {}
+
+            for name, symbol in self.symbol_table:
+                assert isinstance(symbol, SyntacticSymbol)
+
+                if self._holds(symbol.start):
+                    start.append(name)
+
+                first[name] = {f.value for f in symbol.static_first} | {
+                    f.value
+                    for f, conditions in symbol.conditional_first.items()
+                    if all(self._holds(c) for c in conditions)
+                }
+
+                if self._specialize_guard(symbol.nullable) == 0:
+                    first_terminal_tags[name] = [
+                        t
+                        for t, guard in symbol.first_terminal_tags.items()
+                        if self._specialize_guard(guard) != 0
+                    ]
+
+                if self._specialize_guard(symbol.deterministic) != 0:
+                    deterministic.append(name)
+
+                if self._holds(symbol.commit):
+                    commit.append(name)
+
+                precedences = [
+                    p
+                    for p in symbol.precedences
+                    if p.condition is None or self._holds(p.condition)
+                ]
+
+                if len(precedences) > 0:
+                    levels[name] = {
+                        t.value: (i, p.left)
+                        for i, p in enumerate(precedences)
+                        for t in p.terminal_tags
+                    }
+
+            if len(start) != 1:
+                continue
+
+            scc_first = {}
+            scc = {}
+            ascend_parents = {}
+
+            for component in transmuter_compute_sccs(first):
+                if len(component) == 1 and not any(
+                    n in first[n] for n in component
+                ):
+                    continue
+
+                members = [n for n in names if n in component]
+
+                for n in members:
+                    scc_first[n] = [m for m in members if m in first[n]]
+                    scc[n] = members
+                    ascend_parents[n] = [m for m in members if n in first[m]]
+
+            tables.append(
+                self.fold_tables(
+                    sorted(
+                        self._specialization_conditions,
+                        key=condition_names.index,
+                    ),
+                    start[0],
+                    {n: scc_first[n] for n in names if n in scc_first},
+                    first_terminal_tags,
+                    [n for n in deterministic if n not in scc_first],
+                    {n: scc[n] for n in names if n in scc},
+                    {
+                        n: ascend_parents[n]
+                        for n in names
+                        if n in ascend_parents
+                    },
+                    commit if start[0] not in scc_first else [],
+                    levels,
+                )
+            )
+
+        return tables
+
+    def _fold_nonterminal_type(
+        self,
+        name: str,
+        symbol: SyntacticSymbol,
+        specialization: int | None = None,
+    ) -> str:
+        assert symbol.definition is not None
+        assert len(symbol.definition.children) > 1
+        assert isinstance(
+            symbol.definition.children[1], TransmuterNonterminalTreeNode
+        )
+        assert len(symbol.definition.children[1].children) > 0
+        selection = symbol.definition.children[1].children[0]
+        assert isinstance(selection, TransmuterNonterminalTreeNode)
+        self._symbol = symbol
+        self._symbol_name = name
+        self._predictions.clear()
+        self._predictions_terminal_tags.clear()
+        start = self._fold_flag(symbol.start, self.fold_start)
+        commit = self._fold_flag(symbol.commit, self.fold_commit)
+        precedences = [
+            self.fold_precedence(
+                p.left,
+                [t.value for t in p.terminal_tags],
+                (
+                    self.fold_condition(p.condition)
+                    if p.condition is not None and self._specialization is None
+                    else None
+                ),
+            )
+            for p in symbol.precedences
+            if p.condition is None or self._holds(p.condition)
+        ]
+
+        if len(precedences) > 0:
+            self._precedences = True
+
+        # References are keyed by their terminals, so names may repeat
+        static_first = list(
+            dict.fromkeys(
+                [f.value for f in symbol.static_first]
+                + [
+                    f.value
+                    for f, conditions in symbol.conditional_first.items()
+                    if self._specialization is not None
+                    and all(self._holds(c) for c in conditions)
+                ]
+            )
+        )
+        conditional_first = (
+            [
+                self.fold_conditional_first(
+                    f.value,
+                    self.fold_conditions(
+                        [self.fold_condition(c) for c in conditions]
+                    ),
+                )
+                for f, conditions in symbol.conditional_first.items()
+                if f.value not in static_first
+            ]
+            if self._specialization is None
+            else []
+        )
+        static_first_terminal_tags = []
+        conditional_first_terminal_tags: dict[int, list[str]] = {}
+
+        for t, guard in symbol.first_terminal_tags.items():
+            guard = self._specialize_guard(guard)
+
+            if guard == self._all():
+                static_first_terminal_tags.append(t)
+            elif guard != 0:
+                if guard not in conditional_first_terminal_tags:
+                    conditional_first_terminal_tags[guard] = []
+
+                conditional_first_terminal_tags[guard].append(t)
+
+        first_terminal_tags = self.fold_first_terminal_tags(
+            static_first_terminal_tags,
+            [
+                self.fold_conditional_first_terminal_tags(
+                    t, self._fold_guard(guard)
+                )
+                for guard, t in conditional_first_terminal_tags.items()
+            ],
+        )
+        nullable = self._fold_guard_flag(symbol.nullable, self.fold_nullable)
+        deterministic = self._fold_guard_flag(
+            symbol.deterministic, self.fold_deterministic
+        )
+        expression = self.fold_expression(
+            self._fold_expression_selection(selection)
+        )
+        descend = self._fold_descend(selection, False)
+        descend_single = (
+            self._fold_descend(selection, True)
+            if self._specialize_guard(symbol.deterministic) != 0
+            else None
+        )
+        predictions = [
+            self.fold_prediction(i, t)
+            for i, t in enumerate(self._predictions_terminal_tags, 1)
+        ]
+        return self.fold_nonterminal_type(
+            name,
+            predictions,
+            start,
+            commit,
+            (
+                self.fold_precedences(precedences)
+                if len(precedences) > 0
+                else None
+            ),
+            (
+                self.fold_first(static_first, conditional_first)
+                if len(static_first) > 0 or len(conditional_first) > 0
+                else None
+            ),
+            first_terminal_tags,
+            nullable,
+            deterministic,
+            expression,
+            descend,
+            descend_single,
+            specialization,
+        )
+
+    def _all(self) -> int:
+        return (1 << (1 << len(self.condition_table.symbols))) - 1
+
+    def _holds(self, value: TransmuterNonterminalTreeNode | bool) -> bool:
+        if isinstance(value, bool):
+            return value
+
+        if self._specialization is None:
+            return True
+
+        return self._condition_value(value, self._specialization_conditions)
+
+    # Guards hold either for all conditions or for none when specializing
+    def _specialize_guard(self, guard: int) -> int:
+        if self._specialization is None:
+            return guard
+
+        return self._all() if guard >> self._specialization & 1 else 0
+
+    # Flags missing when specializing are left to the generic ones, which
+    # hold for none of the conditions either
+    def _fold_flag(
+        self,
+        value: TransmuterNonterminalTreeNode | bool,
+        fold: Callable[[str | None], str],
+    ) -> str | None:
+        if value is False or not self._holds(value):
+            return None
+
+        if value is True or self._specialization is not None:
+            return fold(None)
+
+        return fold(self.fold_condition(value))
+
+    def _fold_guard_flag(
+        self, guard: int, fold: Callable[[str | None], str]
+    ) -> str | None:
+        guard = self._specialize_guard(guard)
+
+        if guard == 0:
+            return None
+
+        return fold(self._fold_guard(guard) if guard != self._all() else None)
+
+    def _fold_guard(self, guard: int) -> str:
+        names = [name for name, _ in self.condition_table]
+        return self.fold_guard(
+            [
+                [(names[i], present) for i, present in sorted(cube.items())]
+                for cube in _aether_guard_cubes(guard, len(names))
+            ]
+        )
+
+    # Options of a selection, without the ones that cannot match when
+    # specializing
+    def _options(
+        self, node: TransmuterNonterminalTreeNode
+    ) -> list[TransmuterNonterminalTreeNode]:
+        options = [
+            c
+            for c in node.children
+            if isinstance(c, TransmuterNonterminalTreeNode)
+        ]
+
+        if self._specialization is None or len(options) == 1:
+            return options
+
+        live_options = []
+
+        for option in options:
+            primary = option.children[0]
+            assert isinstance(primary, TransmuterNonterminalTreeNode)
+
+            # A missing conditional option is skipped as a whole
+            if (
+                len(option.children) == 1
+                and primary.children[-1].type_ == Condition
+            ):
+                assert isinstance(
+                    primary.children[-1], TransmuterNonterminalTreeNode
+                )
+
+                if not self._holds(primary.children[-1]):
+                    continue
+
+            terminal_tags, nullable = self._first_terminal_tags(option, False)
+
+            if len(terminal_tags) > 0 or nullable:
+                live_options.append(option)
+
+        return live_options
+
+    def _fold_expression_selection(
+        self, node: TransmuterNonterminalTreeNode
+    ) -> str:
+        options = [
+            self._fold_expression_sequence(c) for c in self._options(node)
+        ]
+
+        if len(options) == 1:
+            return (
+                options[0]
+                if options[0] is not None
+                else self.fold_expression_empty()
+            )
+
+        return self.fold_expression_selection(
+            [o for o in options if o is not None],
+            not any(c.type_ == VerticalLine for c in node.children),
+        )
+
+    def _fold_expression_sequence(
+        self, node: TransmuterNonterminalTreeNode
+    ) -> str | None:
+        items = [
+            self._fold_expression_primary(c)
+            for c in node.children
+            if isinstance(c, TransmuterNonterminalTreeNode)
+        ]
+
+        if len(items) == 1:
+            return items[0]
+
+        present_items = [i for i in items if i is not None]
+
+        if len(present_items) == 0:
+            return self.fold_expression_empty()
+
+        if len(present_items) == 1:
+            return present_items[0]
+
+        return self.fold_expression_sequence(present_items)
+
+    # Missing conditional expressions are None when specializing
+    def _fold_expression_primary(
+        self, node: TransmuterNonterminalTreeNode
+    ) -> str | None:
+        assert len(node.children) > 0
+        child = node.children[0]
+        condition = node.children[-1]
+
+        if condition.type_ == Condition:
+            assert isinstance(condition, TransmuterNonterminalTreeNode)
+
+            if not self._holds(condition):
+                return None
+
+        if child.type_ == Identifier:
+            expression = self.fold_expression_call(child.end_terminal.value)
+        elif child.type_ == LeftParenthesis:
+            assert len(node.children) > 1
+            assert isinstance(node.children[1], TransmuterNonterminalTreeNode)
+            expression = self._fold_expression_selection(node.children[1])
+        else:
+            assert isinstance(child, TransmuterNonterminalTreeNode)
+            assert len(child.children) > 1
+            assert isinstance(child.children[1], TransmuterNonterminalTreeNode)
+            value = self._fold_expression_selection(child.children[1])
+            ordered = child.children[0].type_ in (
+                LeftSquareBracketSolidus,
+                LeftCurlyBracketSolidus,
+            )
+
+            if child.type_ == OptionalExpression:
+                expression = self.fold_expression_optional(value, ordered)
+            else:
+                assert child.type_ == IterationExpression
+                expression = self.fold_expression_iteration(value, ordered)
+
+        if condition.type_ == Condition and self._specialization is None:
+            assert isinstance(condition, TransmuterNonterminalTreeNode)
+            return self.fold_expression_conditional(
+                expression, self.fold_condition(condition)
+            )
+
+        return expression
+
+    def _fold_descend(
+        self, node: TransmuterNonterminalTreeNode, single: bool
+    ) -> str:
+        assert self._symbol is not None
+        options = self._options(node)
+        prefix = []
+
+        # The terminal tags leading the only option map one state to at most
+        # one state
+        if self.single_state and not single and len(options) == 1:
+            for primary in options[0].children:
+                assert isinstance(primary, TransmuterNonterminalTreeNode)
+
+                if (
+                    len(primary.children) > 1
+                    or primary.children[0].type_ != Identifier
+                    or primary.children[0].end_terminal.value
+                    in self.symbol_table.symbols
+                ):
+                    break
+
+                prefix.append(primary.children[0].end_terminal.value)
+
+            statements = self._fold_primaries(
+                options[0].children[len(prefix) :], 0, single, False
+            )
+        else:
+            statements = self._fold_selection(node, 0, single)
+
+        return self.fold_descend(statements, single, prefix)
+
+    def _fold_selection(
+        self, node: TransmuterNonterminalTreeNode, level: int, single: bool
+    ) -> list[str]:
+        options = self._options(node)
+
+        if len(options) == 1:
+            return self._fold_primaries(
+                options[0].children, level, single, False
+            )
+
+        ordered = single or not any(
+            c.type_ == VerticalLine for c in node.children
+        )
+        # Unordered options accumulate their states one level below
+        option_level = level + 1 if ordered else level + 2
+        folded_options = []
+
+        for i, option in enumerate(options, 1):
+            condition = None
+            primary = option.children[0]
+            assert isinstance(primary, TransmuterNonterminalTreeNode)
+
+            # A conditional option is skipped as a whole
+            if (
+                len(option.children) == 1
+                and primary.children[-1].type_ == Condition
+                and self._specialization is None
+            ):
+                assert isinstance(
+                    primary.children[-1], TransmuterNonterminalTreeNode
+                )
+                condition = self.fold_condition(primary.children[-1])
+
+            folded_options.append(
+                self.fold_option(
+                    self._fold_primaries(
+                        option.children,
+                        option_level,
+                        single,
+                        condition is not None,
+                    ),
+                    i,
+                    level,
+                    single,
+                    ordered,
+                    condition,
+                    self._fold_prediction(option, condition is not None),
+                )
+            )
+
+        return self.fold_selection(folded_options, level, single, ordered)
+
+    def _fold_primaries(
+        self,
+        nodes: list[TransmuterTreeNode],
+        level: int,
+        single: bool,
+        strip: bool,
+    ) -> list[str]:
+        statements = []
+
+        for node in nodes:
+            assert isinstance(node, TransmuterNonterminalTreeNode)
+            statements += self._fold_primary(node, level, single, strip)
+
+        return statements
+
+    def _fold_primary(
+        self,
+        node: TransmuterNonterminalTreeNode,
+        level: int,
+        single: bool,
+        strip: bool,
+    ) -> list[str]:
+        assert self._symbol is not None
+        assert len(node.children) > 0
+        condition = None
+
+        if node.children[-1].type_ == Condition and not strip:
+            assert isinstance(node.children[-1], TransmuterNonterminalTreeNode)
+
+            if self._specialization is None:
+                condition = self.fold_condition(node.children[-1])
+            elif not self._holds(node.children[-1]):
+                return []
+
+        child = node.children[0]
+
+        if child.type_ == Identifier:
+            name = child.end_terminal.value
+
+            if name in self.symbol_table.symbols:
+                self._references.add(name)
+
+            statements = [
+                self.fold_call(
+                    name,
+                    level,
+                    single,
+                    name not in self.symbol_table.symbols,
+                    (
+                        self._symbol_name
+                        if child.end_terminal in self._symbol.static_first
+                        or child.end_terminal in self._symbol.conditional_first
+                        else None
+                    ),
+                )
+            ]
+        elif child.type_ == LeftParenthesis:
+            assert len(node.children) > 1
+            assert isinstance(node.children[1], TransmuterNonterminalTreeNode)
+            statements = self._fold_selection(node.children[1], level, single)
+        else:
+            assert isinstance(child, TransmuterNonterminalTreeNode)
+            assert len(child.children) > 1
+            selection = child.children[1]
+            assert isinstance(selection, TransmuterNonterminalTreeNode)
+            ordered = single or child.children[0].type_ in (
+                LeftSquareBracketSolidus,
+                LeftCurlyBracketSolidus,
+            )
+            body = self._fold_selection(selection, level + 1, single)
+            prediction = self._fold_prediction(selection, False)
+
+            if child.type_ == OptionalExpression:
+                return self.fold_optional(
+                    body, level, single, ordered, condition, prediction
+                )
+
+            assert child.type_ == IterationExpression
+            return self.fold_iteration(
+                body, level, single, ordered, condition, prediction
+            )
+
+        if condition is not None:
+            return [self.fold_conditional(statements, condition)]
+
+        return statements
+
+    # Predictions are shared by the descents through both engines
+    def _fold_prediction(
+        self, node: TransmuterNonterminalTreeNode, strip: bool
+    ) -> int | None:
+        if not self.predict:
+            return None
+
+        if id(node) not in self._predictions:
+            terminal_tags, nullable = self._first_terminal_tags(node, strip)
+
+            if nullable:
+                return None
+
+            if list(terminal_tags) not in self._predictions_terminal_tags:
+                self._predictions_terminal_tags.append(list(terminal_tags))
+
+            self._predictions[id(node)] = (
+                self._predictions_terminal_tags.index(list(terminal_tags)) + 1
+            )
+
+        return self._predictions[id(node)]
+
+    # Over-approximates the first terminal tags for all conditions, so that a
+    # prediction never skips what could match, unless specializing
+    def _first_terminal_tags(
+        self, node: TransmuterNonterminalTreeNode, strip: bool
+    ) -> tuple[dict[str, None], bool]:
+        terminal_tags: dict[str, None] = {}
+
+        if node.type_ == SelectionExpression:
+            nullable = False
+
+            for child in self._options(node):
+                t, n = self._first_terminal_tags(child, strip)
+                terminal_tags |= t
+                nullable = nullable or n
+
+            return (terminal_tags, nullable)
+
+        if node.type_ == SequenceExpression:
+            for child in node.children:
+                assert isinstance(child, TransmuterNonterminalTreeNode)
+                t, n = self._first_terminal_tags(child, strip)
+                terminal_tags |= t
+
+                if not n:
+                    return (terminal_tags, False)
+
+            return (terminal_tags, True)
+
+        assert node.type_ == PrimaryExpression
+        assert len(node.children) > 0
+        child = node.children[0]
+
+        if (
+            node.children[-1].type_ == Condition
+            and not strip
+            and self._specialization is not None
+        ):
+            assert isinstance(node.children[-1], TransmuterNonterminalTreeNode)
+
+            if not self._holds(node.children[-1]):
+                return (terminal_tags, True)
+
+        if child.type_ == Identifier:
+            name = child.end_terminal.value
+
+            if name not in self.symbol_table.symbols:
+                terminal_tags[name] = None
+                nullable = False
+            else:
+                symbol = self.symbol_table.symbols[name]
+                assert isinstance(symbol, SyntacticSymbol)
+                terminal_tags |= {
+                    t: None
+                    for t, guard in symbol.first_terminal_tags.items()
+                    if self._specialize_guard(guard) != 0
+                }
+                nullable = self._specialize_guard(symbol.nullable) != 0
+        elif child.type_ == LeftParenthesis:
+            assert len(node.children) > 1
+            assert isinstance(node.children[1], TransmuterNonterminalTreeNode)
+            terminal_tags, nullable = self._first_terminal_tags(
+                node.children[1], False
+            )
+        else:
+            assert isinstance(child, TransmuterNonterminalTreeNode)
+            assert len(child.children) > 1
+            assert isinstance(child.children[1], TransmuterNonterminalTreeNode)
+            terminal_tags, _ = self._first_terminal_tags(
+                child.children[1], False
+            )
+            nullable = True
+
+        # A missing conditional expression matches the empty string
+        if (
+            node.children[-1].type_ == Condition
+            and not strip
+            and self._specialization is None
+        ):
+            nullable = True
+
+        return (terminal_tags, nullable)
+
+    def fold_file(
+        self,
+        terminal_tag_names: list[str],
+        nonterminal_type_names: list[str],
+        nonterminal_types: list[str],
+        tables: list[str],
+        specializations: list[str],
+        dispatcher: str | None,
+        precedences: bool,
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_tables(
+        self,
+        conditions: list[str],
+        start: str,
+        first: dict[str, list[str]],
+        first_terminal_tags: dict[str, list[str]],
+        deterministic: list[str],
+        scc: dict[str, list[str]],
+        ascend_parents: dict[str, list[str]],
+        commit: list[str],
+        levels: dict[str, dict[str, tuple[int, bool]]],
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_specialization(
+        self,
+        index: int,
+        nonterminal_type_names: list[str],
+        nonterminal_types: list[str],
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_dispatcher(self, specializations: list[list[str]]) -> str:
+        raise NotImplementedError()
+
+    def fold_nonterminal_type(
+        self,
+        name: str,
+        predictions: list[str],
+        start: str | None,
+        commit: str | None,
+        precedences: str | None,
+        first: str | None,
+        first_terminal_tags: str,
+        nullable: str | None,
+        deterministic: str | None,
+        expression: str,
+        descend: str,
+        descend_single: str | None,
+        specialization: int | None,
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_guard(self, value: list[list[tuple[str, bool]]]) -> str:
+        raise NotImplementedError()
+
+    def fold_conditions(self, value: list[str]) -> str:
+        raise NotImplementedError()
+
+    def fold_prediction(self, index: int, terminal_tags: list[str]) -> str:
+        raise NotImplementedError()
+
+    def fold_start(self, value: str | None) -> str:
+        raise NotImplementedError()
+
+    def fold_commit(self, value: str | None) -> str:
+        raise NotImplementedError()
+
+    def fold_precedences(self, precedences: list[str]) -> str:
+        raise NotImplementedError()
+
+    def fold_precedence(
+        self, left: bool, terminal_tags: list[str], condition: str | None
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_first(
+        self, static_first: list[str], conditional_first: list[str]
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_conditional_first(self, value: str, condition: str) -> str:
+        raise NotImplementedError()
+
+    def fold_first_terminal_tags(
+        self,
+        static_first_terminal_tags: list[str],
+        conditional_first_terminal_tags: list[str],
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_conditional_first_terminal_tags(
+        self, value: list[str], condition: str
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_nullable(self, value: str | None) -> str:
+        raise NotImplementedError()
+
+    def fold_deterministic(self, value: str | None) -> str:
+        raise NotImplementedError()
+
+    def fold_expression(self, value: str) -> str:
+        raise NotImplementedError()
+
+    def fold_expression_selection(
+        self, options: list[str], ordered: bool
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_expression_sequence(self, items: list[str]) -> str:
+        raise NotImplementedError()
+
+    def fold_expression_optional(self, value: str, ordered: bool) -> str:
+        raise NotImplementedError()
+
+    def fold_expression_iteration(self, value: str, ordered: bool) -> str:
+        raise NotImplementedError()
+
+    def fold_expression_conditional(self, value: str, condition: str) -> str:
+        raise NotImplementedError()
+
+    def fold_expression_call(self, name: str) -> str:
+        raise NotImplementedError()
+
+    def fold_expression_empty(self) -> str:
+        raise NotImplementedError()
+
+    # Statements are folded at a level, the nesting depth of the states
+    def fold_descend(
+        self, statements: list[str], single: bool, prefix: list[str]
+    ) -> str:
+        raise NotImplementedError()
+
+    def fold_selection(
+        self, options: list[list[str]], level: int, single: bool, ordered: bool
+    ) -> list[str]:
+        raise NotImplementedError()
+
+    def fold_option(
+        self,
+        statements: list[str],
+        index: int,
+        level: int,
+        single: bool,
+        ordered: bool,
+        condition: str | None,
+        prediction: int | None,
+    ) -> list[str]:
+        raise NotImplementedError()
+
+    def fold_optional(
+        self,
+        statements: list[str],
+        level: int,
+        single: bool,
+        ordered: bool,
+        condition: str | None,
+        prediction: int | None,
+    ) -> list[str]:
+        raise NotImplementedError()
+
+    def fold_iteration(
+        self,
+        statements: list[str],
+        level: int,
+        single: bool,
+        ordered: bool,
+        condition: str | None,
+        prediction: int | None,
+    ) -> list[str]:
+        raise NotImplementedError()
+
+    def fold_conditional(self, statements: list[str], condition: str) -> str:
+        raise NotImplementedError()
+
+    def fold_call(
+        self,
+        name: str,
+        level: int,
+        single: bool,
+        terminal_tag: bool,
+        ascend: str | None,
+    ) -> str:
+        raise NotImplementedError()
@@ -16,6 +16,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import builtins
+from collections.abc import Callable
 
 from ...semantic.common import TransmuterNonterminalTreeNode
 from ..semantic import (
@@ -29,6 +30,7 @@ from .common import (
     AetherCommonFileFold,
     AetherConditionFold,
     AetherLexicalFileFold,
+    AetherSyntacticFileFold,
 )
 
 
@@ -44,8 +46,11 @@ def _escape_identifier(value: str) -> str:
             "break",
             "case",
             "class",
+            "cls",
             "Conditions",
+            "conditions",
             "continue",
+            "current_state",
             "def",
             "del",
             "elif",
@@ -53,6 +58,8 @@ def _escape_identifier(value: str) -> str:
             "except",
             "False",
             "finally",
+            "first",
+            "first_terminal_tags",
             "for",
             "from",
             "global",
@@ -62,23 +69,36 @@ def _escape_identifier(value: str) -> str:
             "is",
             "lambda",
             "Lexer",
+            "MappingProxyType",
             "match",
             "None",
             "nonlocal",
             "not",
             "or",
             "Parser",
+            "parser",
             "pass",
+            "precedences",
             "raise",
             "return",
+            "specialized_lexer",
+            "SPECIALIZED_LEXERS",
+            "specialized_parser",
+            "SPECIALIZED_PARSERS",
             "TransmuterCondition",
             "TransmuterConditions",
-            "TransmuterInternalError",
+            "TransmuterExpression",
+            "TransmuterIteration",
             "TransmuterLexer",
             "TransmuterLexingState",
             "TransmuterNonterminalType",
+            "TransmuterOptional",
             "TransmuterParser",
+            "TransmuterParserTables",
             "TransmuterParsingState",
+            "TransmuterPrecedence",
+            "TransmuterSelection",
+            "TransmuterSequence",
             "transmuter_selection",
             "TransmuterTerminalTag",
             "True",
@@ -105,6 +125,62 @@ def _escape_char(value: str) -> str:
     return value
 
 
+def _conditions_value(conditions: list[str]) -> str:
+    if len(conditions) == 0:
+        return "Conditions(0)"
+
+    return " | ".join(
+        f"Conditions.{_escape_identifier(c)}" for c in conditions
+    )
+
+
+def _set(value: list[str]) -> str:
+    if len(value) == 0:
+        return "set()"
+
+    return f"{{{', '.join(_escape_identifier(v) for v in value)}}}"
+
+
+def _dict[T](value: dict[str, T], fold: Callable[[T], str]) -> str:
+    return f"{{{', '.join(f'{_escape_identifier(k)}: {fold(v)}' for k, v in value.items())}}}"
+
+
+def _frozenset(value: list[str]) -> str:
+    if len(value) == 0:
+        return "frozenset()"
+
+    return f"frozenset({_set(value)})"
+
+
+def _tuple(value: list[str]) -> str:
+    if len(value) == 1:
+        return f"({_escape_identifier(value[0])},)"
+
+    return f"({', '.join(_escape_identifier(v) for v in value)})"
+
+
+def _mapping[T](value: dict[str, T], fold: Callable[[T], str]) -> str:
+    return f"MappingProxyType({_dict(value, fold)})"
+
+
+# Compound statements are surrounded by blank lines
+def _join_statements(statements: list[str]) -> str:
+    joined = ""
+
+    for i, statement in enumerate(statements):
+        if i > 0:
+            joined += (
+                "\n\n"
+                if statement.startswith(("if ", "while ", "for "))
+                or statements[i - 1].startswith(("if ", "while ", "for "))
+                else "\n"
+            )
+
+        joined += statement
+
+    return joined
+
+
 class CommonFileFold(AetherCommonFileFold):
     def fold_file(self, conditions: list[str]) -> str:
         return f"from transmuter.front.common import TransmuterConditions, TransmuterCondition\n\n\nclass Conditions(TransmuterConditions):\n    {'\n    '.join(conditions)}"
@@ -146,9 +222,26 @@ class ConditionFold(AetherConditionFold):
 
 class LexicalFileFold(AetherLexicalFileFold):
     def fold_file(
-        self, terminal_tag_names: list[str], terminal_tags: list[str]
+        self,
+        terminal_tag_names: list[str],
+        terminal_tags: list[str],
+        specializations: list[str],
+        dispatcher: str | None,
+    ) -> str:
+        file = f"from transmuter.front.lexical import TransmuterTerminalTag, TransmuterLexer\nfrom .common import Conditions\n\n\n{'\n\n\n'.join(terminal_tags)}\n\n\nclass Lexer(TransmuterLexer):\n    TERMINAL_TAGS = [{', '.join(_escape_identifier(t) for t in terminal_tag_names)}]"
+
+        if dispatcher is not None:
+            file += f"\n\n\n{'\n\n\n'.join(specializations)}\n\n\n{dispatcher}"
+
+        return file
+
+    def fold_specialization(
+        self, index: int, terminal_tag_names: list[str]
     ) -> str:
-        return f"from transmuter.front.lexical import TransmuterTerminalTag, TransmuterLexer\nfrom .common import Conditions\n\n\n{'\n\n\n'.join(terminal_tags)}\n\n\nclass Lexer(TransmuterLexer):\n    TERMINAL_TAGS = [{', '.join(_escape_identifier(t) for t in terminal_tag_names)}]"
+        return f"class Lexer__{index}(Lexer):\n    TERMINAL_TAGS = [{', '.join(_escape_identifier(t) for t in terminal_tag_names)}]"
+
+    def fold_dispatcher(self, specializations: list[list[str]]) -> str:
+        return f"SPECIALIZED_LEXERS = {{{', '.join(f'{_conditions_value(c)}: Lexer__{i}' for i, c in enumerate(specializations, 1))}}}\n\n\ndef specialized_lexer(conditions):\n    return SPECIALIZED_LEXERS.get(conditions, Lexer)"
 
     def fold_terminal_tag(
         self,
@@ -313,3 +406,464 @@ class LexicalFileFold(AetherLexicalFileFold):
             state += f"\n    next_states |= {' | '.join(f'1 << {n}' for n in value.next_states_indexes)}"
 
         return state
+
+
+class SyntacticFileFold(AetherSyntacticFileFold):
+    def fold_file(
+        self,
+        terminal_tag_names: list[str],
+        nonterminal_type_names: list[str],
+        nonterminal_types: list[str],
+        tables: list[str],
+        specializations: list[str],
+        dispatcher: str | None,
+        precedences: bool,
+    ) -> str:
+        file = f"from types import MappingProxyType\n\nfrom transmuter.front.common import TransmuterConditions\nfrom transmuter.front.lexical import TransmuterTerminalTag\nfrom transmuter.front.syntactic import transmuter_selection, TransmuterNonterminalType, {'TransmuterPrecedence, ' if precedences else ''}TransmuterSequence, TransmuterSelection, TransmuterOptional, TransmuterIteration, TransmuterExpression, TransmuterParsingState, TransmuterParserTables, TransmuterParser\nfrom .common import Conditions\nfrom .lexical import {', '.join(_escape_identifier(t) for t in terminal_tag_names)}\n\n\n{'\n\n\n'.join(nonterminal_types)}\n\n\nclass Parser(TransmuterParser):\n    NONTERMINAL_TYPES = [{', '.join(_escape_identifier(n) for n in nonterminal_type_names)}]"
+
+        if len(tables) > 0:
+            file += f"\n    TABLES = {{\n{self.indent(self.indent(',\n'.join(tables)))},\n    }}"
+
+        if dispatcher is not None:
+            file += f"\n\n\n{'\n\n\n'.join(specializations)}\n\n\n{dispatcher}"
+
+        return file
+
+    def fold_tables(
+        self,
+        conditions: list[str],
+        start: str,
+        first: dict[str, list[str]],
+        first_terminal_tags: dict[str, list[str]],
+        deterministic: list[str],
+        scc: dict[str, list[str]],
+        ascend_parents: dict[str, list[str]],
+        commit: list[str],
+        levels: dict[str, dict[str, tuple[int, bool]]],
+    ) -> str:
+        return f"{_conditions_value(conditions)}: TransmuterParserTables({_escape_identifier(start)}, {_mapping(first, _frozenset)}, {_mapping(first_terminal_tags, _frozenset)}, {_frozenset(deterministic)}, {_mapping(scc, _frozenset)}, {_mapping(ascend_parents, _tuple)}, {_frozenset(commit)}, {_mapping(levels, lambda v: f'MappingProxyType({{{', '.join(f'{_escape_identifier(t)}: {level}' for t, level in v.items())}}})')})"
+
+    # Specialized nonterminal types and parsers are suffixed with their index
+    def fold_specialization(
+        self,
+        index: int,
+        nonterminal_type_names: list[str],
+        nonterminal_types: list[str],
+    ) -> str:
+        parser = f"class Parser__{index}(Parser):\n    SPECIALIZED_NONTERMINAL_TYPES = {{{', '.join(f'{_escape_identifier(n)}: {_escape_identifier(n)}__{index}' for n in nonterminal_type_names)}}}"
+        return "\n\n\n".join(nonterminal_types + [parser])
+
+    def fold_dispatcher(self, specializations: list[list[str]]) -> str:
+        return f"SPECIALIZED_PARSERS = {{{', '.join(f'{_conditions_value(c)}: Parser__{i}' for i, c in enumerate(specializations, 1))}}}\n\n\ndef specialized_parser(conditions: TransmuterConditions) -> type[TransmuterParser]:\n    return SPECIALIZED_PARSERS.get(conditions, Parser)"
+
+    def fold_nonterminal_type(
+        self,
+        name: str,
+        predictions: list[str],
+        start: str | None,
+        commit: str | None,
+        precedences: str | None,
+        first: str | None,
+        first_terminal_tags: str,
+        nullable: str | None,
+        deterministic: str | None,
+        expression: str,
+        descend: str,
+        descend_single: str | None,
+        specialization: int | None,
+    ) -> str:
+        members = []
+
+        if len(predictions) > 0:
+            members.append("\n".join(predictions))
+
+        for member in (
+            start,
+            commit,
+            precedences,
+            first,
+            first_terminal_tags,
+            nullable,
+            deterministic,
+            expression,
+            descend,
+            descend_single,
+        ):
+            if member is not None:
+                members.append(member)
+
+        if specialization is not None:
+            return f"class {_escape_identifier(name)}__{specialization}({_escape_identifier(name)}):\n{self.indent('\n\n'.join(members))}"
+
+        return f"class {_escape_identifier(name)}(TransmuterNonterminalType):\n{self.indent('\n\n'.join(members))}"
+
+    def fold_guard(self, value: list[list[tuple[str, bool]]]) -> str:
+        return " or ".join(
+            " and ".join(
+                f"Conditions.{_escape_identifier(name)} {'in' if present else 'not in'} conditions"
+                for name, present in cube
+            )
+            for cube in value
+        )
+
+    def fold_conditions(self, value: list[str]) -> str:
+        return " and ".join(f"({c})" if " or " in c else c for c in value)
+
+    def fold_prediction(self, index: int, terminal_tags: list[str]) -> str:
+        if len(terminal_tags) == 0:
+            return f"FIRST_TERMINAL_TAGS_{index} = frozenset()"
+
+        return f"FIRST_TERMINAL_TAGS_{index} = frozenset({{{', '.join(_escape_identifier(t) for t in terminal_tags)}}})"
+
+    def fold_start(self, value: str | None) -> str:
+        return f"@staticmethod\ndef start(conditions: TransmuterConditions) -> bool:\n    return {value if value is not None else 'True'}"
+
+    def fold_commit(self, value: str | None) -> str:
+        return f"@staticmethod\ndef commit(conditions: TransmuterConditions) -> bool:\n    return {value if value is not None else 'True'}"
+
+    def fold_precedences(self, precedences: list[str]) -> str:
+        head = "@staticmethod\ndef precedences(conditions: TransmuterConditions) -> list[TransmuterPrecedence]:\n"
+
+        if not any(p.startswith("if ") for p in precedences):
+            return f"{head}    return [{', '.join(precedences)}]"
+
+        statements = ["precedences = []"]
+
+        for precedence in precedences:
+            statements.append(
+                precedence
+                if precedence.startswith("if ")
+                else f"precedences.append({precedence})"
+            )
+
+        statements.append("return precedences")
+        return f"{head}{self.indent(_join_statements(statements))}"
+
+    def fold_precedence(
+        self, left: bool, terminal_tags: list[str], condition: str | None
+    ) -> str:
+        precedence = f"TransmuterPrecedence({left}, {{{', '.join(_escape_identifier(t) for t in terminal_tags)}}})"
+
+        if condition is not None:
+            return f"if {condition}:\n    precedences.append({precedence})"
+
+        return precedence
+
+    def fold_first(
+        self, static_first: list[str], conditional_first: list[str]
+    ) -> str:
+        first = "@staticmethod\ndef first(conditions: TransmuterConditions) -> set[type[TransmuterNonterminalType]]:\n"
+
+        if len(conditional_first) == 0:
+            return f"{first}    return {{{', '.join(_escape_identifier(f) for f in static_first)}}}"
+
+        if len(static_first) == 0:
+            first += "    first = set()\n"
+        else:
+            first += f"    first = {{{', '.join(_escape_identifier(f) for f in static_first)}}}\n"
+
+        first += f"\n{self.indent('\n\n'.join(conditional_first))}\n\n"
+        first += "    return first"
+        return first
+
+    def fold_conditional_first(self, value: str, condition: str) -> str:
+        return f"if {condition}:\n    first.add({_escape_identifier(value)})"
+
+    def fold_first_terminal_tags(
+        self,
+        static_first_terminal_tags: list[str],
+        conditional_first_terminal_tags: list[str],
+    ) -> str:
+        first_terminal_tags = "@staticmethod\ndef first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:\n"
+        static = (
+            f"{{{', '.join(_escape_identifier(t) for t in static_first_terminal_tags)}}}"
+            if len(static_first_terminal_tags) > 0
+            else "set()"
+        )
+
+        if len(conditional_first_terminal_tags) == 0:
+            return f"{first_terminal_tags}    return {static}"
+
+        first_terminal_tags += f"    first_terminal_tags = {static}\n"
+        first_terminal_tags += f"\n{self.indent('\n\n'.join(conditional_first_terminal_tags))}\n\n"
+        first_terminal_tags += "    return first_terminal_tags"
+        return first_terminal_tags
+
+    def fold_conditional_first_terminal_tags(
+        self, value: list[str], condition: str
+    ) -> str:
+        if len(value) == 1:
+            return f"if {condition}:\n    first_terminal_tags.add({_escape_identifier(value[0])})"
+
+        return f"if {condition}:\n    first_terminal_tags |= {{{', '.join(_escape_identifier(t) for t in value)}}}"
+
+    def fold_nullable(self, value: str | None) -> str:
+        return f"@staticmethod\ndef nullable(conditions: TransmuterConditions) -> bool:\n    return {value if value is not None else 'True'}"
+
+    def fold_deterministic(self, value: str | None) -> str:
+        return f"@staticmethod\ndef deterministic(conditions: TransmuterConditions) -> bool:\n    return {value if value is not None else 'True'}"
+
+    def fold_expression(self, value: str) -> str:
+        return f"@staticmethod\ndef expression(conditions: TransmuterConditions) -> TransmuterExpression:\n    return {value}"
+
+    def fold_expression_selection(
+        self, options: list[str], ordered: bool
+    ) -> str:
+        return f"TransmuterSelection(({', '.join(options)}), {ordered})"
+
+    def fold_expression_sequence(self, items: list[str]) -> str:
+        return f"TransmuterSequence(({', '.join(items)}))"
+
+    def fold_expression_optional(self, value: str, ordered: bool) -> str:
+        return f"TransmuterOptional({value}, {ordered})"
+
+    def fold_expression_iteration(self, value: str, ordered: bool) -> str:
+        return f"TransmuterIteration({value}, {ordered})"
+
+    def fold_expression_conditional(self, value: str, condition: str) -> str:
+        return f"{value} if {condition} else None"
+
+    def fold_expression_call(self, name: str) -> str:
+        return _escape_identifier(name)
+
+    def fold_expression_empty(self) -> str:
+        return "TransmuterSequence(())"
+
+    def fold_descend(
+        self, statements: list[str], single: bool, prefix: list[str]
+    ) -> str:
+        if single:
+            descend = "@classmethod\ndef descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:\n"
+            start = ["next_state0 = current_state"]
+        else:
+            descend = "@classmethod\ndef descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:\n"
+
+            if len(prefix) > 0:
+                start = []
+                state = "current_state"
+
+                for name in prefix:
+                    start.append(
+                        f"next_state0 = parser.{self._call_single_terminal_tag()}({_escape_identifier(name)}, {state})"
+                    )
+                    state = "next_state0"
+
+                start.append(
+                    "next_states0 = {next_state0} if next_state0 is not None else set()"
+                )
+            else:
+                start = ["next_states0 = {current_state}"]
+
+        return f"{descend}{self.indent(_join_statements(start + statements + [f'return {self._state(0, single)}']))}"
+
+    def fold_selection(
+        self, options: list[list[str]], level: int, single: bool, ordered: bool
+    ) -> list[str]:
+        statements = [s for option in options for s in option]
+
+        if ordered:
+            statements.append(
+                f"{self._state(level, single)} = {'None' if single else 'set()'}  # end selection"
+            )
+            return [
+                f"for _ in transmuter_selection:  # begin selection\n{self.indent(_join_statements(statements))}"
+            ]
+
+        return (
+            [f"{self._state(level + 1, single)} = set()  # begin selection"]
+            + statements
+            + [
+                f"{self._state(level, single)} = {self._state(level + 1, single)}  # end selection"
+            ]
+        )
+
+    def fold_option(
+        self,
+        statements: list[str],
+        index: int,
+        level: int,
+        single: bool,
+        ordered: bool,
+        condition: str | None,
+        prediction: int | None,
+    ) -> list[str]:
+        kind = (
+            f"conditional option {index}"
+            if condition is not None
+            else f"option {index}"
+        )
+        state = self._state(level, single)
+
+        if ordered:
+            option_state = self._state(level + 1, single)
+            end = f"if {self._test(option_state, single)}:\n    {state} = {option_state}\n    break  # end {kind}"
+        else:
+            option_state = self._state(level + 2, single)
+            end = f"{self._state(level + 1, single)} |= {option_state}  # end {kind}"
+
+        return self._fold_block(
+            statements,
+            end,
+            state,
+            option_state,
+            single,
+            kind,
+            condition,
+            prediction,
+        )
+
+    def fold_optional(
+        self,
+        statements: list[str],
+        level: int,
+        single: bool,
+        ordered: bool,
+        condition: str | None,
+        prediction: int | None,
+    ) -> list[str]:
+        kind = "conditional optional" if condition is not None else "optional"
+        state = self._state(level, single)
+        optional_state = self._state(level + 1, single)
+
+        if ordered:
+            end = f"if {self._test(optional_state, single)}:\n    {state} = {optional_state}  # end {kind}"
+        else:
+            end = f"{state} = {state} | {optional_state}  # end {kind}"
+
+        return self._fold_block(
+            statements,
+            end,
+            state,
+            optional_state,
+            single,
+            kind,
+            condition,
+            prediction,
+        )
+
+    def fold_iteration(
+        self,
+        statements: list[str],
+        level: int,
+        single: bool,
+        ordered: bool,
+        condition: str | None,
+        prediction: int | None,
+    ) -> list[str]:
+        kind = (
+            "conditional iteration" if condition is not None else "iteration"
+        )
+        begin = f"  # begin {kind}" if condition is None else ""
+        state = self._state(level, single)
+        iteration_state = self._state(level + 1, single)
+        end = [f"if {self._test(iteration_state, single, False)}:\n    break"]
+
+        if prediction is not None:
+            statements = [
+                f"{iteration_state} = parser.{'predict_single' if single else 'predict'}(cls.FIRST_TERMINAL_TAGS_{prediction}, {iteration_state if not ordered else state})",
+                f"if {self._test(iteration_state, single)}:\n{self.indent(_join_statements(statements))}",
+            ]
+
+        if ordered:
+            if prediction is None:
+                statements = [f"{iteration_state} = {state}"] + statements
+
+            end.append(f"{state} = {iteration_state}  # end {kind}")
+            iteration = [
+                f"while True:{begin}\n{self.indent(_join_statements(statements + end))}"
+            ]
+        else:
+            end.append(f"{state} = {state} | {iteration_state}  # end {kind}")
+            iteration = [
+                f"{iteration_state} = {state}{begin}",
+                f"while True:\n{self.indent(_join_statements(statements + end))}",
+            ]
+
+        if condition is not None:
+            return [
+                f"if {self._parser_condition(condition)}:  # begin {kind}\n{self.indent(_join_statements(iteration))}"
+            ]
+
+        return iteration
+
+    def fold_conditional(self, statements: list[str], condition: str) -> str:
+        return f"if {self._parser_condition(condition)}:\n{self.indent(_join_statements(statements))}"
+
+    def fold_call(
+        self,
+        name: str,
+        level: int,
+        single: bool,
+        terminal_tag: bool,
+        ascend: str | None,
+    ) -> str:
+        state = self._state(level, single)
+
+        if single:
+            function = (
+                self._call_single_terminal_tag()
+                if terminal_tag
+                else "call_single"
+            )
+            return f"{state} = parser.{function}({_escape_identifier(name)}, {state})"
+
+        if terminal_tag and self.direct_terminal_tag_calls:
+            return f"{state} = parser.call_terminal_tag({_escape_identifier(name)}, {state})"
+
+        # Specialized descents ascend to the generic nonterminal types
+        if ascend is not None and self._specialization is not None:
+            return f"{state} = parser.call({_escape_identifier(name)}, {state}, {_escape_identifier(ascend)})"
+
+        return f"{state} = parser.call({_escape_identifier(name)}, {state}{', cls' if ascend is not None else ''})"
+
+    # Blocks start from a copy of the states, or from the predicted states
+    def _fold_block(
+        self,
+        statements: list[str],
+        end: str,
+        state: str,
+        block_state: str,
+        single: bool,
+        kind: str,
+        condition: str | None,
+        prediction: int | None,
+    ) -> list[str]:
+        begin = f"  # begin {kind}" if condition is None else ""
+
+        if prediction is not None:
+            block = [
+                f"{block_state} = parser.{'predict_single' if single else 'predict'}(cls.FIRST_TERMINAL_TAGS_{prediction}, {state}){begin}",
+                f"if {self._test(block_state, single)}:\n{self.indent(_join_statements(statements + [end]))}",
+            ]
+        else:
+            block = [f"{block_state} = {state}{begin}"] + statements + [end]
+
+        if condition is not None:
+            return [
+                f"if {self._parser_condition(condition)}:  # begin {kind}\n{self.indent(_join_statements(block))}"
+            ]
+
+        return block
+
+    def _call_single_terminal_tag(self) -> str:
+        return (
+            "call_single_terminal_tag"
+            if self.direct_terminal_tag_calls
+            else "call_single"
+        )
+
+    @staticmethod
+    def _state(level: int, single: bool) -> str:
+        return f"next_state{level}" if single else f"next_states{level}"
+
+    @staticmethod
+    def _test(state: str, single: bool, success: bool = True) -> str:
+        if single:
+            return f"{state} is not None" if success else f"{state} is None"
+
+        return f"len({state}) != 0" if success else f"len({state}) == 0"
+
+    # Conditions folded for static methods are read from the lexer in descents
+    @staticmethod
+    def _parser_condition(value: str) -> str:
+        return value.replace(" in conditions", " in parser.lexer.conditions")
@@ -397,6 +397,147 @@ class Start(TransmuterTerminalTag):
         return (state_accept, next_states)
 
 
+class Commit(TransmuterTerminalTag):
+    @staticmethod
+    def start(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic in conditions
+
+    @staticmethod
+    def negatives(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        negatives = {Identifier}
+        return negatives
+
+    @staticmethod
+    def nfa(current_states: TransmuterLexingState, char: str) -> tuple[bool, TransmuterLexingState]:
+        state_accept = False
+        next_states = 0
+
+        # 33:32
+        # S0
+        if 1 & current_states and (char == "c"):
+            # S1
+            next_states |= 2
+
+        # 33:33
+        # S1
+        if 2 & current_states and (char == "o"):
+            # S2
+            next_states |= 4
+
+        # 33:34
+        # S2
+        if 4 & current_states and (char == "m"):
+            # S3
+            next_states |= 8
+
+        # 33:35
+        # S3
+        if 8 & current_states and (char == "m"):
+            # S4
+            next_states |= 16
+
+        # 33:36
+        # S4
+        if 16 & current_states and (char == "i"):
+            # S5
+            next_states |= 32
+
+        # 33:37
+        # S5
+        if 32 & current_states and (char == "t"):
+            state_accept = True
+
+        return (state_accept, next_states)
+
+
+class Left(TransmuterTerminalTag):
+    @staticmethod
+    def start(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic in conditions
+
+    @staticmethod
+    def negatives(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        negatives = {Identifier}
+        return negatives
+
+    @staticmethod
+    def nfa(current_states: TransmuterLexingState, char: str) -> tuple[bool, TransmuterLexingState]:
+        state_accept = False
+        next_states = 0
+
+        # 35:30
+        # S0
+        if 1 & current_states and (char == "l"):
+            # S1
+            next_states |= 2
+
+        # 35:31
+        # S1
+        if 2 & current_states and (char == "e"):
+            # S2
+            next_states |= 4
+
+        # 35:32
+        # S2
+        if 4 & current_states and (char == "f"):
+            # S3
+            next_states |= 8
+
+        # 35:33
+        # S3
+        if 8 & current_states and (char == "t"):
+            state_accept = True
+
+        return (state_accept, next_states)
+
+
+class Right(TransmuterTerminalTag):
+    @staticmethod
+    def start(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic in conditions
+
+    @staticmethod
+    def negatives(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        negatives = {Identifier}
+        return negatives
+
+    @staticmethod
+    def nfa(current_states: TransmuterLexingState, char: str) -> tuple[bool, TransmuterLexingState]:
+        state_accept = False
+        next_states = 0
+
+        # 37:31
+        # S0
+        if 1 & current_states and (char == "r"):
+            # S1
+            next_states |= 2
+
+        # 37:32
+        # S1
+        if 2 & current_states and (char == "i"):
+            # S2
+            next_states |= 4
+
+        # 37:33
+        # S2
+        if 4 & current_states and (char == "g"):
+            # S3
+            next_states |= 8
+
+        # 37:34
+        # S3
+        if 8 & current_states and (char == "h"):
+            # S4
+            next_states |= 16
+
+        # 37:35
+        # S4
+        if 16 & current_states and (char == "t"):
+            state_accept = True
+
+        return (state_accept, next_states)
+
+
 class Asterisk(TransmuterTerminalTag):
     @staticmethod
     def start(conditions: TransmuterConditions) -> bool:
@@ -407,7 +548,7 @@ class Asterisk(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 33:19
+        # 39:19
         if char == "*":
             state_accept = True
 
@@ -424,7 +565,7 @@ class QuestionMark(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 35:23
+        # 41:23
         if char == "?":
             state_accept = True
 
@@ -441,55 +582,55 @@ class ExpressionRange(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 37:26
+        # 43:26
         # S0
         if 1 & current_states and (char == "{"):
             # S1 | S2
             next_states |= 6
 
-        # 37:30
+        # 43:30
         # S1
         if 2 & current_states and (char == "0"):
             # S4 | S8
             next_states |= 272
 
-        # 37:34
+        # 43:34
         # S2
         if 4 & current_states and ("1" <= char <= "9"):
             # S3 | S4 | S8
             next_states |= 280
 
-        # 37:40
+        # 43:40
         # S3
         if 8 & current_states and ("0" <= char <= "9"):
             # S3 | S4 | S8
             next_states |= 280
 
-        # 37:49
+        # 43:49
         # S4
         if 16 & current_states and (char == ","):
             # S5 | S6 | S8
             next_states |= 352
 
-        # 37:52
+        # 43:52
         # S5
         if 32 & current_states and (char == "0"):
             # S8
             next_states |= 256
 
-        # 37:56
+        # 43:56
         # S6
         if 64 & current_states and ("1" <= char <= "9"):
             # S7 | S8
             next_states |= 384
 
-        # 37:62
+        # 43:62
         # S7
         if 128 & current_states and ("0" <= char <= "9"):
             # S7 | S8
             next_states |= 384
 
-        # 37:73
+        # 43:73
         # S8
         if 256 & current_states and (char == "}"):
             state_accept = True
@@ -507,7 +648,7 @@ class LeftCurlyBracket(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 39:29
+        # 45:29
         if char == "{":
             state_accept = True
 
@@ -524,13 +665,13 @@ class LeftCurlyBracketSolidus(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 41:36
+        # 47:36
         # S0
         if 1 & current_states and (char == "{"):
             # S1
             next_states |= 2
 
-        # 41:39
+        # 47:39
         # S1
         if 2 & current_states and (char == "/"):
             state_accept = True
@@ -548,7 +689,7 @@ class RightCurlyBracket(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 43:30
+        # 49:30
         if char == "}":
             state_accept = True
 
@@ -565,7 +706,7 @@ class OrdChar(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 45:18
+        # 51:18
         if not ("\000" <= char <= "\037" or char in " $()*+.;?[\\^{|\177"):
             state_accept = True
 
@@ -582,18 +723,18 @@ class QuotedChar(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 47:21
+        # 53:21
         # S0
         if 1 & current_states and (char == "\\"):
             # S1 | S2
             next_states |= 6
 
-        # 47:25
+        # 53:25
         # S1
         if 2 & current_states and (char in " $()*+.;?[\\^abfnrtv{|"):
             state_accept = True
 
-        # 47:52
+        # 53:52
         # S2
         if 4 & current_states and (char in "01"):
             # S3
@@ -623,7 +764,7 @@ class FullStop(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 49:19
+        # 55:19
         if char == ".":
             state_accept = True
 
@@ -640,37 +781,37 @@ class BracketExpression(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 51:28
+        # 57:28
         # S0
         if 1 & current_states and (char == "["):
             # S1 | S2 | S3 | S8
             next_states |= 270
 
-        # 51:32
+        # 57:32
         # S1
         if 2 & current_states and (char == "^"):
             # S2 | S3
             next_states |= 12
 
-        # 51:37
+        # 57:37
         # S2
         if 4 & current_states and (not ("\000" <= char <= "\037" or char in "\\^\177")):
             # S10 | S17 | S18 | S30 | S31
             next_states |= 3221619712
 
-        # 51:59
+        # 57:59
         # S3
         if 8 & current_states and (char == "\\"):
             # S4 | S5
             next_states |= 48
 
-        # 51:63
+        # 57:63
         # S4
         if 16 & current_states and (char in "\\abfnrtv"):
             # S10 | S17 | S18 | S30 | S31
             next_states |= 3221619712
 
-        # 51:77
+        # 57:77
         # S5
         if 32 & current_states and (char in "01"):
             # S6
@@ -688,43 +829,43 @@ class BracketExpression(TransmuterTerminalTag):
             # S10 | S17 | S18 | S30 | S31
             next_states |= 3221619712
 
-        # 51:95
+        # 57:95
         # S8
         if 256 & current_states and (char == "^"):
             # S9
             next_states |= 512
 
-        # 51:98
+        # 57:98
         # S9
         if 512 & current_states and (char == "^"):
             # S10 | S17 | S18 | S30 | S31
             next_states |= 3221619712
 
-        # 51:103
+        # 57:103
         # S10
         if 1024 & current_states and (char == "-"):
             # S11 | S12
             next_states |= 6144
 
-        # 51:106
+        # 57:106
         # S11
         if 2048 & current_states and (not (char == "]" or "\000" <= char <= "\037" or char in "\\\177")):
             # S17 | S18 | S30 | S31
             next_states |= 3221618688
 
-        # 51:128
+        # 57:128
         # S12
         if 4096 & current_states and (char == "\\"):
             # S13 | S14
             next_states |= 24576
 
-        # 51:132
+        # 57:132
         # S13
         if 8192 & current_states and (char in "\\abfnrtv"):
             # S17 | S18 | S30 | S31
             next_states |= 3221618688
 
-        # 51:146
+        # 57:146
         # S14
         if 16384 & current_states and (char in "01"):
             # S15
@@ -742,25 +883,25 @@ class BracketExpression(TransmuterTerminalTag):
             # S17 | S18 | S30 | S31
             next_states |= 3221618688
 
-        # 51:166
+        # 57:166
         # S17
         if 131072 & current_states and (not (char == "]" or "\000" <= char <= "\037" or char in "\\\177-")):
             # S17 | S18 | S23 | S30 | S31
             next_states |= 3230007296
 
-        # 51:189
+        # 57:189
         # S18
         if 262144 & current_states and (char == "\\"):
             # S19 | S20
             next_states |= 1572864
 
-        # 51:193
+        # 57:193
         # S19
         if 524288 & current_states and (char in "\\abfnrtv"):
             # S17 | S18 | S23 | S30 | S31
             next_states |= 3230007296
 
-        # 51:207
+        # 57:207
         # S20
         if 1048576 & current_states and (char in "01"):
             # S21
@@ -778,31 +919,31 @@ class BracketExpression(TransmuterTerminalTag):
             # S17 | S18 | S23 | S30 | S31
             next_states |= 3230007296
 
-        # 51:224
+        # 57:224
         # S23
         if 8388608 & current_states and (char == "-"):
             # S24 | S25
             next_states |= 50331648
 
-        # 51:227
+        # 57:227
         # S24
         if 16777216 & current_states and (not (char == "]" or "\000" <= char <= "\037" or char in "\\\177")):
             # S17 | S18 | S30 | S31
             next_states |= 3221618688
 
-        # 51:249
+        # 57:249
         # S25
         if 33554432 & current_states and (char == "\\"):
             # S26 | S27
             next_states |= 201326592
 
-        # 51:253
+        # 57:253
         # S26
         if 67108864 & current_states and (char in "\\abfnrtv"):
             # S17 | S18 | S30 | S31
             next_states |= 3221618688
 
-        # 51:267
+        # 57:267
         # S27
         if 134217728 & current_states and (char in "01"):
             # S28
@@ -820,13 +961,13 @@ class BracketExpression(TransmuterTerminalTag):
             # S17 | S18 | S30 | S31
             next_states |= 3221618688
 
-        # 51:287
+        # 57:287
         # S30
         if 1073741824 & current_states and (char == "-"):
             # S31
             next_states |= 2147483648
 
-        # 51:290
+        # 57:290
         # S31
         if 2147483648 & current_states and (char == "]"):
             state_accept = True
@@ -845,7 +986,7 @@ class ExclamationMark(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 53:28
+        # 59:28
         if char == "!":
             state_accept = True
 
@@ -862,7 +1003,7 @@ class LeftSquareBracket(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 55:30
+        # 61:30
         if char == "[":
             state_accept = True
 
@@ -879,13 +1020,13 @@ class LeftSquareBracketSolidus(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 57:37
+        # 63:37
         # S0
         if 1 & current_states and (char == "["):
             # S1
             next_states |= 2
 
-        # 57:40
+        # 63:40
         # S1
         if 2 & current_states and (char == "/"):
             state_accept = True
@@ -903,7 +1044,7 @@ class RightSquareBracket(TransmuterTerminalTag):
         state_accept = False
         next_states = 0
 
-        # 59:31
+        # 65:31
         if char == "]":
             state_accept = True
 
@@ -911,4 +1052,4 @@ class RightSquareBracket(TransmuterTerminalTag):
 
 
 class Lexer(TransmuterLexer):
-    TERMINAL_TAGS = [Whitespace, Identifier, Colon, Semicolon, CommercialAt, LeftParenthesis, RightParenthesis, VerticalLine, Solidus, DoubleVerticalLine, Comma, DoubleAmpersand, PlusSign, HyphenMinus, Ignore, Start, Asterisk, QuestionMark, ExpressionRange, LeftCurlyBracket, LeftCurlyBracketSolidus, RightCurlyBracket, OrdChar, QuotedChar, FullStop, BracketExpression, ExclamationMark, LeftSquareBracket, LeftSquareBracketSolidus, RightSquareBracket]
+    TERMINAL_TAGS = [Whitespace, Identifier, Colon, Semicolon, CommercialAt, LeftParenthesis, RightParenthesis, VerticalLine, Solidus, DoubleVerticalLine, Comma, DoubleAmpersand, PlusSign, HyphenMinus, Ignore, Start, Commit, Left, Right, Asterisk, QuestionMark, ExpressionRange, LeftCurlyBracket, LeftCurlyBracketSolidus, RightCurlyBracket, OrdChar, QuotedChar, FullStop, BracketExpression, ExclamationMark, LeftSquareBracket, LeftSquareBracketSolidus, RightSquareBracket]
@@ -40,6 +40,10 @@ from .lexical import (
     PlusSign,
     HyphenMinus,
     Ignore,
+    Start,
+    Commit,
+    Left,
+    Right,
     Asterisk,
     QuestionMark,
     ExpressionRange,
@@ -47,6 +51,8 @@ from .lexical import (
     QuotedChar,
     FullStop,
     BracketExpression,
+    LeftCurlyBracket,
+    LeftSquareBracket,
 )
 from .syntactic import (
     Production,
@@ -664,17 +670,267 @@ class _SyntacticFold(TransmuterTreeFold[_SyntacticFragment]):
         return None
 
 
+# Conditions-dependent properties are represented as guards, bitmasks where
+# bit i is set if the property holds for the conditions value i.
+@dataclass
+class _SyntacticConditionFold(TransmuterTreeFold[int]):
+    conditions: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    all_: int = field(default=0, init=False, repr=False)
+
+    def fold_internal(
+        self, node: TransmuterNonterminalTreeNode, children: list[int]
+    ) -> int | None:
+        if len(children) == 0:
+            return None
+
+        if len(children) == 1:
+            if node.type_ == NegationCondition and len(node.children) % 2 == 0:
+                return self.all_ & ~children[0]
+
+            return children[0]
+
+        guard = children[0]
+
+        if node.type_ == DisjunctionCondition:
+            for i in range(1, len(children)):
+                guard |= children[i]
+        else:
+            assert node.type_ == ConjunctionCondition
+
+            for i in range(1, len(children)):
+                guard &= children[i]
+
+        return guard
+
+    def fold_external(self, node: TransmuterTerminalTreeNode) -> int | None:
+        if node.type_ == Identifier:
+            assert node.end_terminal.value in self.conditions
+            return self.conditions[node.end_terminal.value]
+
+        return None
+
+    def fold_condition(self, node: TransmuterTreeNode) -> int:
+        assert isinstance(node, TransmuterNonterminalTreeNode)
+        self.tree = node
+        self.visit()
+        assert len(self.fold_queue) > 0
+        assert self.fold_queue[0] is not None
+        return self.fold_queue[0]
+
+
+@dataclass
+class _SyntacticPredictFragment:
+    first_terminal_tags: dict[str, int]
+    nullable: int
+    # Conditions values for which a conditional expression is present
+    guard: int
+
+
+@dataclass
+class _SyntacticPredictFold(TransmuterTreeFold[_SyntacticPredictFragment]):
+    nonterminal_table: TransmuterSymbolTable[TransmuterNonterminalTreeNode] = (
+        field(init=False, repr=False)
+    )
+    condition_fold: _SyntacticConditionFold = field(init=False, repr=False)
+
+    def top_after(self) -> None:
+        assert len(self.fold_queue) > 0
+        fragment = self.fold_queue[0]
+
+        # A missing top-level conditional expression matches the empty string
+        if fragment is not None:
+            fragment.nullable |= self.condition_fold.all_ & ~fragment.guard
+            fragment.guard = self.condition_fold.all_
+
+    def fold_internal(
+        self,
+        node: TransmuterNonterminalTreeNode,
+        children: list[_SyntacticPredictFragment],
+    ) -> _SyntacticPredictFragment | None:
+        if len(children) == 0 or node.type_ in (
+            Condition,
+            DisjunctionCondition,
+            ConjunctionCondition,
+            NegationCondition,
+            PrimitiveCondition,
+        ):
+            return None
+
+        all_ = self.condition_fold.all_
+
+        if len(children) == 1:
+            if (
+                node.type_ == PrimaryExpression
+                and node.children[-1].type_ == Condition
+            ):
+                guard = self.condition_fold.fold_condition(node.children[-1])
+                children[0].first_terminal_tags = {
+                    t: g & guard
+                    for t, g in children[0].first_terminal_tags.items()
+                    if g & guard != 0
+                }
+                children[0].nullable &= guard
+                children[0].guard &= guard
+            elif node.type_ in (OptionalExpression, IterationExpression):
+                children[0].nullable = all_
+                children[0].guard = all_
+
+            return children[0]
+
+        first_terminal_tags: dict[str, int] = {}
+
+        # A missing option is removed from its selection
+        if node.type_ == SelectionExpression:
+            nullable = 0
+
+            for child in children:
+                for t, g in child.first_terminal_tags.items():
+                    first_terminal_tags[t] = first_terminal_tags.get(t, 0) | g
+
+                nullable |= child.nullable
+
+            return _SyntacticPredictFragment(
+                first_terminal_tags, nullable, all_
+            )
+
+        # A missing item matches the empty string
+        assert node.type_ == SequenceExpression
+        nullable = all_
+
+        for child in children:
+            for t, g in child.first_terminal_tags.items():
+                if g & nullable != 0:
+                    first_terminal_tags[t] = (
+                        first_terminal_tags.get(t, 0) | g & nullable
+                    )
+
+            nullable &= child.nullable | all_ & ~child.guard
+
+            if nullable == 0:
+                break
+
+        return _SyntacticPredictFragment(first_terminal_tags, nullable, all_)
+
+    def fold_external(
+        self, node: TransmuterTerminalTreeNode
+    ) -> _SyntacticPredictFragment | None:
+        if node.type_ != Identifier:
+            return None
+
+        all_ = self.condition_fold.all_
+        name = node.end_terminal.value
+
+        if name not in self.nonterminal_table.symbols:
+            return _SyntacticPredictFragment({name: all_}, 0, all_)
+
+        symbol = self.nonterminal_table.symbols[name]
+        assert isinstance(symbol, SyntacticSymbol)
+        return _SyntacticPredictFragment(
+            symbol.first_terminal_tags.copy(), symbol.nullable, all_
+        )
+
+
+# Unordered constructs may return multiple states from a single one, so they
+# are never deterministic.
+@dataclass
+class _SyntacticDeterminismFold(TransmuterTreeFold[int]):
+    nonterminal_table: TransmuterSymbolTable[TransmuterNonterminalTreeNode] = (
+        field(init=False, repr=False)
+    )
+    condition_fold: _SyntacticConditionFold = field(init=False, repr=False)
+
+    def fold_internal(
+        self, node: TransmuterNonterminalTreeNode, children: list[int]
+    ) -> int | None:
+        if len(children) == 0 or node.type_ in (
+            Condition,
+            DisjunctionCondition,
+            ConjunctionCondition,
+            NegationCondition,
+            PrimitiveCondition,
+        ):
+            return None
+
+        all_ = self.condition_fold.all_
+
+        if len(children) == 1:
+            if (
+                node.type_ == PrimaryExpression
+                and node.children[-1].type_ == Condition
+            ):
+                # A missing conditional expression is deterministic
+                guard = self.condition_fold.fold_condition(node.children[-1])
+                return children[0] | all_ & ~guard
+
+            if node.type_ in (
+                OptionalExpression,
+                IterationExpression,
+            ) and node.children[0].type_ in (
+                LeftSquareBracket,
+                LeftCurlyBracket,
+            ):
+                return 0
+
+            return children[0]
+
+        if node.type_ == SelectionExpression and any(
+            c.type_ == VerticalLine for c in node.children
+        ):
+            return 0
+
+        assert node.type_ in (SelectionExpression, SequenceExpression)
+        deterministic = children[0]
+
+        for i in range(1, len(children)):
+            deterministic &= children[i]
+
+        return deterministic
+
+    def fold_external(self, node: TransmuterTerminalTreeNode) -> int | None:
+        if node.type_ != Identifier:
+            return None
+
+        name = node.end_terminal.value
+
+        if name not in self.nonterminal_table.symbols:
+            return self.condition_fold.all_
+
+        symbol = self.nonterminal_table.symbols[name]
+        assert isinstance(symbol, SyntacticSymbol)
+        return symbol.deterministic
+
+
+@dataclass
+class SyntacticPrecedence:
+    left: bool
+    terminal_tags: list[TransmuterTerminal]
+    condition: TransmuterNonterminalTreeNode | None
+
+
 @dataclass
 class SyntacticSymbol(TransmuterSymbol[TransmuterNonterminalTreeNode]):
     start: TransmuterNonterminalTreeNode | bool = field(
         default=False, init=False
     )
+    commit: TransmuterNonterminalTreeNode | bool = field(
+        default=False, init=False
+    )
+    precedences: list[SyntacticPrecedence] = field(
+        default_factory=list, init=False
+    )
     static_first: list[TransmuterTerminal] = field(
         default_factory=list, init=False
     )
     conditional_first: dict[
         TransmuterTerminal, list[TransmuterNonterminalTreeNode]
     ] = field(default_factory=dict, init=False)
+    first_terminal_tags: dict[str, int] = field(
+        default_factory=dict, init=False
+    )
+    nullable: int = field(default=0, init=False)
+    deterministic: int = field(default=0, init=False)
 
 
 @dataclass
@@ -687,7 +943,7 @@ class SyntacticSymbolTableBuilder(TransmuterTreeVisitor):
     _fold: _SyntacticFold | None = field(default=None, init=False, repr=False)
 
     @staticmethod
-    def _process_start(symbol: SyntacticSymbol) -> None:
+    def _process_specifiers(symbol: SyntacticSymbol) -> None:
         assert symbol.definition is not None
         assert len(symbol.definition.children) > 0
         header = symbol.definition.children[0]
@@ -707,14 +963,32 @@ class SyntacticSymbolTableBuilder(TransmuterTreeVisitor):
         for i in range(0, len(specifiers.children[1].children), 2):
             specifier = specifiers.children[1].children[i]
             assert isinstance(specifier, TransmuterNonterminalTreeNode)
+            assert len(specifier.children) > 0
+            condition = None
 
-            if len(specifier.children) > 1:
+            if specifier.children[-1].type_ == Condition:
                 assert isinstance(
-                    specifier.children[1], TransmuterNonterminalTreeNode
+                    specifier.children[-1], TransmuterNonterminalTreeNode
                 )
-                symbol.start = specifier.children[1]
+                condition = specifier.children[-1]
+
+            if specifier.children[0].type_ == Start:
+                symbol.start = condition if condition is not None else True
+            elif specifier.children[0].type_ == Commit:
+                symbol.commit = condition if condition is not None else True
             else:
-                symbol.start = True
+                assert specifier.children[0].type_ in (Left, Right)
+                symbol.precedences.append(
+                    SyntacticPrecedence(
+                        specifier.children[0].type_ == Left,
+                        [
+                            c.end_terminal
+                            for c in specifier.children[1:]
+                            if c.type_ == Identifier
+                        ],
+                        condition,
+                    )
+                )
 
     def __post_init__(self) -> None:
         self.nonterminal_table = TransmuterSymbolTable[
@@ -756,6 +1030,15 @@ class SyntacticSymbolTableBuilder(TransmuterTreeVisitor):
                     node.children[0].end_terminal.value, type_=SyntacticSymbol
                 )
                 symbol.references.append(node)
+            elif node.type_ == ProductionSpecifier and node.children[
+                0
+            ].type_ in (Left, Right):
+                for child in node.children[1:]:
+                    if child.type_ == Identifier:
+                        symbol = self.nonterminal_table.add_get(
+                            child.end_terminal.value, type_=SyntacticSymbol
+                        )
+                        symbol.references.append(node)
             elif (
                 node.type_ == PrimitiveCondition
                 and node.children[0].type_ == Identifier
@@ -781,7 +1064,7 @@ class SyntacticSymbolTableBuilder(TransmuterTreeVisitor):
                     symbol.references[0].start_position,
                 )
 
-            self._process_start(symbol)
+            self._process_specifiers(symbol)
             self._process_first(symbol)
             first[name] = set(s.value for s in symbol.static_first)
             first[name].update(s.value for s in symbol.conditional_first)
@@ -819,6 +1102,17 @@ class SyntacticSymbolTableBuilder(TransmuterTreeVisitor):
                 if f.value in first2[name]
             }
 
+        condition_fold = _SyntacticConditionFold(self.tree)
+        values = 1 << len(self.condition_table.symbols)
+        condition_fold.all_ = (1 << values) - 1
+
+        for i, (name, _) in enumerate(self.condition_table):
+            condition_fold.conditions[name] = sum(
+                1 << v for v in range(values) if v >> i & 1
+            )
+
+        self._process_predict(condition_fold)
+        self._process_determinism(condition_fold)
         return False
 
     def _process_first(self, symbol: SyntacticSymbol) -> None:
@@ -853,3 +1147,107 @@ class SyntacticSymbolTableBuilder(TransmuterTreeVisitor):
                         )
                     else:
                         symbol.static_first.append(reference)
+
+    def _process_predict(
+        self, condition_fold: _SyntacticConditionFold
+    ) -> None:
+        fold = _SyntacticPredictFold(self.tree)
+        fold.nonterminal_table = self.nonterminal_table
+        fold.condition_fold = condition_fold
+        changed = True
+
+        # Iterate until the FIRST sets and nullables reach a fixpoint
+        while changed:
+            changed = False
+
+            for _, symbol in self.nonterminal_table:
+                assert isinstance(symbol, SyntacticSymbol)
+                assert symbol.definition is not None
+                assert len(symbol.definition.children) > 1
+                assert isinstance(
+                    symbol.definition.children[1],
+                    TransmuterNonterminalTreeNode,
+                )
+                assert len(symbol.definition.children[1].children) > 0
+                assert isinstance(
+                    symbol.definition.children[1].children[0],
+                    TransmuterNonterminalTreeNode,
+                )
+                fold.tree = symbol.definition.children[1].children[0]
+                fold.visit()
+                assert len(fold.fold_queue) > 0
+                fragment = fold.fold_queue[0]
+                assert fragment is not None
+
+                if (
+                    fragment.first_terminal_tags != symbol.first_terminal_tags
+                    or fragment.nullable != symbol.nullable
+                ):
+                    symbol.first_terminal_tags = fragment.first_terminal_tags
+                    symbol.nullable = fragment.nullable
+                    changed = True
+
+    def _process_determinism(
+        self, condition_fold: _SyntacticConditionFold
+    ) -> None:
+        all_ = condition_fold.all_
+        first = {}
+
+        for name, symbol in self.nonterminal_table:
+            assert isinstance(symbol, SyntacticSymbol)
+            first[name] = {f.value: all_ for f in symbol.static_first}
+
+            for f, conditions in symbol.conditional_first.items():
+                guard = all_
+
+                for condition in conditions:
+                    guard &= condition_fold.fold_condition(condition)
+
+                first[name][f.value] = first[name].get(f.value, 0) | guard
+
+            symbol.deterministic = all_
+
+        # Left-recursive nonterminals need the generalized engine
+        for v in range(all_.bit_length()):
+            sccs = transmuter_compute_sccs(
+                {
+                    name: {f for f in first[name] if first[name][f] >> v & 1}
+                    for name in first
+                }
+            )
+
+            for scc in sccs:
+                for name in scc:
+                    if len(scc) > 1 or first[name].get(name, 0) >> v & 1:
+                        symbol = self.nonterminal_table.symbols[name]
+                        assert isinstance(symbol, SyntacticSymbol)
+                        symbol.deterministic &= all_ & ~(1 << v)
+
+        fold = _SyntacticDeterminismFold(self.tree)
+        fold.nonterminal_table = self.nonterminal_table
+        fold.condition_fold = condition_fold
+        changed = True
+
+        # Iterate until the determinism guards reach a fixpoint
+        while changed:
+            changed = False
+
+            for _, symbol in self.nonterminal_table:
+                assert isinstance(symbol, SyntacticSymbol)
+                assert symbol.definition is not None
+                assert len(symbol.definition.children) > 1
+                assert isinstance(
+                    symbol.definition.children[1],
+                    TransmuterNonterminalTreeNode,
+                )
+                assert len(symbol.definition.children[1].children) > 0
+                fold.tree = symbol.definition.children[1].children[0]
+                fold.visit()
+                assert len(fold.fold_queue) > 0
+                deterministic = fold.fold_queue[0]
+                assert deterministic is not None
+                deterministic &= symbol.deterministic
+
+                if deterministic != symbol.deterministic:
+                    symbol.deterministic = deterministic
+                    changed = True
@@ -16,10 +16,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from types import MappingProxyType
+
 from ..common import TransmuterConditions
-from ..syntactic import transmuter_selection, TransmuterNonterminalType, TransmuterParsingState, TransmuterParser, TransmuterInternalError
+from ..lexical import TransmuterTerminalTag
+from ..syntactic import transmuter_selection, TransmuterNonterminalType, TransmuterSequence, TransmuterSelection, TransmuterOptional, TransmuterIteration, TransmuterExpression, TransmuterParsingState, TransmuterParserTables, TransmuterParser
 from .common import Conditions
-from .lexical import Whitespace, Identifier, Colon, Semicolon, CommercialAt, LeftParenthesis, RightParenthesis, VerticalLine, Solidus, DoubleVerticalLine, Comma, DoubleAmpersand, PlusSign, HyphenMinus, Ignore, Start, Asterisk, QuestionMark, ExpressionRange, LeftCurlyBracket, LeftCurlyBracketSolidus, RightCurlyBracket, OrdChar, QuotedChar, FullStop, BracketExpression, ExclamationMark, LeftSquareBracket, LeftSquareBracketSolidus, RightSquareBracket
+from .lexical import Whitespace, Identifier, Colon, Semicolon, CommercialAt, LeftParenthesis, RightParenthesis, VerticalLine, Solidus, DoubleVerticalLine, Comma, DoubleAmpersand, PlusSign, HyphenMinus, Ignore, Start, Commit, Left, Right, Asterisk, QuestionMark, ExpressionRange, LeftCurlyBracket, LeftCurlyBracketSolidus, RightCurlyBracket, OrdChar, QuotedChar, FullStop, BracketExpression, ExclamationMark, LeftSquareBracket, LeftSquareBracketSolidus, RightSquareBracket
 
 
 class Grammar(TransmuterNonterminalType):
@@ -27,6 +30,18 @@ class Grammar(TransmuterNonterminalType):
     def start(conditions: TransmuterConditions) -> bool:
         return True
 
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {Identifier}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((Production, TransmuterIteration(Production, True)))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
@@ -34,18 +49,49 @@ class Grammar(TransmuterNonterminalType):
 
         while True:  # begin iteration
             next_states1 = next_states0
+            next_states1 = parser.call(Production, next_states1)
 
-            try:
-                next_states1 = parser.call(Production, next_states1)
-            except TransmuterInternalError:
+            if len(next_states1) == 0:
                 break
 
             next_states0 = next_states1  # end iteration
 
         return next_states0
 
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(Production, next_state0)
+
+        while True:  # begin iteration
+            next_state1 = next_state0
+            next_state1 = parser.call_single(Production, next_state1)
+
+            if next_state1 is None:
+                break
+
+            next_state0 = next_state1  # end iteration
+
+        return next_state0
+
 
 class Production(TransmuterNonterminalType):
+    @staticmethod
+    def commit(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {Identifier}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((ProductionHeader, ProductionBody))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
@@ -53,8 +99,27 @@ class Production(TransmuterNonterminalType):
         next_states0 = parser.call(ProductionBody, next_states0)
         return next_states0
 
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(ProductionHeader, next_state0)
+        next_state0 = parser.call_single(ProductionBody, next_state0)
+        return next_state0
+
 
 class ProductionHeader(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {Identifier}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((Identifier, TransmuterOptional(Condition, True) if Conditions.lexical in conditions else None, TransmuterOptional(ProductionSpecifiers, True), Colon))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
@@ -62,27 +127,66 @@ class ProductionHeader(TransmuterNonterminalType):
 
         if Conditions.lexical in parser.lexer.conditions:  # begin conditional optional
             next_states1 = next_states0
+            next_states1 = parser.call(Condition, next_states1)
 
-            try:
-                next_states1 = parser.call(Condition, next_states1)
-            except TransmuterInternalError:
-                pass
-            else:
+            if len(next_states1) != 0:
                 next_states0 = next_states1  # end conditional optional
 
-        try:  # begin optional
-            next_states1 = next_states0
-            next_states1 = parser.call(ProductionSpecifiers, next_states1)
-        except TransmuterInternalError:
-            pass
-        else:
+        next_states1 = next_states0  # begin optional
+        next_states1 = parser.call(ProductionSpecifiers, next_states1)
+
+        if len(next_states1) != 0:
             next_states0 = next_states1  # end optional
 
         next_states0 = parser.call(Colon, next_states0)
         return next_states0
 
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(Identifier, next_state0)
+
+        if Conditions.lexical in parser.lexer.conditions:  # begin conditional optional
+            next_state1 = next_state0
+            next_state1 = parser.call_single(Condition, next_state1)
+
+            if next_state1 is not None:
+                next_state0 = next_state1  # end conditional optional
+
+        next_state1 = next_state0  # begin optional
+        next_state1 = parser.call_single(ProductionSpecifiers, next_state1)
+
+        if next_state1 is not None:
+            next_state0 = next_state1  # end optional
+
+        next_state0 = parser.call_single(Colon, next_state0)
+        return next_state0
+
 
 class ProductionBody(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        first_terminal_tags = set()
+
+        if Conditions.lexical in conditions:
+            first_terminal_tags |= {OrdChar, QuotedChar, FullStop, BracketExpression}
+
+        if Conditions.syntactic in conditions:
+            first_terminal_tags |= {Identifier, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}
+
+        if Conditions.syntactic in conditions or Conditions.lexical in conditions:
+            first_terminal_tags.add(LeftParenthesis)
+
+        return first_terminal_tags
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((SelectionExpression, Semicolon))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
@@ -90,8 +194,27 @@ class ProductionBody(TransmuterNonterminalType):
         next_states0 = parser.call(Semicolon, next_states0)
         return next_states0
 
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(SelectionExpression, next_state0)
+        next_state0 = parser.call_single(Semicolon, next_state0)
+        return next_state0
+
 
 class Condition(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {CommercialAt}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((CommercialAt, DisjunctionCondition))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
@@ -99,8 +222,27 @@ class Condition(TransmuterNonterminalType):
         next_states0 = parser.call(DisjunctionCondition, next_states0)
         return next_states0
 
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(CommercialAt, next_state0)
+        next_state0 = parser.call_single(DisjunctionCondition, next_state0)
+        return next_state0
+
 
 class ProductionSpecifiers(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {LeftParenthesis}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((LeftParenthesis, ProductionSpecifierList, RightParenthesis))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
@@ -109,8 +251,39 @@ class ProductionSpecifiers(TransmuterNonterminalType):
         next_states0 = parser.call(RightParenthesis, next_states0)
         return next_states0
 
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(LeftParenthesis, next_state0)
+        next_state0 = parser.call_single(ProductionSpecifierList, next_state0)
+        next_state0 = parser.call_single(RightParenthesis, next_state0)
+        return next_state0
+
 
 class SelectionExpression(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        first_terminal_tags = set()
+
+        if Conditions.lexical in conditions:
+            first_terminal_tags |= {OrdChar, QuotedChar, FullStop, BracketExpression}
+
+        if Conditions.syntactic in conditions:
+            first_terminal_tags |= {Identifier, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}
+
+        if Conditions.syntactic in conditions or Conditions.lexical in conditions:
+            first_terminal_tags.add(LeftParenthesis)
+
+        return first_terminal_tags
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((SequenceExpression, TransmuterIteration(TransmuterSequence((TransmuterSelection((VerticalLine, Solidus if Conditions.syntactic in conditions else None), True), SequenceExpression)), True)))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
@@ -119,243 +292,196 @@ class SelectionExpression(TransmuterNonterminalType):
         while True:  # begin iteration
             next_states1 = next_states0
 
-            try:
-                for _ in transmuter_selection:  # begin selection
-                    try:  # begin option 1
-                        next_states2 = next_states1
-                        next_states2 = parser.call(VerticalLine, next_states2)
-                    except TransmuterInternalError:
-                        pass
-                    else:
-                        next_states1 = next_states2
-                        break  # end option 1
+            for _ in transmuter_selection:  # begin selection
+                next_states2 = next_states1  # begin option 1
+                next_states2 = parser.call(VerticalLine, next_states2)
+
+                if len(next_states2) != 0:
+                    next_states1 = next_states2
+                    break  # end option 1
 
-                    if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
-                        next_states2 = next_states1
+                if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
+                    next_states2 = next_states1
+                    next_states2 = parser.call(Solidus, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end conditional option 2
 
-                        try:
-                            next_states2 = parser.call(Solidus, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end conditional option 2
+                next_states1 = set()  # end selection
 
-                    raise TransmuterInternalError()  # end selection
+            next_states1 = parser.call(SequenceExpression, next_states1)
 
-                next_states1 = parser.call(SequenceExpression, next_states1)
-            except TransmuterInternalError:
+            if len(next_states1) == 0:
                 break
 
             next_states0 = next_states1  # end iteration
 
         return next_states0
 
-
-class DisjunctionCondition(TransmuterNonterminalType):
     @classmethod
-    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
-        next_states0 = {current_state}
-        next_states0 = parser.call(ConjunctionCondition, next_states0)
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(SequenceExpression, next_state0)
 
         while True:  # begin iteration
-            next_states1 = next_states0
+            next_state1 = next_state0
+
+            for _ in transmuter_selection:  # begin selection
+                next_state2 = next_state1  # begin option 1
+                next_state2 = parser.call_single(VerticalLine, next_state2)
+
+                if next_state2 is not None:
+                    next_state1 = next_state2
+                    break  # end option 1
+
+                if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
+                    next_state2 = next_state1
+                    next_state2 = parser.call_single(Solidus, next_state2)
 
-            try:
-                next_states1 = parser.call(DoubleVerticalLine, next_states1)
-                next_states1 = parser.call(ConjunctionCondition, next_states1)
-            except TransmuterInternalError:
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end conditional option 2
+
+                next_state1 = None  # end selection
+
+            next_state1 = parser.call_single(SequenceExpression, next_state1)
+
+            if next_state1 is None:
                 break
 
-            next_states0 = next_states1  # end iteration
+            next_state0 = next_state1  # end iteration
 
-        return next_states0
+        return next_state0
 
 
-class ProductionSpecifierList(TransmuterNonterminalType):
+class DisjunctionCondition(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {ExclamationMark, Identifier, LeftParenthesis}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((ConjunctionCondition, TransmuterIteration(TransmuterSequence((DoubleVerticalLine, ConjunctionCondition)), True)))
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
-        next_states0 = parser.call(ProductionSpecifier, next_states0)
+        next_states0 = parser.call(ConjunctionCondition, next_states0)
 
         while True:  # begin iteration
             next_states1 = next_states0
+            next_states1 = parser.call(DoubleVerticalLine, next_states1)
+            next_states1 = parser.call(ConjunctionCondition, next_states1)
 
-            try:
-                next_states1 = parser.call(Comma, next_states1)
-                next_states1 = parser.call(ProductionSpecifier, next_states1)
-            except TransmuterInternalError:
+            if len(next_states1) == 0:
                 break
 
             next_states0 = next_states1  # end iteration
 
         return next_states0
 
-
-class SequenceExpression(TransmuterNonterminalType):
     @classmethod
-    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
-        next_states0 = {current_state}
-
-        for _ in transmuter_selection:  # begin selection
-            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
-                next_states1 = next_states0
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(ConjunctionCondition, next_state0)
 
-                try:
-                    next_states1 = parser.call(IterationExpression, next_states1)
-
-                    while True:  # begin iteration
-                        next_states2 = next_states1
+        while True:  # begin iteration
+            next_state1 = next_state0
+            next_state1 = parser.call_single(DoubleVerticalLine, next_state1)
+            next_state1 = parser.call_single(ConjunctionCondition, next_state1)
 
-                        try:
-                            next_states2 = parser.call(IterationExpression, next_states2)
-                        except TransmuterInternalError:
-                            break
+            if next_state1 is None:
+                break
 
-                        next_states1 = next_states2  # end iteration
-                except TransmuterInternalError:
-                    pass
-                else:
-                    next_states0 = next_states1
-                    break  # end conditional option 1
+            next_state0 = next_state1  # end iteration
 
-            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
-                next_states1 = next_states0
+        return next_state0
 
-                try:
-                    next_states1 = parser.call(PrimaryExpression, next_states1)
 
-                    while True:  # begin iteration
-                        next_states2 = next_states1
+class ProductionSpecifierList(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        first_terminal_tags = set()
 
-                        try:
-                            next_states2 = parser.call(PrimaryExpression, next_states2)
-                        except TransmuterInternalError:
-                            break
+        if Conditions.lexical in conditions:
+            first_terminal_tags |= {PlusSign, HyphenMinus, Ignore}
 
-                        next_states1 = next_states2  # end iteration
-                except TransmuterInternalError:
-                    pass
-                else:
-                    next_states0 = next_states1
-                    break  # end conditional option 2
+        if Conditions.syntactic in conditions:
+            first_terminal_tags |= {Start, Commit, Left, Right}
 
-            raise TransmuterInternalError()  # end selection
+        return first_terminal_tags
 
-        return next_states0
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
 
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((ProductionSpecifier, TransmuterIteration(TransmuterSequence((Comma, ProductionSpecifier)), True)))
 
-class ConjunctionCondition(TransmuterNonterminalType):
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
-        next_states0 = parser.call(NegationCondition, next_states0)
+        next_states0 = parser.call(ProductionSpecifier, next_states0)
 
         while True:  # begin iteration
             next_states1 = next_states0
+            next_states1 = parser.call(Comma, next_states1)
+            next_states1 = parser.call(ProductionSpecifier, next_states1)
 
-            try:
-                next_states1 = parser.call(DoubleAmpersand, next_states1)
-                next_states1 = parser.call(NegationCondition, next_states1)
-            except TransmuterInternalError:
+            if len(next_states1) == 0:
                 break
 
             next_states0 = next_states1  # end iteration
 
         return next_states0
 
-
-class ProductionSpecifier(TransmuterNonterminalType):
     @classmethod
-    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
-        next_states0 = {current_state}
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(ProductionSpecifier, next_state0)
 
-        for _ in transmuter_selection:  # begin selection
-            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
-                next_states1 = next_states0
+        while True:  # begin iteration
+            next_state1 = next_state0
+            next_state1 = parser.call_single(Comma, next_state1)
+            next_state1 = parser.call_single(ProductionSpecifier, next_state1)
 
-                try:
-                    for _ in transmuter_selection:  # begin selection
-                        try:  # begin option 1
-                            next_states2 = next_states1
-
-                            for _ in transmuter_selection:  # begin selection
-                                try:  # begin option 1
-                                    next_states3 = next_states2
-                                    next_states3 = parser.call(PlusSign, next_states3)
-                                except TransmuterInternalError:
-                                    pass
-                                else:
-                                    next_states2 = next_states3
-                                    break  # end option 1
-
-                                try:  # begin option 2
-                                    next_states3 = next_states2
-                                    next_states3 = parser.call(HyphenMinus, next_states3)
-                                except TransmuterInternalError:
-                                    pass
-                                else:
-                                    next_states2 = next_states3
-                                    break  # end option 2
-
-                                raise TransmuterInternalError()  # end selection
-
-                            next_states2 = parser.call(Identifier, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 1
+            if next_state1 is None:
+                break
 
-                        try:  # begin option 2
-                            next_states2 = next_states1
-                            next_states2 = parser.call(Ignore, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 2
+            next_state0 = next_state1  # end iteration
 
-                        raise TransmuterInternalError()  # end selection
-                except TransmuterInternalError:
-                    pass
-                else:
-                    next_states0 = next_states1
-                    break  # end conditional option 1
+        return next_state0
 
-            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
-                next_states1 = next_states0
 
-                try:
-                    next_states1 = parser.call(Start, next_states1)
-                except TransmuterInternalError:
-                    pass
-                else:
-                    next_states0 = next_states1
-                    break  # end conditional option 2
+class SequenceExpression(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        first_terminal_tags = set()
 
-            raise TransmuterInternalError()  # end selection
+        if Conditions.lexical in conditions:
+            first_terminal_tags |= {OrdChar, QuotedChar, FullStop, BracketExpression}
 
-        try:  # begin optional
-            next_states1 = next_states0
-            next_states1 = parser.call(Condition, next_states1)
-        except TransmuterInternalError:
-            pass
-        else:
-            next_states0 = next_states1  # end optional
+        if Conditions.syntactic in conditions:
+            first_terminal_tags |= {Identifier, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}
 
-        return next_states0
+        if Conditions.syntactic in conditions or Conditions.lexical in conditions:
+            first_terminal_tags.add(LeftParenthesis)
 
+        return first_terminal_tags
 
-class IterationExpression(TransmuterNonterminalType):
     @staticmethod
-    def first(conditions: TransmuterConditions) -> set[type[TransmuterNonterminalType]]:
-        first = set()
-
-        if Conditions.lexical in conditions:
-            first.add(PrimaryExpression)
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
 
-        return first
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSelection((TransmuterSequence((IterationExpression, TransmuterIteration(IterationExpression, True))) if Conditions.lexical in conditions else None, TransmuterSequence((PrimaryExpression, TransmuterIteration(PrimaryExpression, True))) if Conditions.syntactic in conditions else None), True)
 
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
@@ -364,318 +490,1000 @@ class IterationExpression(TransmuterNonterminalType):
         for _ in transmuter_selection:  # begin selection
             if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
                 next_states1 = next_states0
+                next_states1 = parser.call(IterationExpression, next_states1)
 
-                try:
-                    next_states1 = parser.call(PrimaryExpression, next_states1, cls)
-
-                    for _ in transmuter_selection:  # begin optional selection
-                        try:  # begin option 1
-                            next_states2 = next_states1
-                            next_states2 = parser.call(Asterisk, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 1
+                while True:  # begin iteration
+                    next_states2 = next_states1
+                    next_states2 = parser.call(IterationExpression, next_states2)
 
-                        try:  # begin option 2
-                            next_states2 = next_states1
-                            next_states2 = parser.call(PlusSign, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 2
+                    if len(next_states2) == 0:
+                        break
+
+                    next_states1 = next_states2  # end iteration
 
-                        try:  # begin option 3
-                            next_states2 = next_states1
-                            next_states2 = parser.call(QuestionMark, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 3
-
-                        try:  # begin option 4
-                            next_states2 = next_states1
-                            next_states2 = parser.call(ExpressionRange, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 4
-
-                        break  # end optional selection
-                except TransmuterInternalError:
-                    pass
-                else:
+                if len(next_states1) != 0:
                     next_states0 = next_states1
                     break  # end conditional option 1
 
             if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
                 next_states1 = next_states0
+                next_states1 = parser.call(PrimaryExpression, next_states1)
 
-                try:
-                    for _ in transmuter_selection:  # begin selection
-                        try:  # begin option 1
-                            next_states2 = next_states1
-                            next_states2 = parser.call(LeftCurlyBracket, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 1
+                while True:  # begin iteration
+                    next_states2 = next_states1
+                    next_states2 = parser.call(PrimaryExpression, next_states2)
 
-                        try:  # begin option 2
-                            next_states2 = next_states1
-                            next_states2 = parser.call(LeftCurlyBracketSolidus, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 2
+                    if len(next_states2) == 0:
+                        break
 
-                        raise TransmuterInternalError()  # end selection
+                    next_states1 = next_states2  # end iteration
 
-                    next_states1 = parser.call(SelectionExpression, next_states1)
-                    next_states1 = parser.call(RightCurlyBracket, next_states1)
-                except TransmuterInternalError:
-                    pass
-                else:
+                if len(next_states1) != 0:
                     next_states0 = next_states1
                     break  # end conditional option 2
 
-            raise TransmuterInternalError()  # end selection
+            next_states0 = set()  # end selection
 
         return next_states0
 
-
-class PrimaryExpression(TransmuterNonterminalType):
-    @staticmethod
-    def first(conditions: TransmuterConditions) -> set[type[TransmuterNonterminalType]]:
-        first = set()
-
-        if Conditions.syntactic in conditions:
-            first.add(IterationExpression)
-
-        return first
-
     @classmethod
-    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
-        next_states0 = {current_state}
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
 
         for _ in transmuter_selection:  # begin selection
             if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
-                next_states1 = next_states0
+                next_state1 = next_state0
+                next_state1 = parser.call_single(IterationExpression, next_state1)
 
-                try:
-                    for _ in transmuter_selection:  # begin selection
-                        try:  # begin option 1
-                            next_states2 = next_states1
-                            next_states2 = parser.call(OrdChar, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 1
+                while True:  # begin iteration
+                    next_state2 = next_state1
+                    next_state2 = parser.call_single(IterationExpression, next_state2)
 
-                        try:  # begin option 2
-                            next_states2 = next_states1
-                            next_states2 = parser.call(QuotedChar, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 2
+                    if next_state2 is None:
+                        break
 
-                        try:  # begin option 3
-                            next_states2 = next_states1
-                            next_states2 = parser.call(FullStop, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 3
-
-                        try:  # begin option 4
-                            next_states2 = next_states1
-                            next_states2 = parser.call(BracketExpression, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 4
-
-                        raise TransmuterInternalError()  # end selection
-                except TransmuterInternalError:
-                    pass
-                else:
-                    next_states0 = next_states1
+                    next_state1 = next_state2  # end iteration
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
                     break  # end conditional option 1
 
             if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
-                next_states1 = next_states0
-
-                try:
-                    next_states1 = parser.call(Identifier, next_states1)
-
-                    try:  # begin optional
-                        next_states2 = next_states1
-                        next_states2 = parser.call(Condition, next_states2)
-                    except TransmuterInternalError:
-                        pass
-                    else:
-                        next_states1 = next_states2  # end optional
-                except TransmuterInternalError:
-                    pass
-                else:
-                    next_states0 = next_states1
-                    break  # end conditional option 2
+                next_state1 = next_state0
+                next_state1 = parser.call_single(PrimaryExpression, next_state1)
 
-            try:  # begin option 3
-                next_states1 = next_states0
-                next_states1 = parser.call(LeftParenthesis, next_states1)
-                next_states1 = parser.call(SelectionExpression, next_states1)
-                next_states1 = parser.call(RightParenthesis, next_states1)
+                while True:  # begin iteration
+                    next_state2 = next_state1
+                    next_state2 = parser.call_single(PrimaryExpression, next_state2)
 
-                if Conditions.syntactic in parser.lexer.conditions:  # begin conditional optional
-                    next_states2 = next_states1
+                    if next_state2 is None:
+                        break
 
-                    try:
-                        next_states2 = parser.call(Condition, next_states2)
-                    except TransmuterInternalError:
-                        pass
-                    else:
-                        next_states1 = next_states2  # end conditional optional
-            except TransmuterInternalError:
-                pass
-            else:
-                next_states0 = next_states1
-                break  # end option 3
+                    next_state1 = next_state2  # end iteration
 
-            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 4
-                next_states1 = next_states0
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 2
 
-                try:
-                    for _ in transmuter_selection:  # begin selection
-                        try:  # begin option 1
-                            next_states2 = next_states1
-                            next_states2 = parser.call(OptionalExpression, next_states2)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 1
+            next_state0 = None  # end selection
 
-                        try:  # begin option 2
-                            next_states2 = next_states1
-                            next_states2 = parser.call(IterationExpression, next_states2, cls)
-                        except TransmuterInternalError:
-                            pass
-                        else:
-                            next_states1 = next_states2
-                            break  # end option 2
+        return next_state0
 
-                        raise TransmuterInternalError()  # end selection
-
-                    try:  # begin optional
-                        next_states2 = next_states1
-                        next_states2 = parser.call(Condition, next_states2)
-                    except TransmuterInternalError:
-                        pass
-                    else:
-                        next_states1 = next_states2  # end optional
-                except TransmuterInternalError:
-                    pass
-                else:
-                    next_states0 = next_states1
-                    break  # end conditional option 4
 
-            raise TransmuterInternalError()  # end selection
+class ConjunctionCondition(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {ExclamationMark, Identifier, LeftParenthesis}
 
-        return next_states0
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
 
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((NegationCondition, TransmuterIteration(TransmuterSequence((DoubleAmpersand, NegationCondition)), True)))
 
-class NegationCondition(TransmuterNonterminalType):
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
+        next_states0 = parser.call(NegationCondition, next_states0)
 
         while True:  # begin iteration
             next_states1 = next_states0
+            next_states1 = parser.call(DoubleAmpersand, next_states1)
+            next_states1 = parser.call(NegationCondition, next_states1)
 
-            try:
-                next_states1 = parser.call(ExclamationMark, next_states1)
-            except TransmuterInternalError:
+            if len(next_states1) == 0:
                 break
 
             next_states0 = next_states1  # end iteration
 
-        next_states0 = parser.call(PrimitiveCondition, next_states0)
         return next_states0
 
-
-class OptionalExpression(TransmuterNonterminalType):
     @classmethod
-    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
-        next_states0 = {current_state}
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+        next_state0 = parser.call_single(NegationCondition, next_state0)
 
-        for _ in transmuter_selection:  # begin selection
-            try:  # begin option 1
-                next_states1 = next_states0
-                next_states1 = parser.call(LeftSquareBracket, next_states1)
-            except TransmuterInternalError:
-                pass
-            else:
-                next_states0 = next_states1
-                break  # end option 1
+        while True:  # begin iteration
+            next_state1 = next_state0
+            next_state1 = parser.call_single(DoubleAmpersand, next_state1)
+            next_state1 = parser.call_single(NegationCondition, next_state1)
 
-            try:  # begin option 2
-                next_states1 = next_states0
-                next_states1 = parser.call(LeftSquareBracketSolidus, next_states1)
-            except TransmuterInternalError:
-                pass
-            else:
-                next_states0 = next_states1
-                break  # end option 2
+            if next_state1 is None:
+                break
 
-            raise TransmuterInternalError()  # end selection
+            next_state0 = next_state1  # end iteration
 
-        next_states0 = parser.call(SelectionExpression, next_states0)
-        next_states0 = parser.call(RightSquareBracket, next_states0)
-        return next_states0
+        return next_state0
 
 
-class PrimitiveCondition(TransmuterNonterminalType):
+class ProductionSpecifier(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        first_terminal_tags = set()
+
+        if Conditions.lexical in conditions:
+            first_terminal_tags |= {PlusSign, HyphenMinus, Ignore}
+
+        if Conditions.syntactic in conditions:
+            first_terminal_tags |= {Start, Commit, Left, Right}
+
+        return first_terminal_tags
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((TransmuterSelection((TransmuterSelection((TransmuterSequence((TransmuterSelection((PlusSign, HyphenMinus), True), Identifier)), Ignore), True) if Conditions.lexical in conditions else None, TransmuterSelection((Start, Commit, TransmuterSequence((TransmuterSelection((Left, Right), True), Identifier, TransmuterIteration(Identifier, True)))), True) if Conditions.syntactic in conditions else None), True), TransmuterOptional(Condition, True)))
+
+    @classmethod
+    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+
+        for _ in transmuter_selection:  # begin selection
+            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
+                next_states1 = next_states0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_states2 = next_states1  # begin option 1
+
+                    for _ in transmuter_selection:  # begin selection
+                        next_states3 = next_states2  # begin option 1
+                        next_states3 = parser.call(PlusSign, next_states3)
+
+                        if len(next_states3) != 0:
+                            next_states2 = next_states3
+                            break  # end option 1
+
+                        next_states3 = next_states2  # begin option 2
+                        next_states3 = parser.call(HyphenMinus, next_states3)
+
+                        if len(next_states3) != 0:
+                            next_states2 = next_states3
+                            break  # end option 2
+
+                        next_states2 = set()  # end selection
+
+                    next_states2 = parser.call(Identifier, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 1
+
+                    next_states2 = next_states1  # begin option 2
+                    next_states2 = parser.call(Ignore, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 2
+
+                    next_states1 = set()  # end selection
+
+                if len(next_states1) != 0:
+                    next_states0 = next_states1
+                    break  # end conditional option 1
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
+                next_states1 = next_states0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_states2 = next_states1  # begin option 1
+                    next_states2 = parser.call(Start, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 1
+
+                    next_states2 = next_states1  # begin option 2
+                    next_states2 = parser.call(Commit, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 2
+
+                    next_states2 = next_states1  # begin option 3
+
+                    for _ in transmuter_selection:  # begin selection
+                        next_states3 = next_states2  # begin option 1
+                        next_states3 = parser.call(Left, next_states3)
+
+                        if len(next_states3) != 0:
+                            next_states2 = next_states3
+                            break  # end option 1
+
+                        next_states3 = next_states2  # begin option 2
+                        next_states3 = parser.call(Right, next_states3)
+
+                        if len(next_states3) != 0:
+                            next_states2 = next_states3
+                            break  # end option 2
+
+                        next_states2 = set()  # end selection
+
+                    next_states2 = parser.call(Identifier, next_states2)
+
+                    while True:  # begin iteration
+                        next_states3 = next_states2
+                        next_states3 = parser.call(Identifier, next_states3)
+
+                        if len(next_states3) == 0:
+                            break
+
+                        next_states2 = next_states3  # end iteration
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 3
+
+                    next_states1 = set()  # end selection
+
+                if len(next_states1) != 0:
+                    next_states0 = next_states1
+                    break  # end conditional option 2
+
+            next_states0 = set()  # end selection
+
+        next_states1 = next_states0  # begin optional
+        next_states1 = parser.call(Condition, next_states1)
+
+        if len(next_states1) != 0:
+            next_states0 = next_states1  # end optional
+
+        return next_states0
+
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+
+        for _ in transmuter_selection:  # begin selection
+            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
+                next_state1 = next_state0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_state2 = next_state1  # begin option 1
+
+                    for _ in transmuter_selection:  # begin selection
+                        next_state3 = next_state2  # begin option 1
+                        next_state3 = parser.call_single(PlusSign, next_state3)
+
+                        if next_state3 is not None:
+                            next_state2 = next_state3
+                            break  # end option 1
+
+                        next_state3 = next_state2  # begin option 2
+                        next_state3 = parser.call_single(HyphenMinus, next_state3)
+
+                        if next_state3 is not None:
+                            next_state2 = next_state3
+                            break  # end option 2
+
+                        next_state2 = None  # end selection
+
+                    next_state2 = parser.call_single(Identifier, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 1
+
+                    next_state2 = next_state1  # begin option 2
+                    next_state2 = parser.call_single(Ignore, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 2
+
+                    next_state1 = None  # end selection
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 1
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
+                next_state1 = next_state0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_state2 = next_state1  # begin option 1
+                    next_state2 = parser.call_single(Start, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 1
+
+                    next_state2 = next_state1  # begin option 2
+                    next_state2 = parser.call_single(Commit, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 2
+
+                    next_state2 = next_state1  # begin option 3
+
+                    for _ in transmuter_selection:  # begin selection
+                        next_state3 = next_state2  # begin option 1
+                        next_state3 = parser.call_single(Left, next_state3)
+
+                        if next_state3 is not None:
+                            next_state2 = next_state3
+                            break  # end option 1
+
+                        next_state3 = next_state2  # begin option 2
+                        next_state3 = parser.call_single(Right, next_state3)
+
+                        if next_state3 is not None:
+                            next_state2 = next_state3
+                            break  # end option 2
+
+                        next_state2 = None  # end selection
+
+                    next_state2 = parser.call_single(Identifier, next_state2)
+
+                    while True:  # begin iteration
+                        next_state3 = next_state2
+                        next_state3 = parser.call_single(Identifier, next_state3)
+
+                        if next_state3 is None:
+                            break
+
+                        next_state2 = next_state3  # end iteration
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 3
+
+                    next_state1 = None  # end selection
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 2
+
+            next_state0 = None  # end selection
+
+        next_state1 = next_state0  # begin optional
+        next_state1 = parser.call_single(Condition, next_state1)
+
+        if next_state1 is not None:
+            next_state0 = next_state1  # end optional
+
+        return next_state0
+
+
+class IterationExpression(TransmuterNonterminalType):
+    @staticmethod
+    def first(conditions: TransmuterConditions) -> set[type[TransmuterNonterminalType]]:
+        first = set()
+
+        if Conditions.lexical in conditions:
+            first.add(PrimaryExpression)
+
+        return first
+
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        first_terminal_tags = set()
+
+        if Conditions.lexical in conditions:
+            first_terminal_tags |= {OrdChar, QuotedChar, FullStop, BracketExpression, LeftParenthesis}
+
+        if Conditions.syntactic in conditions and Conditions.lexical in conditions:
+            first_terminal_tags |= {Identifier, LeftSquareBracket, LeftSquareBracketSolidus}
+
+        if Conditions.syntactic in conditions:
+            first_terminal_tags |= {LeftCurlyBracket, LeftCurlyBracketSolidus}
+
+        return first_terminal_tags
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSelection((TransmuterSequence((PrimaryExpression, TransmuterOptional(TransmuterSelection((Asterisk, PlusSign, QuestionMark, ExpressionRange), True), True))) if Conditions.lexical in conditions else None, TransmuterSequence((TransmuterSelection((LeftCurlyBracket, LeftCurlyBracketSolidus), True), SelectionExpression, RightCurlyBracket)) if Conditions.syntactic in conditions else None), True)
+
     @classmethod
     def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
         next_states0 = {current_state}
 
         for _ in transmuter_selection:  # begin selection
-            try:  # begin option 1
+            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
+                next_states1 = next_states0
+                next_states1 = parser.call(PrimaryExpression, next_states1, cls)
+                next_states2 = next_states1  # begin optional
+
+                for _ in transmuter_selection:  # begin selection
+                    next_states3 = next_states2  # begin option 1
+                    next_states3 = parser.call(Asterisk, next_states3)
+
+                    if len(next_states3) != 0:
+                        next_states2 = next_states3
+                        break  # end option 1
+
+                    next_states3 = next_states2  # begin option 2
+                    next_states3 = parser.call(PlusSign, next_states3)
+
+                    if len(next_states3) != 0:
+                        next_states2 = next_states3
+                        break  # end option 2
+
+                    next_states3 = next_states2  # begin option 3
+                    next_states3 = parser.call(QuestionMark, next_states3)
+
+                    if len(next_states3) != 0:
+                        next_states2 = next_states3
+                        break  # end option 3
+
+                    next_states3 = next_states2  # begin option 4
+                    next_states3 = parser.call(ExpressionRange, next_states3)
+
+                    if len(next_states3) != 0:
+                        next_states2 = next_states3
+                        break  # end option 4
+
+                    next_states2 = set()  # end selection
+
+                if len(next_states2) != 0:
+                    next_states1 = next_states2  # end optional
+
+                if len(next_states1) != 0:
+                    next_states0 = next_states1
+                    break  # end conditional option 1
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
+                next_states1 = next_states0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_states2 = next_states1  # begin option 1
+                    next_states2 = parser.call(LeftCurlyBracket, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 1
+
+                    next_states2 = next_states1  # begin option 2
+                    next_states2 = parser.call(LeftCurlyBracketSolidus, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 2
+
+                    next_states1 = set()  # end selection
+
+                next_states1 = parser.call(SelectionExpression, next_states1)
+                next_states1 = parser.call(RightCurlyBracket, next_states1)
+
+                if len(next_states1) != 0:
+                    next_states0 = next_states1
+                    break  # end conditional option 2
+
+            next_states0 = set()  # end selection
+
+        return next_states0
+
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+
+        for _ in transmuter_selection:  # begin selection
+            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
+                next_state1 = next_state0
+                next_state1 = parser.call_single(PrimaryExpression, next_state1)
+                next_state2 = next_state1  # begin optional
+
+                for _ in transmuter_selection:  # begin selection
+                    next_state3 = next_state2  # begin option 1
+                    next_state3 = parser.call_single(Asterisk, next_state3)
+
+                    if next_state3 is not None:
+                        next_state2 = next_state3
+                        break  # end option 1
+
+                    next_state3 = next_state2  # begin option 2
+                    next_state3 = parser.call_single(PlusSign, next_state3)
+
+                    if next_state3 is not None:
+                        next_state2 = next_state3
+                        break  # end option 2
+
+                    next_state3 = next_state2  # begin option 3
+                    next_state3 = parser.call_single(QuestionMark, next_state3)
+
+                    if next_state3 is not None:
+                        next_state2 = next_state3
+                        break  # end option 3
+
+                    next_state3 = next_state2  # begin option 4
+                    next_state3 = parser.call_single(ExpressionRange, next_state3)
+
+                    if next_state3 is not None:
+                        next_state2 = next_state3
+                        break  # end option 4
+
+                    next_state2 = None  # end selection
+
+                if next_state2 is not None:
+                    next_state1 = next_state2  # end optional
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 1
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
+                next_state1 = next_state0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_state2 = next_state1  # begin option 1
+                    next_state2 = parser.call_single(LeftCurlyBracket, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 1
+
+                    next_state2 = next_state1  # begin option 2
+                    next_state2 = parser.call_single(LeftCurlyBracketSolidus, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 2
+
+                    next_state1 = None  # end selection
+
+                next_state1 = parser.call_single(SelectionExpression, next_state1)
+                next_state1 = parser.call_single(RightCurlyBracket, next_state1)
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 2
+
+            next_state0 = None  # end selection
+
+        return next_state0
+
+
+class PrimaryExpression(TransmuterNonterminalType):
+    @staticmethod
+    def first(conditions: TransmuterConditions) -> set[type[TransmuterNonterminalType]]:
+        first = set()
+
+        if Conditions.syntactic in conditions:
+            first.add(IterationExpression)
+
+        return first
+
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        first_terminal_tags = {LeftParenthesis}
+
+        if Conditions.lexical in conditions:
+            first_terminal_tags |= {OrdChar, QuotedChar, FullStop, BracketExpression}
+
+        if Conditions.syntactic in conditions:
+            first_terminal_tags |= {Identifier, LeftSquareBracket, LeftSquareBracketSolidus, LeftCurlyBracket, LeftCurlyBracketSolidus}
+
+        return first_terminal_tags
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSelection((TransmuterSelection((OrdChar, QuotedChar, FullStop, BracketExpression), True) if Conditions.lexical in conditions else None, TransmuterSequence((Identifier, TransmuterOptional(Condition, True))) if Conditions.syntactic in conditions else None, TransmuterSequence((LeftParenthesis, SelectionExpression, RightParenthesis, TransmuterOptional(Condition, True) if Conditions.syntactic in conditions else None)), TransmuterSequence((TransmuterSelection((OptionalExpression, IterationExpression), True), TransmuterOptional(Condition, True))) if Conditions.syntactic in conditions else None), True)
+
+    @classmethod
+    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+
+        for _ in transmuter_selection:  # begin selection
+            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
+                next_states1 = next_states0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_states2 = next_states1  # begin option 1
+                    next_states2 = parser.call(OrdChar, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 1
+
+                    next_states2 = next_states1  # begin option 2
+                    next_states2 = parser.call(QuotedChar, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 2
+
+                    next_states2 = next_states1  # begin option 3
+                    next_states2 = parser.call(FullStop, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 3
+
+                    next_states2 = next_states1  # begin option 4
+                    next_states2 = parser.call(BracketExpression, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 4
+
+                    next_states1 = set()  # end selection
+
+                if len(next_states1) != 0:
+                    next_states0 = next_states1
+                    break  # end conditional option 1
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
                 next_states1 = next_states0
                 next_states1 = parser.call(Identifier, next_states1)
-            except TransmuterInternalError:
-                pass
-            else:
+                next_states2 = next_states1  # begin optional
+                next_states2 = parser.call(Condition, next_states2)
+
+                if len(next_states2) != 0:
+                    next_states1 = next_states2  # end optional
+
+                if len(next_states1) != 0:
+                    next_states0 = next_states1
+                    break  # end conditional option 2
+
+            next_states1 = next_states0  # begin option 3
+            next_states1 = parser.call(LeftParenthesis, next_states1)
+            next_states1 = parser.call(SelectionExpression, next_states1)
+            next_states1 = parser.call(RightParenthesis, next_states1)
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional optional
+                next_states2 = next_states1
+                next_states2 = parser.call(Condition, next_states2)
+
+                if len(next_states2) != 0:
+                    next_states1 = next_states2  # end conditional optional
+
+            if len(next_states1) != 0:
                 next_states0 = next_states1
-                break  # end option 1
+                break  # end option 3
 
-            try:  # begin option 2
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 4
                 next_states1 = next_states0
-                next_states1 = parser.call(LeftParenthesis, next_states1)
-                next_states1 = parser.call(DisjunctionCondition, next_states1)
-                next_states1 = parser.call(RightParenthesis, next_states1)
-            except TransmuterInternalError:
-                pass
-            else:
+
+                for _ in transmuter_selection:  # begin selection
+                    next_states2 = next_states1  # begin option 1
+                    next_states2 = parser.call(OptionalExpression, next_states2)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 1
+
+                    next_states2 = next_states1  # begin option 2
+                    next_states2 = parser.call(IterationExpression, next_states2, cls)
+
+                    if len(next_states2) != 0:
+                        next_states1 = next_states2
+                        break  # end option 2
+
+                    next_states1 = set()  # end selection
+
+                next_states2 = next_states1  # begin optional
+                next_states2 = parser.call(Condition, next_states2)
+
+                if len(next_states2) != 0:
+                    next_states1 = next_states2  # end optional
+
+                if len(next_states1) != 0:
+                    next_states0 = next_states1
+                    break  # end conditional option 4
+
+            next_states0 = set()  # end selection
+
+        return next_states0
+
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+
+        for _ in transmuter_selection:  # begin selection
+            if Conditions.lexical in parser.lexer.conditions:  # begin conditional option 1
+                next_state1 = next_state0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_state2 = next_state1  # begin option 1
+                    next_state2 = parser.call_single(OrdChar, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 1
+
+                    next_state2 = next_state1  # begin option 2
+                    next_state2 = parser.call_single(QuotedChar, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 2
+
+                    next_state2 = next_state1  # begin option 3
+                    next_state2 = parser.call_single(FullStop, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 3
+
+                    next_state2 = next_state1  # begin option 4
+                    next_state2 = parser.call_single(BracketExpression, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 4
+
+                    next_state1 = None  # end selection
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 1
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 2
+                next_state1 = next_state0
+                next_state1 = parser.call_single(Identifier, next_state1)
+                next_state2 = next_state1  # begin optional
+                next_state2 = parser.call_single(Condition, next_state2)
+
+                if next_state2 is not None:
+                    next_state1 = next_state2  # end optional
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 2
+
+            next_state1 = next_state0  # begin option 3
+            next_state1 = parser.call_single(LeftParenthesis, next_state1)
+            next_state1 = parser.call_single(SelectionExpression, next_state1)
+            next_state1 = parser.call_single(RightParenthesis, next_state1)
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional optional
+                next_state2 = next_state1
+                next_state2 = parser.call_single(Condition, next_state2)
+
+                if next_state2 is not None:
+                    next_state1 = next_state2  # end conditional optional
+
+            if next_state1 is not None:
+                next_state0 = next_state1
+                break  # end option 3
+
+            if Conditions.syntactic in parser.lexer.conditions:  # begin conditional option 4
+                next_state1 = next_state0
+
+                for _ in transmuter_selection:  # begin selection
+                    next_state2 = next_state1  # begin option 1
+                    next_state2 = parser.call_single(OptionalExpression, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 1
+
+                    next_state2 = next_state1  # begin option 2
+                    next_state2 = parser.call_single(IterationExpression, next_state2)
+
+                    if next_state2 is not None:
+                        next_state1 = next_state2
+                        break  # end option 2
+
+                    next_state1 = None  # end selection
+
+                next_state2 = next_state1  # begin optional
+                next_state2 = parser.call_single(Condition, next_state2)
+
+                if next_state2 is not None:
+                    next_state1 = next_state2  # end optional
+
+                if next_state1 is not None:
+                    next_state0 = next_state1
+                    break  # end conditional option 4
+
+            next_state0 = None  # end selection
+
+        return next_state0
+
+
+class NegationCondition(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {ExclamationMark, Identifier, LeftParenthesis}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((TransmuterIteration(ExclamationMark, True), PrimitiveCondition))
+
+    @classmethod
+    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+
+        while True:  # begin iteration
+            next_states1 = next_states0
+            next_states1 = parser.call(ExclamationMark, next_states1)
+
+            if len(next_states1) == 0:
+                break
+
+            next_states0 = next_states1  # end iteration
+
+        next_states0 = parser.call(PrimitiveCondition, next_states0)
+        return next_states0
+
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+
+        while True:  # begin iteration
+            next_state1 = next_state0
+            next_state1 = parser.call_single(ExclamationMark, next_state1)
+
+            if next_state1 is None:
+                break
+
+            next_state0 = next_state1  # end iteration
+
+        next_state0 = parser.call_single(PrimitiveCondition, next_state0)
+        return next_state0
+
+
+class OptionalExpression(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {LeftSquareBracket, LeftSquareBracketSolidus}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return Conditions.syntactic not in conditions or Conditions.lexical not in conditions
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSequence((TransmuterSelection((LeftSquareBracket, LeftSquareBracketSolidus), True), SelectionExpression, RightSquareBracket))
+
+    @classmethod
+    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+
+        for _ in transmuter_selection:  # begin selection
+            next_states1 = next_states0  # begin option 1
+            next_states1 = parser.call(LeftSquareBracket, next_states1)
+
+            if len(next_states1) != 0:
+                next_states0 = next_states1
+                break  # end option 1
+
+            next_states1 = next_states0  # begin option 2
+            next_states1 = parser.call(LeftSquareBracketSolidus, next_states1)
+
+            if len(next_states1) != 0:
                 next_states0 = next_states1
                 break  # end option 2
 
-            raise TransmuterInternalError()  # end selection
+            next_states0 = set()  # end selection
 
+        next_states0 = parser.call(SelectionExpression, next_states0)
+        next_states0 = parser.call(RightSquareBracket, next_states0)
         return next_states0
 
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+
+        for _ in transmuter_selection:  # begin selection
+            next_state1 = next_state0  # begin option 1
+            next_state1 = parser.call_single(LeftSquareBracket, next_state1)
+
+            if next_state1 is not None:
+                next_state0 = next_state1
+                break  # end option 1
+
+            next_state1 = next_state0  # begin option 2
+            next_state1 = parser.call_single(LeftSquareBracketSolidus, next_state1)
+
+            if next_state1 is not None:
+                next_state0 = next_state1
+                break  # end option 2
+
+            next_state0 = None  # end selection
+
+        next_state0 = parser.call_single(SelectionExpression, next_state0)
+        next_state0 = parser.call_single(RightSquareBracket, next_state0)
+        return next_state0
+
+
+class PrimitiveCondition(TransmuterNonterminalType):
+    @staticmethod
+    def first_terminal_tags(conditions: TransmuterConditions) -> set[type[TransmuterTerminalTag]]:
+        return {Identifier, LeftParenthesis}
+
+    @staticmethod
+    def deterministic(conditions: TransmuterConditions) -> bool:
+        return True
+
+    @staticmethod
+    def expression(conditions: TransmuterConditions) -> TransmuterExpression:
+        return TransmuterSelection((Identifier, TransmuterSequence((LeftParenthesis, DisjunctionCondition, RightParenthesis))), True)
+
+    @classmethod
+    def descend(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> set[TransmuterParsingState]:
+        next_states0 = {current_state}
+
+        for _ in transmuter_selection:  # begin selection
+            next_states1 = next_states0  # begin option 1
+            next_states1 = parser.call(Identifier, next_states1)
+
+            if len(next_states1) != 0:
+                next_states0 = next_states1
+                break  # end option 1
+
+            next_states1 = next_states0  # begin option 2
+            next_states1 = parser.call(LeftParenthesis, next_states1)
+            next_states1 = parser.call(DisjunctionCondition, next_states1)
+            next_states1 = parser.call(RightParenthesis, next_states1)
+
+            if len(next_states1) != 0:
+                next_states0 = next_states1
+                break  # end option 2
+
+            next_states0 = set()  # end selection
+
+        return next_states0
+
+    @classmethod
+    def descend_single(cls, parser: TransmuterParser, current_state: TransmuterParsingState) -> TransmuterParsingState | None:
+        next_state0 = current_state
+
+        for _ in transmuter_selection:  # begin selection
+            next_state1 = next_state0  # begin option 1
+            next_state1 = parser.call_single(Identifier, next_state1)
+
+            if next_state1 is not None:
+                next_state0 = next_state1
+                break  # end option 1
+
+            next_state1 = next_state0  # begin option 2
+            next_state1 = parser.call_single(LeftParenthesis, next_state1)
+            next_state1 = parser.call_single(DisjunctionCondition, next_state1)
+            next_state1 = parser.call_single(RightParenthesis, next_state1)
+
+            if next_state1 is not None:
+                next_state0 = next_state1
+                break  # end option 2
+
+            next_state0 = None  # end selection
+
+        return next_state0
+
 
 class Parser(TransmuterParser):
     NONTERMINAL_TYPES = [Grammar, Production, ProductionHeader, ProductionBody, Condition, ProductionSpecifiers, SelectionExpression, DisjunctionCondition, ProductionSpecifierList, SequenceExpression, ConjunctionCondition, ProductionSpecifier, IterationExpression, PrimaryExpression, NegationCondition, OptionalExpression, PrimitiveCondition]
+    TABLES = {
+        Conditions(0): TransmuterParserTables(Grammar, MappingProxyType({}), MappingProxyType({Grammar: frozenset({Identifier}), Production: frozenset({Identifier}), ProductionHeader: frozenset({Identifier}), ProductionBody: frozenset(), Condition: frozenset({CommercialAt}), ProductionSpecifiers: frozenset({LeftParenthesis}), SelectionExpression: frozenset(), DisjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifierList: frozenset(), SequenceExpression: frozenset(), ConjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifier: frozenset(), IterationExpression: frozenset(), PrimaryExpression: frozenset({LeftParenthesis}), NegationCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), OptionalExpression: frozenset({LeftSquareBracket, LeftSquareBracketSolidus}), PrimitiveCondition: frozenset({Identifier, LeftParenthesis})}), frozenset({Grammar, Production, ProductionHeader, ProductionBody, Condition, ProductionSpecifiers, SelectionExpression, DisjunctionCondition, ProductionSpecifierList, SequenceExpression, ConjunctionCondition, ProductionSpecifier, IterationExpression, PrimaryExpression, NegationCondition, OptionalExpression, PrimitiveCondition}), MappingProxyType({}), MappingProxyType({}), frozenset({Production}), MappingProxyType({})),
+        Conditions.syntactic: TransmuterParserTables(Grammar, MappingProxyType({}), MappingProxyType({Grammar: frozenset({Identifier}), Production: frozenset({Identifier}), ProductionHeader: frozenset({Identifier}), ProductionBody: frozenset({Identifier, LeftParenthesis, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}), Condition: frozenset({CommercialAt}), ProductionSpecifiers: frozenset({LeftParenthesis}), SelectionExpression: frozenset({Identifier, LeftParenthesis, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}), DisjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifierList: frozenset({Start, Commit, Left, Right}), SequenceExpression: frozenset({Identifier, LeftParenthesis, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}), ConjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifier: frozenset({Start, Commit, Left, Right}), IterationExpression: frozenset({LeftCurlyBracket, LeftCurlyBracketSolidus}), PrimaryExpression: frozenset({Identifier, LeftParenthesis, LeftSquareBracket, LeftSquareBracketSolidus, LeftCurlyBracket, LeftCurlyBracketSolidus}), NegationCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), OptionalExpression: frozenset({LeftSquareBracket, LeftSquareBracketSolidus}), PrimitiveCondition: frozenset({Identifier, LeftParenthesis})}), frozenset({Grammar, Production, ProductionHeader, ProductionBody, Condition, ProductionSpecifiers, SelectionExpression, DisjunctionCondition, ProductionSpecifierList, SequenceExpression, ConjunctionCondition, ProductionSpecifier, IterationExpression, PrimaryExpression, NegationCondition, OptionalExpression, PrimitiveCondition}), MappingProxyType({}), MappingProxyType({}), frozenset({Production}), MappingProxyType({})),
+        Conditions.lexical: TransmuterParserTables(Grammar, MappingProxyType({}), MappingProxyType({Grammar: frozenset({Identifier}), Production: frozenset({Identifier}), ProductionHeader: frozenset({Identifier}), ProductionBody: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, LeftParenthesis}), Condition: frozenset({CommercialAt}), ProductionSpecifiers: frozenset({LeftParenthesis}), SelectionExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, LeftParenthesis}), DisjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifierList: frozenset({PlusSign, HyphenMinus, Ignore}), SequenceExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, LeftParenthesis}), ConjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifier: frozenset({PlusSign, HyphenMinus, Ignore}), IterationExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, LeftParenthesis}), PrimaryExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, LeftParenthesis}), NegationCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), OptionalExpression: frozenset({LeftSquareBracket, LeftSquareBracketSolidus}), PrimitiveCondition: frozenset({Identifier, LeftParenthesis})}), frozenset({Grammar, Production, ProductionHeader, ProductionBody, Condition, ProductionSpecifiers, SelectionExpression, DisjunctionCondition, ProductionSpecifierList, SequenceExpression, ConjunctionCondition, ProductionSpecifier, IterationExpression, PrimaryExpression, NegationCondition, OptionalExpression, PrimitiveCondition}), MappingProxyType({}), MappingProxyType({}), frozenset({Production}), MappingProxyType({})),
+        Conditions.syntactic | Conditions.lexical: TransmuterParserTables(Grammar, MappingProxyType({IterationExpression: frozenset({PrimaryExpression}), PrimaryExpression: frozenset({IterationExpression})}), MappingProxyType({Grammar: frozenset({Identifier}), Production: frozenset({Identifier}), ProductionHeader: frozenset({Identifier}), ProductionBody: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, Identifier, LeftParenthesis, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}), Condition: frozenset({CommercialAt}), ProductionSpecifiers: frozenset({LeftParenthesis}), SelectionExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, Identifier, LeftParenthesis, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}), DisjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifierList: frozenset({PlusSign, HyphenMinus, Ignore, Start, Commit, Left, Right}), SequenceExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, Identifier, LeftParenthesis, LeftCurlyBracket, LeftCurlyBracketSolidus, LeftSquareBracket, LeftSquareBracketSolidus}), ConjunctionCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), ProductionSpecifier: frozenset({PlusSign, HyphenMinus, Ignore, Start, Commit, Left, Right}), IterationExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, Identifier, LeftParenthesis, LeftSquareBracket, LeftSquareBracketSolidus, LeftCurlyBracket, LeftCurlyBracketSolidus}), PrimaryExpression: frozenset({OrdChar, QuotedChar, FullStop, BracketExpression, Identifier, LeftParenthesis, LeftSquareBracket, LeftSquareBracketSolidus, LeftCurlyBracket, LeftCurlyBracketSolidus}), NegationCondition: frozenset({ExclamationMark, Identifier, LeftParenthesis}), OptionalExpression: frozenset({LeftSquareBracket, LeftSquareBracketSolidus}), PrimitiveCondition: frozenset({Identifier, LeftParenthesis})}), frozenset({ProductionHeader, Condition, ProductionSpecifiers, DisjunctionCondition, ProductionSpecifierList, ConjunctionCondition, ProductionSpecifier, NegationCondition, PrimitiveCondition}), MappingProxyType({IterationExpression: frozenset({IterationExpression, PrimaryExpression}), PrimaryExpression: frozenset({IterationExpression, PrimaryExpression})}), MappingProxyType({IterationExpression: (PrimaryExpression,), PrimaryExpression: (IterationExpression,)}), frozenset({Production}), MappingProxyType({})),
+    }